@@ -5,8 +5,12 @@
 echo "---- RUNNING release tasks (.profile) ------"
 echo "---- Apply Migrations ------"
 python manage.py migrate
-echo "---- Flush Metadata Cache ------"
-python manage.py clear_metadata_cache
+echo "---- Prewarm Metadata Cache ------"
+python manage.py prewarm_metadata_cache
+if [ -n "${COMMODITY_INDEX_API_TOKEN}" ]; then
+    echo "---- Prewarm Commodity Index ------"
+    python manage.py prewarm_commodity_index
+fi
 echo "---- Clear expired user sessions ------"
 python manage.py clearsessions
 echo "---- Collect Static Files ------"
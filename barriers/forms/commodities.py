@@ -46,8 +46,7 @@ class CommodityLookupForm(forms.Form):
 
         client = MarketAccessAPIClient(self.token)
         try:
-            hs6_code = code[:6].ljust(10, "0")
-            commodity = client.commodities.get(id=hs6_code)
+            commodity = client.commodities.lookup(code)
             self.commodity = commodity.create_barrier_commodity(
                 code=code, location=location
             )
@@ -93,7 +92,7 @@ class MultiCommodityLookupForm(forms.Form):
         try:
             commodity_lookup = {
                 commodity.code: commodity
-                for commodity in client.commodities.list(codes=",".join(hs6_codes))
+                for commodity in client.commodities.lookup_many(hs6_codes)
             }
         except APIHttpException:
             raise forms.ValidationError("Enter a real HS commodity code")
@@ -1,9 +1,14 @@
 import logging
+import tempfile
 import uuid
 
 import requests
+from django.conf import settings
+from django.core.files import File
 
+from utils.concurrency import run_in_background
 from utils.exceptions import FileUploadError, ScanError
+from utils.forms import RestrictedFileField
 
 logger = logging.getLogger(__name__)
 
@@ -37,12 +42,60 @@ class DocumentMixin:
     3. Calls the API confirming that the file has been uploaded.
     4. Polls the API until the virus scan is complete, raising an exception
        if it fails the check.
+
+    With upload_in_background only step 1 happens during the request. The
+    rest runs as a background job which records its progress for the
+    browser to poll.
     """
 
     def __init__(self, *args, **kwargs):
         self.token = kwargs.pop("token")
+        self.upload_in_background = kwargs.pop("upload_in_background", False)
+        self.background_upload_ids = kwargs.pop("background_upload_ids", ())
         super().__init__(*args, **kwargs)
 
+    def clean(self):
+        cleaned_data = super().clean()
+        self.validate_document_uploads()
+        return cleaned_data
+
+    def validate_document_uploads(self):
+        """
+        Rejects documents whose background upload hasn't finished or failed.
+
+        Documents uploaded during a request have no upload status. Documents
+        uploaded in the background whose status has expired are rejected, as
+        there is no way to tell whether they finished.
+        """
+        # to avoid circular imports
+        from utils.api.client import MarketAccessAPIClient
+
+        documents = MarketAccessAPIClient(self.token).documents
+        for field_name, field in self.fields.items():
+            if not isinstance(field, RestrictedFileField):
+                continue
+            document_id_field_name = self.get_document_id_field_name(field_name)
+            document_ids = self.cleaned_data.get(document_id_field_name) or []
+            if isinstance(document_ids, str):
+                document_ids = [document_ids]
+
+            for document_id in document_ids:
+                upload_status = documents.get_upload_status(str(document_id))
+                if upload_status is None:
+                    if str(document_id) in self.background_upload_ids:
+                        self.add_error(
+                            field_name,
+                            "The selected file could not be uploaded. Try again.",
+                        )
+                elif upload_status["status"] == documents.UPLOAD_PENDING:
+                    self.add_error(
+                        field_name,
+                        "The selected file is still being uploaded. "
+                        "Wait for it to finish and try again.",
+                    )
+                elif upload_status["status"] == documents.UPLOAD_FAILED:
+                    self.add_error(field_name, upload_status["message"])
+
     def validate_document(self, field_name="document"):
         """
         Only uploads files when javascript is disabled
@@ -85,25 +138,74 @@ class DocumentMixin:
         )
         document_id = data["id"]
 
-        self.upload_to_s3(url=data["signed_upload_url"], document=document)
-
-        client.documents.complete_upload(document_id)
-        client.documents.check_scan_status(document_id)
+        if self.upload_in_background:
+            self.start_background_upload(
+                client,
+                document_id=document_id,
+                url=data["signed_upload_url"],
+                document=document,
+            )
+            pending = True
+        else:
+            self.upload_to_s3(url=data["signed_upload_url"], document=document)
+            client.documents.complete_upload(document_id)
+            client.documents.check_scan_status(document_id)
+            pending = False
 
         return {
             "id": document_id,
+            "pending": pending,
             "file": {
                 "name": document.name,
                 "size": document.size,
             },
         }
 
+    def start_background_upload(self, client, document_id, url, document):
+        # The uploaded file is deleted at the end of the request, so keep a
+        # copy which is only held in memory if it is small
+        content = File(
+            tempfile.SpooledTemporaryFile(max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE)
+        )
+        for chunk in document.chunks():
+            content.write(chunk)
+        client.documents.set_upload_status(document_id, client.documents.UPLOAD_PENDING)
+
+        def finish_upload():
+            try:
+                self.upload_to_s3(url=url, document=content)
+                # Restart the pending timeout for the virus scan
+                client.documents.set_upload_status(
+                    document_id, client.documents.UPLOAD_PENDING
+                )
+                client.documents.complete_upload(document_id)
+                client.documents.check_scan_status(document_id)
+            except (FileUploadError, ScanError) as e:
+                status, message = client.documents.UPLOAD_FAILED, str(e)
+            except Exception:
+                logger.exception(f"Background upload of document {document_id} failed")
+                status, message = (
+                    client.documents.UPLOAD_FAILED,
+                    "A system error has occured, so the file has not been "
+                    "uploaded. Try again.",
+                )
+            else:
+                status, message = client.documents.UPLOAD_CLEAN, ""
+            finally:
+                content.close()
+            client.documents.set_upload_status(document_id, status, message)
+
+        run_in_background(finish_upload)
+
     def upload_to_s3(self, url, document):
         document.seek(0)
+        # Passing the file streams it from disk in blocks, rather than
+        # reading it into memory first
         response = requests.put(
             url,
             headers={
                 "x-amz-server-side-encryption": "AES256",
+                "Content-Length": str(document.size),
             },
             data=document,
         )
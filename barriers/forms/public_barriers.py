@@ -276,15 +276,15 @@ class PublicBarrierSearchForm(forms.Form):
         self.set_region_choices()
 
     def set_organisation_choices(self):
-        self.fields["organisation"].choices = (
-            self.metadata.get_gov_organisation_choices()
+        self.fields["organisation"].choices = self.metadata.get_choices(
+            "gov_organisations"
         )
 
     def set_sector_choices(self):
-        self.fields["sector"].choices = self.metadata.get_sector_choices(level=0)
+        self.fields["sector"].choices = self.metadata.get_choices("sectors")
 
     def set_country_choices(self):
-        self.fields["country"].choices = self.metadata.get_country_choices()
+        self.fields["country"].choices = self.metadata.get_choices("countries")
 
     def set_status_choices(self):
         self.fields["status"].choices = PUBLIC_BARRIER_STATUSES + (
@@ -292,7 +292,7 @@ class PublicBarrierSearchForm(forms.Form):
         )
 
     def set_region_choices(self):
-        self.fields["region"].choices = self.metadata.get_overseas_region_choices()
+        self.fields["region"].choices = self.metadata.get_choices("overseas_regions")
 
     def get_data_from_querydict(self, data):
         """
@@ -15,10 +15,96 @@ from barriers.constants import (
 )
 from utils.forms.fields import MonthDateRangeField
 from utils.helpers import format_dict_for_url_querystring
+from utils.metadata import register_choices
 
 logger = logging.getLogger(__name__)
 
 
+@register_choices("search_locations")
+def search_location_choices(metadata):
+    return metadata.get_choices("trading_blocs") + metadata.get_choices("countries")
+
+
+@register_choices("search_extra_locations")
+def search_extra_location_choices(metadata):
+    trading_bloc_labels = {
+        "TB00003": "Include ASEAN-wide barriers",
+        "TB00016": "Include EU-wide barriers",
+        "TB00026": "Include Mercosur-wide barriers",
+        "TB00013": "Include EAEU-wide barriers",
+        "TB00017": "Include GCC-wide barriers",
+    }
+    return (
+        (
+            trading_bloc["code"],
+            trading_bloc_labels.get(trading_bloc["code"], trading_bloc["name"]),
+        )
+        for trading_bloc in metadata.get_trading_bloc_list()
+    )
+
+
+@register_choices("search_country_trading_blocs")
+def search_country_trading_bloc_choices(metadata):
+    trading_bloc_labels = {
+        "TB00003": "Include country specific implementations of ASEAN regulations",
+        "TB00016": "Include country specific implementations of EU regulations",
+        "TB00026": "Include country specific implementations of Mercosur regulations",
+        "TB00013": "Include country specific implementations of EAEU regulations",
+        "TB00017": "Include country specific implementations of GCC regulations",
+    }
+    return (
+        (
+            trading_bloc["code"],
+            trading_bloc_labels.get(trading_bloc["code"], trading_bloc["name"]),
+        )
+        for trading_bloc in metadata.get_trading_bloc_list()
+    )
+
+
+@register_choices("search_policy_teams")
+def search_policy_team_choices(metadata):
+    return (
+        (str(policy_team["id"]), policy_team["title"])
+        for policy_team in metadata.data["policy_teams"]
+    )
+
+
+@register_choices("search_statuses")
+def search_status_choices(metadata):
+    status_ids = ("2", "3", "4", "5")
+    return sorted(
+        (
+            (id, value)
+            for id, value in metadata.data["barrier_status"].items()
+            if id in status_ids
+        ),
+        key=itemgetter(0),
+    )
+
+
+@register_choices("search_tags")
+def search_tag_choices(metadata):
+    return (
+        (str(tag["id"]), tag["title"])
+        for tag in metadata.get_barrier_tag_choices("search")
+        if tag["title"] not in DEPRECATED_TAGS
+    )
+
+
+@register_choices("search_ordering")
+def search_ordering_choices(metadata):
+    return metadata.get_search_ordering_choices()
+
+
+@register_choices("search_ordering_without_relevance")
+def search_ordering_without_relevance_choices(metadata):
+    return (
+        choice
+        for choice in metadata.get_choices("search_ordering")
+        if choice[0] != "relevance"
+    )
+
+
 class BarrierSearchForm(forms.Form):
     search_id = forms.UUIDField(required=False, widget=forms.HiddenInput())
     search = forms.CharField(
@@ -269,106 +355,53 @@ class BarrierSearchForm(forms.Form):
         self.index_filter_groups()
 
     def set_country_choices(self):
-        location_choices = [
-            (trading_bloc["code"], trading_bloc["name"])
-            for trading_bloc in self.metadata.get_trading_bloc_list()
-        ] + [
-            (country["id"], country["name"])
-            for country in self.metadata.get_country_list()
-        ]
-        self.fields["country"].choices = location_choices
+        self.fields["country"].choices = self.metadata.get_choices("search_locations")
 
     def set_extra_location_choices(self):
-        trading_bloc_labels = {
-            "TB00003": "Include ASEAN-wide barriers",
-            "TB00016": "Include EU-wide barriers",
-            "TB00026": "Include Mercosur-wide barriers",
-            "TB00013": "Include EAEU-wide barriers",
-            "TB00017": "Include GCC-wide barriers",
-        }
-        self.fields["extra_location"].choices = [
-            (
-                trading_bloc["code"],
-                trading_bloc_labels.get(trading_bloc["code"], trading_bloc["name"]),
-            )
-            for trading_bloc in self.metadata.get_trading_bloc_list()
-        ]
+        self.fields["extra_location"].choices = self.metadata.get_choices(
+            "search_extra_locations"
+        )
 
     def set_country_trading_bloc_choices(self):
-        trading_bloc_labels = {
-            "TB00003": "Include country specific implementations of ASEAN regulations",
-            "TB00016": "Include country specific implementations of EU regulations",
-            "TB00026": (
-                "Include country specific implementations of Mercosur regulations"
-            ),
-            "TB00013": "Include country specific implementations of EAEU regulations",
-            "TB00017": "Include country specific implementations of GCC regulations",
-        }
-        self.fields["country_trading_bloc"].choices = [
-            (
-                trading_bloc["code"],
-                trading_bloc_labels.get(trading_bloc["code"], trading_bloc["name"]),
-            )
-            for trading_bloc in self.metadata.get_trading_bloc_list()
-        ]
+        self.fields["country_trading_bloc"].choices = self.metadata.get_choices(
+            "search_country_trading_blocs"
+        )
 
     def set_trade_direction_choices(self):
-        self.fields["trade_direction"].choices = (
-            self.metadata.get_trade_direction_choices()
+        self.fields["trade_direction"].choices = self.metadata.get_choices(
+            "trade_directions"
         )
 
     def set_sector_choices(self):
-        self.fields["sector"].choices = [
-            (sector["id"], sector["name"])
-            for sector in self.metadata.get_sector_list(level=0)
-        ]
+        self.fields["sector"].choices = self.metadata.get_choices("sectors")
 
     def set_organisation_choices(self):
-        self.fields["organisation"].choices = (
-            self.metadata.get_gov_organisation_choices()
+        self.fields["organisation"].choices = self.metadata.get_choices(
+            "gov_organisations"
         )
 
     def set_policy_team_choices(self):
-        choices = [
-            (str(policy_team["id"]), policy_team["title"])
-            for policy_team in self.metadata.data["policy_teams"]
-        ]
-        self.fields["policy_team"].choices = choices
+        self.fields["policy_team"].choices = self.metadata.get_choices(
+            "search_policy_teams"
+        )
 
     def set_region_choices(self):
-        choices = [
-            (country["id"], country["name"])
-            for country in self.metadata.get_overseas_region_list()
-        ]
-        self.fields["region"].choices = choices
+        self.fields["region"].choices = self.metadata.get_choices("overseas_regions")
 
     def set_status_choices(self):
-        status_ids = ("2", "3", "4", "5")
-        choices = [
-            (id, value)
-            for id, value in self.metadata.data["barrier_status"].items()
-            if id in status_ids
-        ]
-        choices.sort(key=itemgetter(0))
-        self.fields["status"].choices = choices
+        self.fields["status"].choices = self.metadata.get_choices("search_statuses")
 
     def set_tags_choices(self):
-        choices = [
-            (str(tag["id"]), tag["title"])
-            for tag in self.metadata.get_barrier_tag_choices("search")
-            if tag["title"] not in DEPRECATED_TAGS
-        ]
-        self.fields["tags"].choices = choices
+        self.fields["tags"].choices = self.metadata.get_choices("search_tags")
 
     def set_ordering_choices(self):
-        ordering_choices = self.metadata.get_search_ordering_choices()
-
-        if not self.data.get("search_term_text"):
+        if self.data.get("search_term_text"):
+            choices = self.metadata.get_choices("search_ordering")
+        else:
             # If there is no search term for similarity, we need to remove the relevance ordering filter
             # from the list of options
-            ordering_choices.remove(["relevance", "Relevence to the search term"])
-
-        self.fields["ordering"].choices = ordering_choices
+            choices = self.metadata.get_choices("search_ordering_without_relevance")
+        self.fields["ordering"].choices = choices
 
     def clean_country(self):
         data = self.cleaned_data["country"]
@@ -2,11 +2,28 @@ import redis
 from django.conf import settings
 from django.core.management.base import BaseCommand
 
+from utils.metadata import clear_metadata_cache, expire_metadata_cache
+
 
 class Command(BaseCommand):
     help = "Clears the metadata cache"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--stale",
+            action="store_true",
+            help=(
+                "Mark the metadata as stale instead, so it is refreshed in the "
+                "background while the current copy is still served"
+            ),
+        )
+
     def handle(self, *args, **options):
         redis_client = redis.Redis.from_url(url=settings.REDIS_URI)
-        redis_client.delete("metadata")
+        if options["stale"]:
+            expire_metadata_cache(redis_client)
+            self.stdout.write(self.style.SUCCESS("Metadata cache marked as stale"))
+            return
+
+        clear_metadata_cache(redis_client)
         self.stdout.write(self.style.SUCCESS("Metadata cache cleared"))
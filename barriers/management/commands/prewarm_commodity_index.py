@@ -0,0 +1,47 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.api.client import MarketAccessAPIClient
+from utils.commodity_index import store_commodity_index
+
+# Commodities fetched from the API per request
+PAGE_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = "Fetches every HS commodity and stores a new version of the index"
+
+    def fetch_commodities(self, client):
+        commodities = []
+        total_count = None
+        while total_count is None or len(commodities) < total_count:
+            page = client.commodities.list(limit=PAGE_SIZE, offset=len(commodities))
+            total_count = page.total_count
+            if not page:
+                break
+            commodities.extend(commodity.data for commodity in page)
+        return commodities, total_count
+
+    def handle(self, *args, **options):
+        if not settings.COMMODITY_INDEX_API_TOKEN:
+            raise CommandError("COMMODITY_INDEX_API_TOKEN is not set")
+
+        client = MarketAccessAPIClient(settings.COMMODITY_INDEX_API_TOKEN)
+        start = time.monotonic()
+        commodities, total_count = self.fetch_commodities(client)
+        if len(commodities) != total_count:
+            raise CommandError(
+                f"Only {len(commodities)} of {total_count} "
+                "commodities were returned, so the index was not updated"
+            )
+        version = store_commodity_index(commodities)
+        duration = time.monotonic() - start
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Commodity index {version} with {len(commodities)} codes "
+                f"prewarmed in {duration:.3f}s"
+            )
+        )
@@ -0,0 +1,23 @@
+import time
+
+import redis
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from utils.metadata import fetch_metadata, get_metadata_metrics, store_metadata
+
+
+class Command(BaseCommand):
+    help = "Fetches the metadata and stores it in the cache"
+
+    def handle(self, *args, **options):
+        redis_client = redis.Redis.from_url(url=settings.REDIS_URI)
+        start = time.monotonic()
+        store_metadata(fetch_metadata(), redis_client)
+        duration = time.monotonic() - start
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Metadata cache prewarmed in {duration:.3f}s")
+        )
+        for name, value in sorted(get_metadata_metrics(redis_client).items()):
+            self.stdout.write(f"{name}: {value:g}")
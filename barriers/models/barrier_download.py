@@ -1,6 +1,5 @@
 from urllib.parse import urlencode
 
-import dateutil.parser
 from django.urls import reverse
 
 from barriers.forms.search import BarrierSearchForm
@@ -27,11 +26,11 @@ class BarrierDownload(APIModel):
 
     @property
     def created_on(self):
-        return dateutil.parser.parse(self.data["created_on"])
+        return self.get_date("created_on")
 
     @property
     def modified_on(self):
-        return dateutil.parser.parse(self.data["modified_on"])
+        return self.get_date("modified_on")
 
     @property
     def status(self) -> str:
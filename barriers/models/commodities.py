@@ -1,7 +1,10 @@
+import functools
+
 from utils.metadata import get_metadata
 from utils.models import APIModel
 
 
+@functools.lru_cache(maxsize=4096)
 def format_commodity_code(code):
     code = code.rstrip("0")
     if len(code) % 2:
@@ -39,7 +42,7 @@ class Commodity(APIModel):
 
     @property
     def code_display(self):
-        return format_commodity_code(self.code)
+        return self.data.get("code_display") or format_commodity_code(self.code)
 
     def to_dict(self):
         return {
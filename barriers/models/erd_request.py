@@ -1,5 +1,3 @@
-import dateutil.parser
-
 from utils.models import APIModel
 
 
@@ -7,9 +5,9 @@ class ErdRequest(APIModel):
     @property
     def estimated_resolution_date(self):
         if self.data.get("estimated_resolution_date"):
-            return dateutil.parser.parse(self.data["estimated_resolution_date"])
+            return self.get_date("estimated_resolution_date")
 
     @property
     def created_on(self):
         if self.data.get("created_on"):
-            return dateutil.parser.parse(self.data["created_on"])
+            return self.get_date("created_on")
@@ -1,10 +1,9 @@
-import dateutil.parser
-
 from barriers.constants import ARCHIVED_REASON
 from barriers.models.commodities import format_commodity_code
 from barriers.models.history.base import BaseHistoryItem, GenericHistoryItem
 from barriers.models.history.utils import PolymorphicBase
 from utils.metadata import Statuses
+from utils.models import parse_date
 
 
 class ArchivedHistoryItem(BaseHistoryItem):
@@ -140,7 +139,7 @@ class EstimatedResolutionDateHistoryItem(BaseHistoryItem):
 
     def get_value(self, value):
         if value:
-            return dateutil.parser.parse(value)
+            return parse_date(value)
 
 
 class IsSummarySensitiveHistoryItem(BaseHistoryItem):
@@ -231,7 +230,7 @@ class StatusHistoryItem(BaseHistoryItem):
 
     def get_value(self, value):
         if value["status_date"]:
-            value["status_date"] = dateutil.parser.parse(value["status_date"])
+            value["status_date"] = parse_date(value["status_date"])
         value["status_short_text"] = self.metadata.get_status_text(value["status"])
         value["status_text"] = self.metadata.get_status_text(
             status_id=value["status"],
@@ -1,11 +1,10 @@
-import dateutil.parser
-
-from utils.diff import diff_match_patch
+from utils.diff_cache import get_diff_html
 from utils.metadata import MetadataMixin
 from utils.models import APIModel
 
 
 class BaseHistoryItem(MetadataMixin, APIModel):
+    _diff = None
     _metadata = None
     _new_value = None
     _old_value = None
@@ -13,7 +12,7 @@ class BaseHistoryItem(MetadataMixin, APIModel):
 
     @property
     def date(self):
-        return dateutil.parser.parse(self.data["date"])
+        return self.get_date("date")
 
     @property
     def new_value(self):
@@ -29,10 +28,9 @@ class BaseHistoryItem(MetadataMixin, APIModel):
 
     @property
     def diff(self):
-        dmp = diff_match_patch()
-        diffs = dmp.diff_main(self.old_value or "", self.new_value or "")
-        dmp.diff_cleanupSemantic(diffs)
-        return dmp.diff_prettyHtml(diffs)
+        if self._diff is None:
+            self._diff = get_diff_html(self.old_value, self.new_value)
+        return self._diff
 
     def get_value(self, value):
         return value
@@ -1,12 +1,10 @@
-import dateutil.parser
-
 from utils.models import APIModel
 
 
 class Mention(APIModel):
     @property
     def created_on(self):
-        return dateutil.parser.parse(self.data["created_on"])
+        return self.get_date("created_on")
 
     @property
     def go_to_url_path(self):
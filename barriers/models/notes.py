@@ -1,6 +1,4 @@
-import dateutil.parser
-
-from utils.models import APIModel
+from utils.models import APIModel, parse_date
 
 from .documents import Document
 
@@ -16,7 +14,7 @@ class Note(APIModel):
 
     def __init__(self, data):
         self.data = data
-        self.date = dateutil.parser.parse(data["created_on"])
+        self.date = parse_date(data["created_on"])
         self.text = data["text"]
         self.user = data["created_by"]
         self.documents = [Document(document) for document in data["documents"]]
@@ -35,6 +33,6 @@ class PublicBarrierNote(APIModel):
 
     def __init__(self, data):
         self.data = data
-        self.date = dateutil.parser.parse(data["created_on"])
+        self.date = parse_date(data["created_on"])
         self.text = data["text"]
         self.user = data["created_by"]
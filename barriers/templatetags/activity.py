@@ -1,17 +1,15 @@
 from django import template
-from django.template.loader import get_template
+
+from utils.templates import PartialTemplates
 
 register = template.Library()
 
+activity_templates = PartialTemplates("barriers/activity/partials")
+
 
 @register.simple_tag(takes_context=True)
 def activity_item(context, item):
-    template_name = f"barriers/activity/partials/{item.model}/{item.field}.html"
-    try:
-        item_template = get_template(template_name)
-    except template.TemplateDoesNotExist:
-        return ""
-    return item_template.render(context.flatten())
+    return activity_templates.render_in_context(context, item)
 
 
 @register.filter
@@ -1,12 +1,14 @@
 from django import template
-from django.template.loader import select_template
+
+from utils.templates import PartialTemplates
 
 register = template.Library()
 
+history_templates = PartialTemplates(
+    "barriers/history/partials", default="barriers/history/partials/default.html"
+)
+
 
 @register.simple_tag()
 def history_item(item):
-    template_name = f"barriers/history/partials/{item.model}/{item.field}.html"
-    default_template_name = "barriers/history/partials/default.html"
-    item_template = select_template([template_name, default_template_name])
-    return item_template.render({"item": item})
+    return history_templates.render(item)
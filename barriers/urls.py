@@ -59,7 +59,7 @@ from barriers.views.companies import (
     BarrierRemoveCompany,
     CompanyDetail,
 )
-from barriers.views.documents import DownloadDocument
+from barriers.views.documents import DocumentUploadStatus, DownloadDocument
 from barriers.views.edit import (
     BarrierEditCausedByTradingBloc,
     BarrierEditCommercialValue,
@@ -219,6 +219,11 @@ urlpatterns = [
         DownloadDocument.as_view(),
         name="download_document",
     ),
+    path(
+        "documents/<uuid:document_id>/status/",
+        DocumentUploadStatus.as_view(),
+        name="document_upload_status",
+    ),
     path("saved-searches/new/", NewSavedSearch.as_view(), name="new_saved_search"),
     path(
         "saved-searches/<uuid:saved_search_id>/rename/",
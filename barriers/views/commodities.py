@@ -162,9 +162,7 @@ class BarrierEditCommodities(BarrierMixin, FormView):
             ]
             commodity_lookup = {
                 commodity.code: commodity
-                for commodity in client.commodities.list(
-                    codes=",".join(hs6_session_codes)
-                )
+                for commodity in client.commodities.lookup_many(hs6_session_codes)
             }
             barrier_commodities = []
             for commodity_data in session_commodities:
@@ -18,24 +18,20 @@ class CompanyDetail(BarrierMixin, FormView):
     template_name = "barriers/companies/detail.html"
     form_class = AddCompanyForm
 
-    def get_context_data(self, **kwargs):
+    def get_company(self, company_id):
         companies_house_api_client = CompaniesHouseAPIClient(
             api_key=COMPANIES_HOUSE_API_KEY, api_endpoint=COMPANIES_HOUSE_API_ENDPOINT
         )
+        return companies_house_api_client.get_company_from_id(company_id)
+
+    def get_context_data(self, **kwargs):
         context_data = super().get_context_data(**kwargs)
         company_id = str(self.kwargs.get("company_id"))
-        context_data["company"] = companies_house_api_client.get_company_from_id(
-            company_id
-        )
+        context_data["company"] = self.get_company(company_id)
         return context_data
 
     def form_valid(self, form):
-        companies_house_api_client = CompaniesHouseAPIClient(
-            api_key=COMPANIES_HOUSE_API_KEY, api_endpoint=COMPANIES_HOUSE_API_ENDPOINT
-        )
-        company = companies_house_api_client.get_company_from_id(
-            form.cleaned_data["company_id"]
-        )
+        company = self.get_company(form.cleaned_data["company_id"])
         companies = self.request.session.get("companies", [])
         companies.append(
             {
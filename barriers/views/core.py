@@ -10,6 +10,7 @@ from barriers.forms.search import BarrierSearchForm
 from barriers.views.search import SearchFormView
 from utils.api.client import MarketAccessAPIClient
 from utils.metadata import get_metadata
+from utils.page_data import APICall, PageDataMixin
 from utils.pagination import PaginationMixin
 
 from .mixins import AdminMixin, AnalyticsMixin, BarrierMixin
@@ -17,7 +18,7 @@ from .mixins import AdminMixin, AnalyticsMixin, BarrierMixin
 logger = logging.getLogger(__name__)
 
 
-class Dashboard(AnalyticsMixin, TemplateView, PaginationMixin):
+class Dashboard(AnalyticsMixin, PageDataMixin, TemplateView, PaginationMixin):
     template_name = "barriers/dashboard.html"
     utm_tags = {
         "en": {
@@ -27,6 +28,14 @@ class Dashboard(AnalyticsMixin, TemplateView, PaginationMixin):
         }
     }
     pagination_limit = 20
+    page_data = {
+        "my_barriers_saved_search": APICall("saved_searches.get", "my-barriers"),
+        "team_barriers_saved_search": APICall("saved_searches.get", "team-barriers"),
+        "mentions": APICall("mentions.list"),
+        "draft_barriers": APICall("reports.list"),
+        "saved_searches": APICall("saved_searches.list"),
+        "notification_exclusion": APICall("notification_exclusion.get"),
+    }
 
     def get(self, *args, **kwargs):
 
@@ -52,45 +61,37 @@ class Dashboard(AnalyticsMixin, TemplateView, PaginationMixin):
 
         return super().get(*args, **kwargs)
 
+    def get_page_data(self, **kwargs):
+        page_data = super().get_page_data(**kwargs)
+        downloads_page_number = (
+            self.request.GET.get("page") if self.request.GET.get("page") else 1
+        )
+        page_data["barrier_downloads"] = APICall(
+            "barrier_download.list",
+            limit=self.get_pagination_limit(),
+            offset=self.get_pagination_offset(),
+            page=downloads_page_number,
+        )
+        return page_data
+
     def get_context_data(self, **kwargs):
         context_data = super().get_context_data(**kwargs)
         active = self.request.GET.get("active", "barriers")
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
-        my_barriers_saved_search = client.saved_searches.get("my-barriers")
-        team_barriers_saved_search = client.saved_searches.get("team-barriers")
-        mentions = client.mentions.list()
-        draft_barriers = client.reports.list()
-        saved_searches = client.saved_searches.list()
-        notification_exclusion = client.notification_exclusion.get()
-        barrier_downloads = client.barrier_download.list()
+        page_data = self.load_page_data()
+        mentions = page_data["mentions"]
+        barrier_downloads = page_data["barrier_downloads"]
 
         are_all_mentions_read: bool = not any(
             not mention.read_by_recipient for mention in mentions
         )
 
-        downloads_page_number = (
-            self.request.GET.get("page") if self.request.GET.get("page") else 1
-        )
-        downloads_params = {
-            "limit": self.get_pagination_limit(),
-            "offset": self.get_pagination_offset(),
-            "page": downloads_page_number,
-        }
-        barrier_downloads = client.barrier_download.list(**downloads_params)
-
+        context_data.update(page_data)
         context_data.update(
             {
                 "page": "dashboard",
-                "my_barriers_saved_search": my_barriers_saved_search,
-                "team_barriers_saved_search": team_barriers_saved_search,
-                "draft_barriers": draft_barriers,
-                "saved_searches": saved_searches,
-                "notification_exclusion": notification_exclusion,
-                "mentions": mentions,
                 "are_all_mentions_read": are_all_mentions_read,
                 "active": active,
                 "all_downloads_count": barrier_downloads.total_count,
-                "barrier_downloads": barrier_downloads,
                 "pagination": self.get_pagination_data(object_list=barrier_downloads),
             }
         )
@@ -123,7 +124,9 @@ class WhatIsABarrier(TemplateView):
         return context_data
 
 
-class Home(AnalyticsMixin, SearchFormView, TemplateView, PaginationMixin):
+class Home(
+    AnalyticsMixin, PageDataMixin, SearchFormView, TemplateView, PaginationMixin
+):
     template_name = "barriers/home.html"
     utm_tags = {
         "en": {
@@ -157,27 +160,28 @@ class Home(AnalyticsMixin, SearchFormView, TemplateView, PaginationMixin):
 
         return super().get(form, *args, **kwargs)
 
-    def get_context_data(self, form, **kwargs):
-        context_data = super().get_context_data(**kwargs)
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
-        mentions = client.mentions.list()
-
-        are_all_mentions_read: bool = not any(
-            not mention.read_by_recipient for mention in mentions
-        )
-
+    def get_page_data(self, search_params, **kwargs):
+        page_data = super().get_page_data(**kwargs)
         # Get page number for task list pagination from URL
         page_number = (
             self.request.GET.get("page") if self.request.GET.get("page") else 1
         )
-        api_task_list_params = {
-            "limit": self.get_pagination_limit(),
-            "offset": self.get_pagination_offset(),
-            "page": page_number,
-        }
-        # Get list of tasks for the user from the API
-        barrier_task_list = client.dashboard_tasks.list(**api_task_list_params)
+        page_data.update(
+            {
+                "mentions": APICall("mentions.list"),
+                # Get list of tasks for the user from the API
+                "barrier_task_list": APICall(
+                    "dashboard_tasks.list",
+                    limit=self.get_pagination_limit(),
+                    offset=self.get_pagination_offset(),
+                    page=page_number,
+                ),
+                "summary_stats": APICall("get", f"dashboard-summary?{search_params}"),
+            }
+        )
+        return page_data
 
+    def get_search_params(self, form):
         params = form.get_api_search_parameters()
 
         query_string = ""
@@ -194,10 +198,18 @@ class Home(AnalyticsMixin, SearchFormView, TemplateView, PaginationMixin):
                     + f"&{urllib.parse.urlencode({parameter: params[parameter]})}"
                 )
 
-        search_params = query_string
+        return query_string
+
+    def get_context_data(self, form, **kwargs):
+        context_data = super().get_context_data(**kwargs)
+        search_params = self.get_search_params(form)
+        page_data = self.load_page_data(search_params=search_params)
+        mentions = page_data["mentions"]
+        barrier_task_list = page_data["barrier_task_list"]
 
-        summary_url = f"dashboard-summary?{search_params}"
-        summary_stats = client.get(summary_url)
+        are_all_mentions_read: bool = not any(
+            not mention.read_by_recipient for mention in mentions
+        )
 
         metadata = get_metadata()
 
@@ -216,7 +228,7 @@ class Home(AnalyticsMixin, SearchFormView, TemplateView, PaginationMixin):
                 ),
                 "filters": form.get_readable_filters(True),
                 "barrier_task_list": barrier_task_list,
-                "summary_stats": summary_stats,
+                "summary_stats": page_data["summary_stats"],
                 "search_params": search_params,
             }
         )
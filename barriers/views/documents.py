@@ -1,8 +1,10 @@
 from http import HTTPStatus
 
+from django.conf import settings
 from django.http import JsonResponse
 from django.template.defaultfilters import filesizeformat
-from django.views.generic import FormView, RedirectView
+from django.urls import reverse
+from django.views.generic import FormView, RedirectView, View
 
 from utils.api.client import MarketAccessAPIClient
 from utils.exceptions import FileUploadError, ScanError
@@ -16,6 +18,21 @@ class DownloadDocument(RedirectView):
         return data["document_url"]
 
 
+class DocumentUploadStatus(View):
+    """
+    Progress of a document being uploaded and scanned in the background
+    """
+
+    def get(self, request, *args, **kwargs):
+        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        status = client.documents.get_upload_status(str(self.kwargs["document_id"]))
+        if status is None:
+            return JsonResponse(
+                {"message": "Upload not found"}, status=HTTPStatus.NOT_FOUND
+            )
+        return JsonResponse(status)
+
+
 class AddDocumentAjaxView(FormView):
     """
     Base ajax view for uploading documents
@@ -24,6 +41,7 @@ class AddDocumentAjaxView(FormView):
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
         kwargs["token"] = self.request.session.get("sso_token")
+        kwargs["upload_in_background"] = settings.DOCUMENT_UPLOAD_ASYNC
         return kwargs
 
     def form_valid(self, form):
@@ -42,16 +60,20 @@ class AddDocumentAjaxView(FormView):
 
         self.add_document_to_session(document, form.is_multi_document())
 
-        return JsonResponse(
-            {
-                "documentId": document["id"],
-                "delete_url": self.get_delete_url(document),
-                "file": {
-                    "name": document["file"]["name"],
-                    "size": filesizeformat(document["file"]["size"]),
-                },
-            }
-        )
+        response_data = {
+            "documentId": document["id"],
+            "delete_url": self.get_delete_url(document),
+            "file": {
+                "name": document["file"]["name"],
+                "size": filesizeformat(document["file"]["size"]),
+            },
+        }
+        if document.get("pending"):
+            response_data["status_url"] = reverse(
+                "barriers:document_upload_status",
+                kwargs={"document_id": document["id"]},
+            )
+        return JsonResponse(response_data)
 
     def get_session_key(self):
         raise NotImplementedError
@@ -66,6 +88,8 @@ class AddDocumentAjaxView(FormView):
             "name": document["file"]["name"],
             "size": document["file"]["size"],
         }
+        if document.get("pending"):
+            flat_document["background_upload"] = True
         if multi_document:
             documents = self.request.session.get(session_key, [])
             documents.append(flat_document)
@@ -211,7 +211,7 @@ class BarrierEditTags(MetadataMixin, APIBarrierFormViewMixin, FormView):
 
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
-        kwargs["tags"] = self.metadata.get_barrier_tag_choices("edit")
+        kwargs["tags"] = self.metadata.get_choices("edit_tags")
         return kwargs
 
     def get_initial(self):
@@ -226,7 +226,9 @@ class BarrierEditTradeDirection(MetadataMixin, APIBarrierFormViewMixin, FormView
 
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
-        kwargs["trade_direction_choices"] = self.metadata.get_trade_direction_choices()
+        kwargs["trade_direction_choices"] = self.metadata.get_choices(
+            "trade_directions"
+        )
         return kwargs
 
     def get_initial(self):
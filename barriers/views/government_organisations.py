@@ -88,7 +88,7 @@ class BarrierEditGovernmentOrganisations(BaseGovernmentOrganisationFormView):
 
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
-        kwargs["organisations"] = self.metadata.get_gov_organisation_choices()
+        kwargs["organisations"] = self.metadata.get_choices("gov_organisations")
         kwargs["barrier_id"] = str(self.barrier_id)
         kwargs["token"] = self.request.session.get("sso_token")
         return kwargs
@@ -1,24 +1,117 @@
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.shortcuts import render
+from django.template.loader import render_to_string
 from django.views.generic import TemplateView
 
+from barriers.models.history import HistoryItem
 from utils.api.client import MarketAccessAPIClient
+from utils.concurrency import iterate_in_context
 
 from .mixins import BarrierMixin
 
+# Placeholder in the rendered page where the history count and items are inserted
+HISTORY_STREAM_MARKER = "<!-- history-items -->"
+
 
 class BarrierHistory(BarrierMixin, TemplateView):
+    """
+    Shows the barrier history one page of items at a time.
+
+    Further pages are loaded with "load more", which requests just the items
+    with an XMLHttpRequest. With HISTORY_STREAMING_ENABLED the whole history
+    is streamed instead, a page of items at a time.
+    """
+
     template_name = "barriers/history.html"
+    count_template_name = "barriers/partials/history_count.html"
+    items_template_name = "barriers/partials/history_items.html"
+    _full_history = None
+    streaming = False
+
+    @property
+    def full_history(self):
+        if self._full_history is None:
+            self._full_history = self.get_prefetched(
+                "full_history", self.get_full_history
+            )
+        return self._full_history
+
+    def get(self, request, *args, **kwargs):
+        if self.is_load_more():
+            return render(request, self.items_template_name, self.get_history_page())
+        if settings.HISTORY_STREAMING_ENABLED:
+            return self.get_streaming_response()
+        return super().get(request, *args, **kwargs)
+
+    def get_prefetch_tasks(self):
+        tasks = super().get_prefetch_tasks()
+        if not self.streaming:
+            tasks["full_history"] = self.get_full_history
+        return tasks
 
     def get_context_data(self, **kwargs):
         context_data = super().get_context_data(**kwargs)
+        if not self.streaming:
+            context_data["history_count"] = len(self.full_history)
+            context_data.update(self.get_history_page())
+        return context_data
 
-        full_history = self.get_full_history()
+    def get_offset(self):
+        try:
+            return max(int(self.request.GET.get("offset", 0)), 0)
+        except ValueError:
+            return 0
 
-        context_data["history_items"] = full_history
-        return context_data
+    def get_history_page(self, offset=None):
+        if offset is None:
+            offset = self.get_offset()
+        end = offset + settings.HISTORY_PAGE_SIZE
+        return {
+            "barrier_id": self.kwargs.get("barrier_id"),
+            "history_items": [
+                HistoryItem(data) for data in self.full_history[offset:end]
+            ],
+            "next_offset": end if end < len(self.full_history) else None,
+        }
+
+    def get_streaming_response(self):
+        """
+        Sends the page up to the history before the history is fetched,
+        then the history a page of items at a time.
+        """
+        self.streaming = True
+        context_data = self.get_context_data(
+            history_stream_marker=HISTORY_STREAM_MARKER, **self.kwargs
+        )
+        page = render_to_string(
+            self.get_template_names(), context_data, request=self.request
+        )
+        head, middle, tail = page.split(HISTORY_STREAM_MARKER, 2)
+        return StreamingHttpResponse(
+            iterate_in_context(self.stream_history(head, middle, tail))
+        )
+
+    def stream_history(self, head, middle, tail):
+        yield head
+        yield render_to_string(
+            self.count_template_name,
+            {"history_count": len(self.full_history)},
+            request=self.request,
+        )
+        yield middle
+        for offset in range(0, len(self.full_history), settings.HISTORY_PAGE_SIZE):
+            page = self.get_history_page(offset)
+            page["next_offset"] = None
+            yield render_to_string(self.items_template_name, page, request=self.request)
+        yield tail
+
+    def is_load_more(self):
+        return self.request.headers.get("x-requested-with") == "XMLHttpRequest"
 
     def get_full_history(self):
         client = MarketAccessAPIClient(self.request.session.get("sso_token"))
         barrier_id = self.kwargs.get("barrier_id")
-        full_history = client.barriers.get_full_history(barrier_id=barrier_id)
-        full_history.sort(key=lambda object: object.date, reverse=True)
-        return full_history
+        return client.barriers.get_full_history_cached(
+            barrier_id=barrier_id, refresh=not self.is_load_more()
+        )
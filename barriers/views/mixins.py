@@ -8,6 +8,7 @@ from django.urls import reverse
 from barriers.constants import RELATED_BARRIER_TAGS
 from barriers.models import PublicBarrier
 from utils.api.client import MarketAccessAPIClient
+from utils.concurrency import run_concurrently, unwrap
 from utils.context_processors import user_scope
 from utils.exceptions import APIHttpException
 
@@ -27,27 +28,36 @@ class AdminMixin:
 class BarrierMixin:
     include_interactions = False
     _barrier = None
+    _activity = None
     _interactions = None
     _notes = None
     _note = None
     _action_plan = None
     _preliminary_assessment = None
     _estimated_resolution_date_request = None
+    _prefetched = None
 
     @property
     def barrier(self):
         if not self._barrier:
-            self._barrier = self.get_barrier()
+            self._barrier = self.get_prefetched("barrier", self.get_barrier)
         return self._barrier
 
     @property
     def estimated_resolution_date_request(self):
         if not self._estimated_resolution_date_request:
-            self._estimated_resolution_date_request = (
-                self.get_estimated_resolution_date_request()
+            self._estimated_resolution_date_request = self.get_prefetched(
+                "estimated_resolution_date_request",
+                self.get_estimated_resolution_date_request,
             )
         return self._estimated_resolution_date_request
 
+    @property
+    def activity(self):
+        if self._activity is None:
+            self._activity = self.get_prefetched("activity", self.get_activity)
+        return self._activity
+
     @property
     def interactions(self):
         if not self._interactions:
@@ -63,13 +73,13 @@ class BarrierMixin:
     @property
     def notes(self):
         if not self._notes:
-            self._notes = self.get_notes()
+            self._notes = self.get_prefetched("notes", self.get_notes)
         return self._notes
 
     @property
     def action_plan(self):
         if not self._action_plan:
-            self._action_plan = self.get_action_plan()
+            self._action_plan = self.get_prefetched("action_plan", self.get_action_plan)
         return self._action_plan
 
     @property
@@ -78,6 +88,45 @@ class BarrierMixin:
             self._preliminary_assessment = self.get_preliminary_assessment()
         return self._preliminary_assessment
 
+    def get_prefetch_tasks(self):
+        """
+        API calls needed to render the page which can be made concurrently.
+
+        They only depend on the barrier id from the url, so none of them
+        need to wait for the barrier itself to be fetched.
+        """
+        tasks = {
+            "barrier": self.get_barrier,
+            "estimated_resolution_date_request": (
+                self.get_estimated_resolution_date_request
+            ),
+            "action_plan": self.get_action_plan,
+        }
+        if self.include_interactions:
+            tasks["notes"] = self.get_notes
+            tasks["activity"] = self.get_activity
+        return tasks
+
+    def prefetch(self):
+        """
+        Fetch everything the page needs that hasn't been loaded yet in one
+        concurrent batch. Exceptions are raised when the value is used.
+        """
+        if self._prefetched is None:
+            self._prefetched = {}
+
+        tasks = {
+            name: task
+            for name, task in self.get_prefetch_tasks().items()
+            if getattr(self, f"_{name}") is None and name not in self._prefetched
+        }
+        self._prefetched.update(run_concurrently(tasks))
+
+    def get_prefetched(self, name, fetch):
+        if self._prefetched and name in self._prefetched:
+            return unwrap(self._prefetched[name])
+        return fetch()
+
     def get_barrier(self):
         client = MarketAccessAPIClient(self.request.session.get("sso_token"))
         barrier_id = self.kwargs.get("barrier_id")
@@ -96,18 +145,21 @@ class BarrierMixin:
         except APIHttpException:
             return
 
-    def get_interactions(self):
+    def get_activity(self):
         client = MarketAccessAPIClient(self.request.session.get("sso_token"))
-        activity = client.barriers.get_activity(barrier_id=self.barrier.id)
-        interactions = self.notes + activity
+        return client.barriers.get_activity(barrier_id=self.kwargs.get("barrier_id"))
+
+    def get_interactions(self):
+        interactions = self.notes + self.activity
         interactions.sort(key=lambda object: object.date, reverse=True)
         return interactions
 
     def get_notes(self):
         client = MarketAccessAPIClient(self.request.session.get("sso_token"))
-        return client.notes.list(barrier_id=self.barrier.id)
+        return client.notes.list(barrier_id=self.kwargs.get("barrier_id"))
 
     def get_context_data(self, **kwargs):
+        self.prefetch()
         context_data = super().get_context_data(**kwargs)
         context_data["barrier"] = self.barrier
         context_data["estimated_resolution_date_request"] = (
@@ -127,7 +179,7 @@ class BarrierMixin:
 
     def get_action_plan(self):
         client = MarketAccessAPIClient(self.request.session.get("sso_token"))
-        barrier_id = self.barrier.id
+        barrier_id = self.kwargs.get("barrier_id")
         try:
             return client.action_plans.get_barrier_action_plan(barrier_id=barrier_id)
         except APIHttpException as e:
@@ -248,11 +300,35 @@ class SessionDocumentMixin:
 
     The session key can be specific to a particular object, so that multiple
     objects can be edited without interfering with eachother.
+
+    Documents uploaded in the background are flagged in the session, so
+    forms can reject them once their upload status has expired.
     """
 
     def get_session_key(self):
         raise NotImplementedError
 
+    def get_document_session_keys(self):
+        return [self.get_session_key()]
+
+    def get_form_kwargs(self):
+        kwargs = super().get_form_kwargs()
+        kwargs["background_upload_ids"] = self.get_background_upload_ids()
+        return kwargs
+
+    def get_background_upload_ids(self):
+        background_upload_ids = []
+        for session_key in self.get_document_session_keys():
+            documents = self.request.session.get(session_key) or []
+            if isinstance(documents, dict):
+                documents = [documents]
+            background_upload_ids.extend(
+                str(document["id"])
+                for document in documents
+                if document.get("background_upload")
+            )
+        return background_upload_ids
+
     def get_session_document(self, session_key=None):
         if session_key is None:
             session_key = self.get_session_key()
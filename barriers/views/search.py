@@ -102,7 +102,7 @@ class BarrierSearch(PaginationMixin, BarrierSearchFormView):
         return context_data
 
     def get_barriers(self, form):
-        return self.client.barriers.list(
+        return self.client.barriers.list_cached(
             limit=self.get_pagination_limit(),
             offset=self.get_pagination_offset(),
             **form.get_api_search_parameters(),
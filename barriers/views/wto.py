@@ -91,6 +91,12 @@ class EditWTOProfile(SessionDocumentMixin, APIBarrierFormViewMixin, FormView):
         barrier_id = self.kwargs.get("barrier_id")
         return f"barrier:{barrier_id}:wto:meeting_minutes"
 
+    def get_document_session_keys(self):
+        return [
+            self.get_committee_notification_document_session_key(),
+            self.get_meeting_minutes_session_key(),
+        ]
+
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
         kwargs["metadata"] = get_metadata()
@@ -98,12 +104,7 @@ class EditWTOProfile(SessionDocumentMixin, APIBarrierFormViewMixin, FormView):
         return kwargs
 
     def form_valid(self, form):
-        self.delete_session_documents(
-            [
-                self.get_committee_notification_document_session_key(),
-                self.get_meeting_minutes_session_key(),
-            ]
-        )
+        self.delete_session_documents(self.get_document_session_keys())
         return super().form_valid(form)
 
 
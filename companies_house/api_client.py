@@ -1,9 +1,15 @@
 import base64
+import hashlib
 import logging
+from http import HTTPStatus
+from urllib.parse import urlencode
 
-import requests
+from django.conf import settings
+from django.core.cache import cache
 
 from companies_house.dataclasses import CompanyHouseCompany, CompanyHouseSearchResult
+from utils.api.transport import get_session
+from utils.concurrency import coalesce
 
 logger = logging.getLogger(__name__)
 
@@ -22,25 +28,59 @@ class CompaniesHouseAPIClient(object):
         Get company house data from the API
         """
         url = f"{self.api_endpoint}/company/{company_id}"
-        headers = {
-            "Authorization": "Basic " + base64.b64encode(self.api_key.encode()).decode()
-        }
-        response = requests.get(url, headers=headers)
-        return CompanyHouseCompany(**response.json())
+        data = get_cached_json(
+            url,
+            api_key=self.api_key,
+            timeout=settings.COMPANIES_HOUSE_COMPANY_CACHE_TIME,
+        )
+        return CompanyHouseCompany(**data)
 
     def search_companies(self, query: str, limit: int = 100, raw_json: bool = False):
         """
         Search company house companies
         """
         url = f"{self.api_endpoint}/search/companies"
-        headers = {
-            "Authorization": "Basic " + base64.b64encode(self.api_key.encode()).decode()
-        }
+        # Searches ignore case and extra spaces, so share results between them
+        query = " ".join(str(query).lower().split())
         params = {"q": query, "items_per_page": limit}
 
-        response = requests.get(url, params=params, headers=headers)
+        data = get_cached_json(
+            url,
+            api_key=self.api_key,
+            timeout=settings.COMPANIES_HOUSE_SEARCH_CACHE_TIME,
+            params=params,
+        )
 
         if raw_json is True:
-            return response.json()
+            return data
         else:
-            return CompanyHouseSearchResult(**response.json())
+            return CompanyHouseSearchResult(**data)
+
+
+def get_cached_json(url, api_key, timeout, params=None):
+    """
+    Returns the json response from Companies House, cached for timeout seconds.
+
+    Identical requests made while one is in flight share its response.
+    """
+    params = params or {}
+    request_hash = hashlib.sha256(
+        f"{url}?{urlencode(sorted(params.items()))}".encode()
+    ).hexdigest()
+    cache_key = f"companies_house:{request_hash}"
+
+    data = cache.get(cache_key)
+    if data is not None:
+        return data
+
+    def fetch():
+        headers = {
+            "Authorization": "Basic " + base64.b64encode(api_key.encode()).decode()
+        }
+        response = get_session().get(url, params=params, headers=headers)
+        data = response.json()
+        if response.status_code == HTTPStatus.OK:
+            cache.set(cache_key, data, timeout)
+        return data
+
+    return coalesce(cache_key, fetch)
@@ -106,11 +106,14 @@ if ELASTIC_APM_ENABLED:
     INSTALLED_APPS.append("elasticapm.contrib.django")
 
 MIDDLEWARE = [
+    "utils.middleware.ServerTimingMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "utils.middleware.RequestCacheMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
+    "utils.middleware.UploadSizeLimitMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
@@ -224,7 +227,40 @@ STORAGES = {
 }
 
 USER_DATA_CACHE_TIME = 3600
+BARRIER_SEARCH_CACHE_TIME = env.int("BARRIER_SEARCH_CACHE_TIME", default=120)
+BARRIER_SEARCH_PREFETCH_NEXT_PAGE = env.bool(
+    "BARRIER_SEARCH_PREFETCH_NEXT_PAGE", default=False
+)
+# How long commodities fetched from the API are shared between workers
+COMMODITY_CACHE_TIME = env.int("COMMODITY_CACHE_TIME", default=60 * 60 * 24 * 7)
+# SSO token prewarm_commodity_index uses to fetch every commodity on release
+COMMODITY_INDEX_API_TOKEN = env("COMMODITY_INDEX_API_TOKEN", default=None)
+HISTORY_DIFF_CACHE_TIME = env.int("HISTORY_DIFF_CACHE_TIME", default=60 * 60 * 24 * 30)
+# Seconds to spend diffing one history item before showing it as too large
+HISTORY_DIFF_TIMEOUT = env.float("HISTORY_DIFF_TIMEOUT", default=0.25)
+HISTORY_DIFF_MAX_LENGTH = env.int("HISTORY_DIFF_MAX_LENGTH", default=100000)
+HISTORY_PAGE_SIZE = env.int("HISTORY_PAGE_SIZE", default=50)
+# How long "load more" reuses the history fetched for the first page
+HISTORY_CACHE_TIME = env.int("HISTORY_CACHE_TIME", default=120)
+# Stream the full barrier history instead of showing it a page at a time
+HISTORY_STREAMING_ENABLED = env.bool("HISTORY_STREAMING_ENABLED", default=False)
+MENTION_COUNTS_CACHE_TIME = env.int("MENTION_COUNTS_CACHE_TIME", default=60)
+# Load the mention count badge with a separate request after the page renders
+MENTION_COUNTS_ASYNC = env.bool("MENTION_COUNTS_ASYNC", default=False)
 METADATA_CACHE_TIME = env.int("METADATA_CACHE_TIME", default=10600)
+# How long stale metadata is still served while it is refreshed
+METADATA_STALE_TIME = env.int("METADATA_STALE_TIME", default=86400)
+METADATA_REFRESH_LOCK_TIMEOUT = env.int("METADATA_REFRESH_LOCK_TIMEOUT", default=60)
+# Seconds a request waits for another worker to fetch missing metadata
+# before fetching it itself. Keep well below METADATA_REFRESH_LOCK_TIMEOUT.
+METADATA_MISSING_WAIT_TIME = env.float("METADATA_MISSING_WAIT_TIME", default=2)
+# Compress report drafts saved to the API once they reach the minimum size
+REPORT_SESSION_DATA_COMPRESSION = env.bool(
+    "REPORT_SESSION_DATA_COMPRESSION", default=False
+)
+REPORT_SESSION_DATA_COMPRESS_MIN_SIZE = env.int(
+    "REPORT_SESSION_DATA_COMPRESS_MIN_SIZE", default=4096
+)
 USE_S3_FOR_CSV_DOWNLOADS = env("USE_S3_FOR_CSV_DOWNLOADS", default=True)
 
 # CACHE / REDIS
@@ -247,7 +283,10 @@ if REDIS_URI:
 
 # Set user sessions to be stored in the cache, not the DB, unless there
 # is a problem with redis
-SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+SESSION_ENGINE = "utils.session_store"
+# Read sessions missing from redis from the DB and write to it while redis is down
+SESSION_DB_FALLBACK = env.bool("SESSION_DB_FALLBACK", default=True)
+SESSION_COMPRESS_MIN_SIZE = env.int("SESSION_COMPRESS_MIN_SIZE", default=1024)
 
 # Market access API
 MARKET_ACCESS_API_URI = env("MARKET_ACCESS_API_URI")
@@ -259,10 +298,32 @@ MARKET_ACCESS_API_HAWK_CREDS = {
     "algorithm": "sha256",
 }
 
+# Shared HTTP transport for outbound API calls
+HTTP_CONNECT_TIMEOUT = env.float("HTTP_CONNECT_TIMEOUT", default=3.05)
+HTTP_READ_TIMEOUT = env.float("HTTP_READ_TIMEOUT", default=30)
+HTTP_MAX_RETRIES = env.int("HTTP_MAX_RETRIES", default=2)
+HTTP_RETRY_BACKOFF_FACTOR = env.float("HTTP_RETRY_BACKOFF_FACTOR", default=0.1)
+HTTP_POOL_CONNECTIONS = env.int("HTTP_POOL_CONNECTIONS", default=10)
+HTTP_POOL_MAXSIZE = env.int("HTTP_POOL_MAXSIZE", default=10)
+HTTP_POOL_MAXSIZE_PER_HOST = {
+    MARKET_ACCESS_API_URI: env.int("MARKET_ACCESS_API_POOL_MAXSIZE", default=100),
+}
+
+# Independent API calls needed by a page are issued concurrently
+API_CONCURRENT_REQUESTS_ENABLED = env.bool(
+    "API_CONCURRENT_REQUESTS_ENABLED", default=True
+)
+API_CONCURRENT_REQUESTS_MAX_WORKERS = env.int(
+    "API_CONCURRENT_REQUESTS_MAX_WORKERS", default=8
+)
+
 SSO_CLIENT = env("SSO_CLIENT")
 SSO_SECRET = env("SSO_SECRET")
 SSO_API_URI = env("SSO_API_URI")
 SSO_API_TOKEN = env("SSO_API_TOKEN")
+SSO_USER_SEARCH_CACHE_TIME = env.int("SSO_USER_SEARCH_CACHE_TIME", default=300)
+# Answer longer user searches by filtering a complete cached shorter search
+SSO_USER_SEARCH_NARROWING = env.bool("SSO_USER_SEARCH_NARROWING", default=True)
 SSO_AUTHORIZE_URI = env("SSO_AUTHORIZE_URI")
 SSO_BASE_URI = env("SSO_BASE_URI")
 SSO_TOKEN_URI = env("SSO_TOKEN_URI")
@@ -275,10 +336,29 @@ DATAHUB_HAWK_ID = env("DATAHUB_HAWK_ID")
 DATAHUB_HAWK_KEY = env("DATAHUB_HAWK_KEY")
 
 FILE_MAX_SIZE = env.int("FILE_MAX_SIZE", default=(5 * 1024 * 1024))
+# Room for two files and the rest of the form
+FILE_UPLOAD_MAX_REQUEST_SIZE = env.int(
+    "FILE_UPLOAD_MAX_REQUEST_SIZE", default=(FILE_MAX_SIZE * 2 + 1024 * 1024)
+)
+# Bytes of each file read to detect its type
+FILE_TYPE_SNIFF_SIZE = env.int("FILE_TYPE_SNIFF_SIZE", default=8192)
 FILE_SCAN_MAX_WAIT_TIME = env.int("FILE_SCAN_MAX_WAIT_TIME", default=30000)
 FILE_SCAN_STATUS_CHECK_INTERVAL = env.int(
     "FILE_SCAN_STATUS_CHECK_INTERVAL", default=500
 )
+FILE_SCAN_MAX_CHECK_INTERVAL = env.int("FILE_SCAN_MAX_CHECK_INTERVAL", default=4000)
+# Upload and scan documents added with javascript in the background, in a
+# greenlet or thread of the web worker handling the request
+DOCUMENT_UPLOAD_ASYNC = env.bool("DOCUMENT_UPLOAD_ASYNC", default=False)
+DOCUMENT_UPLOAD_STATUS_CACHE_TIME = env.int(
+    "DOCUMENT_UPLOAD_STATUS_CACHE_TIME", default=3600
+)
+# Seconds a background upload or scan may stay pending before it is treated
+# as failed. Uploads run in the web worker, so one lost when the worker is
+# restarted is only noticed this way. Keep above FILE_SCAN_MAX_WAIT_TIME.
+DOCUMENT_UPLOAD_PENDING_TIMEOUT = env.int(
+    "DOCUMENT_UPLOAD_PENDING_TIMEOUT", default=FILE_SCAN_MAX_WAIT_TIME // 1000 + 60
+)
 ALLOWED_FILE_TYPES = env.list("ALLOWED_FILE_TYPES", default=["text/csv", "image/jpeg"])
 
 API_RESULTS_LIMIT = env.int("API_RESULTS_LIMIT", default=50)
@@ -411,6 +491,12 @@ EXTERNAL_URLS_FIND_EXPORTERS = env.str("EXTERNAL_URLS_FIND_EXPORTERS", "")
 # Company house config
 COMPANIES_HOUSE_API_KEY = env("COMPANIES_HOUSE_API_KEY")
 COMPANIES_HOUSE_API_ENDPOINT = env("COMPANIES_HOUSE_API_ENDPOINT")
+COMPANIES_HOUSE_SEARCH_CACHE_TIME = env.int(
+    "COMPANIES_HOUSE_SEARCH_CACHE_TIME", default=3600
+)
+COMPANIES_HOUSE_COMPANY_CACHE_TIME = env.int(
+    "COMPANIES_HOUSE_COMPANY_CACHE_TIME", default=86400
+)
 
 CSP_DEFAULT_SRC = ("'self'",)
 CSP_SCRIPT_SRC = (
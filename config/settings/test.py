@@ -15,9 +15,15 @@ PASSWORD_HASHERS = [
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.dummy.DummyCache",
-    }
+    },
+    # The dummy cache can't hold sessions, so they get a cache of their own
+    "sessions": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "sessions",
+    },
 }
 
+SESSION_CACHE_ALIAS = "sessions"
 
 HEADLESS = env.bool("HEADLESS", default=True)
 
@@ -4,6 +4,8 @@ ma.components.AttachmentForm = (function (jessie) {
     }
 
     var bind = jessie.bind;
+    var POLL_INTERVAL = 500;
+    var MAX_POLL_INTERVAL = 4000;
 
     function AttachmentForm(
         fileUpload,
@@ -74,21 +76,24 @@ ma.components.AttachmentForm = (function (jessie) {
             var file = data.file;
 
             if (documentId && file) {
-                this.submitButton.disabled = false;
-                this.fileUpload.showLink();
                 var item = {
                     id: documentId,
                     delete_url: data.delete_url,
                     name: file.name,
                     size: file.size,
                 };
-                this.attachments.addItem(item, this.multiDocument);
+                if (data.status_url) {
+                    this.fileUpload.setProgress("scanning file for viruses...");
+                    this.pollStatus(item, data.status_url, POLL_INTERVAL);
+                } else {
+                    this.addDocument(item);
+                }
             } else {
                 this.showError(
                     "There was an issue uploading the document, try again",
                 );
             }
-        } else if (responseCode === 401) {
+        } else if (responseCode === 401 || responseCode === 413) {
             this.showError(data.message);
         } else {
             var message =
@@ -99,6 +104,55 @@ ma.components.AttachmentForm = (function (jessie) {
         }
     };
 
+    AttachmentForm.prototype.addDocument = function (item) {
+        this.submitButton.disabled = false;
+        this.fileUpload.showLink();
+        this.attachments.addItem(item, this.multiDocument);
+    };
+
+    AttachmentForm.prototype.pollStatus = function (item, statusUrl, interval) {
+        var self = this;
+
+        setTimeout(function () {
+            var xhr = ma.xhr2();
+
+            xhr.addEventListener("load", function () {
+                var data;
+
+                try {
+                    data = JSON.parse(xhr.response);
+                } catch (e) {
+                    data = {};
+                }
+
+                if (xhr.status === 200 && data.status === "clean") {
+                    self.addDocument(item);
+                } else if (xhr.status === 200 && data.status === "pending") {
+                    self.pollStatus(
+                        item,
+                        statusUrl,
+                        Math.min(interval * 2, MAX_POLL_INTERVAL),
+                    );
+                } else {
+                    // Remove the failed document from the session
+                    var deleteXhr = ma.xhr2();
+                    deleteXhr.open("POST", item.delete_url, true);
+                    deleteXhr.setRequestHeader("X-CSRFToken", csrftoken);
+                    deleteXhr.send();
+
+                    self.showError(
+                        data.message ||
+                            "There was an issue uploading the document, try again",
+                    );
+                }
+            });
+            xhr.addEventListener("error", bind(self.transferFailed, self), false);
+
+            xhr.open("GET", statusUrl, true);
+            xhr.send();
+        }, interval);
+    };
+
     AttachmentForm.prototype.newFile = function (fieldName, file) {
         var xhr2 = ma.xhr2();
         var formData = new FormData();
@@ -124,6 +178,7 @@ ma.components.AttachmentForm = (function (jessie) {
 
         xhr2.open("POST", this.fileUpload.action, true);
         xhr2.setRequestHeader("X-CSRFToken", csrftoken);
+        xhr2.setRequestHeader("X-Requested-With", "XMLHttpRequest");
         xhr2.send(formData);
 
         this.fileUpload.setProgress("uploading file... 0%");
@@ -0,0 +1,47 @@
+ma.components.HistoryLoadMore = (function (doc, jessie) {
+    if (!ma.xhr2 || !jessie.hasFeatures("attachListener", "cancelDefault")) {
+        return;
+    }
+
+    function HistoryLoadMore(selector) {
+        this.container = doc.querySelector(selector);
+
+        if (!this.container) {
+            return;
+        }
+
+        this.bindLink();
+    }
+
+    HistoryLoadMore.prototype.bindLink = function () {
+        this.link = this.container.querySelector(".js-history-load-more");
+
+        if (this.link) {
+            jessie.attachListener(this.link, "click", this.load.bind(this));
+        }
+    };
+
+    HistoryLoadMore.prototype.load = function (e) {
+        jessie.cancelDefault(e);
+
+        var xhr = ma.xhr2();
+
+        xhr.open("GET", this.link.href, true);
+        xhr.setRequestHeader("X-Requested-With", "XMLHttpRequest");
+        xhr.onload = this.update.bind(this, xhr);
+        xhr.send();
+    };
+
+    HistoryLoadMore.prototype.update = function (xhr) {
+        if (xhr.status !== 200) {
+            window.location = this.link.href;
+            return;
+        }
+
+        this.link.parentNode.removeChild(this.link);
+        this.container.insertAdjacentHTML("beforeend", xhr.responseText);
+        this.bindLink();
+    };
+
+    return HistoryLoadMore;
+})(document, jessie);
@@ -0,0 +1,44 @@
+ma.components.MentionCountBadge = (function (doc) {
+    if (!ma.xhr2) {
+        return;
+    }
+
+    function MentionCountBadge(selector) {
+        this.badges = doc.querySelectorAll(selector);
+
+        if (!this.badges.length) {
+            return;
+        }
+
+        this.url = this.badges[0].getAttribute("data-mention-counts-url");
+        this.load();
+    }
+
+    MentionCountBadge.prototype.load = function () {
+        var xhr = ma.xhr2();
+
+        xhr.open("GET", this.url, true);
+        xhr.setRequestHeader("X-Requested-With", "XMLHttpRequest");
+        xhr.onload = this.update.bind(this, xhr);
+        xhr.send();
+    };
+
+    MentionCountBadge.prototype.update = function (xhr) {
+        if (xhr.status !== 200) {
+            return;
+        }
+
+        var counts = JSON.parse(xhr.responseText);
+
+        if (!counts.display_count) {
+            return;
+        }
+
+        for (var i = 0; i < this.badges.length; i++) {
+            this.badges[i].innerText = counts.display_count;
+            this.badges[i].removeAttribute("hidden");
+        }
+    };
+
+    return MentionCountBadge;
+})(document);
@@ -24,6 +24,14 @@ var ma = {
         if (ma.components.Toast) {
             new ma.components.Toast(".toast");
         }
+
+        if (ma.components.MentionCountBadge) {
+            new ma.components.MentionCountBadge(".js-mention-count-badge");
+        }
+
+        if (ma.components.HistoryLoadMore) {
+            new ma.components.HistoryLoadMore(".js-history-items");
+        }
     },
 
     get_csrf_token: function () {
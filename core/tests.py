@@ -1,6 +1,7 @@
 import json
 
 from django.conf import settings
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 from mock import patch
 
@@ -22,6 +23,26 @@ from utils.api.resources import (
     UsersResource,
 )
 
+LOCMEM_CACHES = {
+    **settings.CACHES,
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+}
+
+
+class LocMemCacheMixin:
+    """
+    Runs each test against an empty local memory cache
+    instead of the dummy cache used by the test settings.
+    """
+
+    def setUp(self):
+        cache_settings = override_settings(CACHES=LOCMEM_CACHES)
+        cache_settings.enable()
+        self.addCleanup(cache_settings.disable)
+        cache.clear()
+        self.addCleanup(cache.clear)
+        super().setUp()
+
 
 @override_settings(API_RESULTS_LIMIT=10)
 class MarketAccessTestCase(TestCase):
@@ -235,18 +235,7 @@ class BarrierLocationForm(APIFormMixin, MetadataMixin, forms.Form):
         # Set the choices for the country select box
         self.fields["location_select"].choices = (
             (0, "Choose a location"),
-            (
-                "Trading blocs",
-                tuple([(bloc["code"], bloc["name"]) for bloc in self.trading_blocs]),
-            ),
-            (
-                "Countries",
-                tuple(
-                    (country["id"], country["name"])
-                    for country in self.countries_options
-                ),
-            ),
-        )
+        ) + self.metadata.get_choices("locations")
 
         # Set dictionary to pass to frontend so JS knows which countries need
         # to see trading bloc sections
@@ -281,20 +270,12 @@ class BarrierLocationForm(APIFormMixin, MetadataMixin, forms.Form):
             )
 
         # Create lists for selection dropdowns
-        countries_with_admin_areas = self.metadata.get_countries_with_admin_areas_list()
-        admin_area_choices_dict = {}
-        for admin_area_country in countries_with_admin_areas:
-            admin_areas = self.metadata.get_admin_areas_by_country(
-                admin_area_country["id"]
+        self.admin_area_choices = {
+            "admin_areas_" + country_name: ((0, "Choose an admin area"),) + choices
+            for country_name, choices in self.metadata.get_choices(
+                "admin_areas_by_country"
             )
-            country_name = admin_area_country["name"]
-            field_name = "admin_areas_" + country_name
-
-            admin_area_choices = [(0, "Choose an admin area")] + [
-                (area["id"], area["name"]) for area in admin_areas
-            ]
-            admin_area_choices_dict[field_name] = admin_area_choices
-        self.admin_area_choices = admin_area_choices_dict
+        }
 
     def clean(self):
         cleaned_data = super().clean()
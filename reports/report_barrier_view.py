@@ -1,5 +1,4 @@
 import datetime
-import json
 import logging
 
 from django.http import HttpResponseRedirect, JsonResponse
@@ -25,6 +24,7 @@ from reports.report_barrier_forms import (
     BarrierStatusForm,
     BarrierTradeDirectionForm,
 )
+from reports.session_data import decode_session_data, encode_session_data, get_data_hash
 from utils.api.client import MarketAccessAPIClient
 from utils.metadata import MetadataMixin
 
@@ -117,6 +117,8 @@ class ReportBarrierWizardView(MetadataMixin, NamedUrlSessionWizardView, FormPrev
         "barrier-public-summary": check_public_form_form_display("public_summary"),
     }
 
+    saved_hash_session_key = "report_draft_saved_hash"
+
     def get_template_names(self):
         return [f"reports/{self.steps.current.replace('-', '_')}_wizard_step.html"]
 
@@ -163,7 +165,10 @@ class ReportBarrierWizardView(MetadataMixin, NamedUrlSessionWizardView, FormPrev
                 )
                 self.storage.current_step = self.steps.first
             else:
-                self.storage.data = json.loads(draft_barrier.new_report_session_data)
+                self.storage.data = decode_session_data(session_data)
+                self.set_saved_hash(
+                    str(draft_barrier_id), get_data_hash(self.storage.data)
+                )
 
             return redirect(self.get_step_url(self.steps.current))
 
@@ -259,11 +264,7 @@ class ReportBarrierWizardView(MetadataMixin, NamedUrlSessionWizardView, FormPrev
         context["barrier_id"] = barrier_id
 
         if self.steps.current == "barrier-sectors-affected":
-            sectors = [
-                (sector["id"], sector["name"])
-                for sector in self.metadata.get_sector_list(level=0)
-            ]
-            context.update({"sectors_list": sectors})
+            context.update({"sectors_list": self.metadata.get_choices("sectors")})
 
         if self.steps.current == "barrier-export-type":
 
@@ -281,8 +282,8 @@ class ReportBarrierWizardView(MetadataMixin, NamedUrlSessionWizardView, FormPrev
                     ]
                     commodity_lookup = {
                         commodity.code: commodity
-                        for commodity in self.client.commodities.list(
-                            codes=",".join(hs6_session_codes)
+                        for commodity in self.client.commodities.lookup_many(
+                            hs6_session_codes
                         )
                     }
 
@@ -397,9 +398,9 @@ class ReportBarrierWizardView(MetadataMixin, NamedUrlSessionWizardView, FormPrev
                                 hs6_code = commodity_code[:6].ljust(10, "0")
                                 hs6_codes.append(hs6_code)
 
-                            # Query the api for the full details of the list of 10 digit codes
-                            commodities_details = self.client.commodities.list(
-                                codes=",".join(hs6_codes)
+                            # Look up the full details of the list of 10 digit codes
+                            commodities_details = self.client.commodities.lookup_many(
+                                hs6_codes
                             )
 
                             # Build a context data list, eliminating any duplicates retrieved in the api call
@@ -530,19 +531,33 @@ class ReportBarrierWizardView(MetadataMixin, NamedUrlSessionWizardView, FormPrev
         barrier_title_form = self.get_cleaned_data_for_step("barrier-about")
         if barrier_title_form:
             # Check to see if it is an existing draft barrier/report otherwise create
-            barrier_report = self.get_or_create_barrier()
+            barrier_id = self.get_or_create_barrier_id()
         else:
             # We don't have a barrier title therefore nothing to save
             # Send user to first step
             self.storage.current_step = self.steps.first
             return redirect(self.get_step_url(self.steps.first))
 
+        # Skip the save when no entered data has changed since this session last
+        # saved or loaded the draft, so moving between steps alone doesn't save.
+        # A save of the same draft from another session isn't seen, so it is only
+        # overwritten once the data here changes.
+        data_hash = get_data_hash(self.storage.data)
+        if self.request.session.get(self.saved_hash_session_key) == (
+            f"{barrier_id}:{data_hash}"
+        ):
+            return
+
         # Patch the session data to the barrier/report in the DB
         self.client.reports.patch(
-            id=barrier_report.id,
+            id=barrier_id,
             **barrier_title_form,
-            new_report_session_data=json.dumps(self.storage.data),
+            new_report_session_data=encode_session_data(self.storage.data),
         )
+        self.set_saved_hash(barrier_id, data_hash)
+
+    def set_saved_hash(self, barrier_id, data_hash):
+        self.request.session[self.saved_hash_session_key] = f"{barrier_id}:{data_hash}"
 
     def done(self, form_list, form_dict, **kwargs):
         submitted_values = {}
@@ -628,7 +643,7 @@ class ReportBarrierWizardView(MetadataMixin, NamedUrlSessionWizardView, FormPrev
             # Save progress to the draft barrier in the database
             self.client.reports.patch(
                 id=barrier_report.id,
-                new_report_session_data=json.dumps(self.storage.data),
+                new_report_session_data=encode_session_data(self.storage.data),
                 **submitted_values,
             )
 
@@ -639,6 +654,14 @@ class ReportBarrierWizardView(MetadataMixin, NamedUrlSessionWizardView, FormPrev
             )
         )
 
+    def get_or_create_barrier_id(self) -> str:
+        """
+        Returns the id of the draft barrier without fetching it when it already exists
+        """
+        if barrier_id := self.storage.data.get("meta", {}).get("barrier_id", None):
+            return barrier_id
+        return str(self.get_or_create_barrier().id)
+
     def get_or_create_barrier(self) -> Barrier:
         """
         Gets or creates a new barrier based on the presence of the barrier_id in self.storage.meta
@@ -0,0 +1,58 @@
+import base64
+import hashlib
+import json
+import zlib
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+COMPRESSED_PREFIX = "zlib:"
+
+
+def encode_session_data(data):
+    """
+    Serialises the wizard storage for new_report_session_data,
+    compressing it when REPORT_SESSION_DATA_COMPRESSION is enabled.
+    """
+    encoded = json.dumps(data, cls=DjangoJSONEncoder)
+    if (
+        settings.REPORT_SESSION_DATA_COMPRESSION
+        and len(encoded) >= settings.REPORT_SESSION_DATA_COMPRESS_MIN_SIZE
+    ):
+        compressed = base64.b64encode(zlib.compress(encoded.encode()))
+        return COMPRESSED_PREFIX + compressed.decode()
+    return encoded
+
+
+def decode_session_data(value):
+    """
+    Parses new_report_session_data, whether or not it was compressed.
+    """
+    if value.startswith(COMPRESSED_PREFIX):
+        compressed = base64.b64decode(value[len(COMPRESSED_PREFIX) :])
+        value = zlib.decompress(compressed).decode()
+    return json.loads(value)
+
+
+def is_entered_field(name):
+    """
+    Whether a posted field was entered by the user, rather than
+    being the CSRF token or the wizard's management form.
+    """
+    return name != "csrfmiddlewaretoken" and not name.endswith("-current_step")
+
+
+def get_data_hash(data):
+    """
+    Hash of the data entered in the wizard storage.
+
+    The current step, CSRF tokens and management fields are left out, as
+    they change from one request to the next without the draft changing.
+    """
+    entered_data = {key: value for key, value in data.items() if key != "step"}
+    entered_data["step_data"] = {
+        step: {name: value for name, value in fields.items() if is_entered_field(name)}
+        for step, fields in (data.get("step_data") or {}).items()
+    }
+    encoded = json.dumps(entered_data, cls=DjangoJSONEncoder, sort_keys=True)
+    return hashlib.sha256(encoded.encode()).hexdigest()
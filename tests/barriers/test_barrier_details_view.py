@@ -1,11 +1,16 @@
 from datetime import datetime, timezone
 from http import HTTPStatus
 
+from django.http import Http404
+from django.test import override_settings
 from django.urls import reverse
 from mock import patch
 
 from barriers.models import HistoryItem
-from core.tests import MarketAccessTestCase
+from barriers.views.history import BarrierHistory
+from core.tests import LocMemCacheMixin, MarketAccessTestCase
+from utils.request_cache import get_request_cache
+from utils.tracing import get_request_trace
 
 
 class BarrierViewTestCase(MarketAccessTestCase):
@@ -93,3 +98,129 @@ class BarrierViewTestCase(MarketAccessTestCase):
         expected_history_item_count = 5
         displayed_history_items_count = html.count(top_priority_history_item_class)
         assert expected_history_item_count == displayed_history_items_count
+
+
+class BarrierDetailPrefetchTestCase(MarketAccessTestCase):
+    def test_barrier_data_is_fetched_once(self):
+        response = self.client.get(
+            reverse(
+                "barriers:barrier_detail", kwargs={"barrier_id": self.barrier["id"]}
+            )
+        )
+
+        assert HTTPStatus.OK == response.status_code
+        assert self.mock_get_barrier.call_count == 1
+        assert self.mock_get_estimated_resolution_date_request_patcher.call_count == 1
+        assert self.get_barrier_action_plan.call_count == 1
+        assert self.mock_get_interactions.call_count == 1
+        assert self.mock_get_activity.call_count == 1
+
+    @patch("utils.api.resources.ActionPlanResource.get_barrier_action_plan")
+    def test_prefetch_errors_are_raised_when_used(self, mock_get_action_plan):
+        mock_get_action_plan.side_effect = Http404()
+
+        response = self.client.get(
+            reverse(
+                "barriers:barrier_detail", kwargs={"barrier_id": self.barrier["id"]}
+            )
+        )
+
+        assert HTTPStatus.NOT_FOUND == response.status_code
+
+
+@override_settings(HISTORY_PAGE_SIZE=4)
+@patch("utils.api.resources.BarriersResource.get_full_history")
+class BarrierHistoryPaginationTestCase(LocMemCacheMixin, MarketAccessTestCase):
+    history_item_class = '"history-item"'
+
+    def setUp(self):
+        super().setUp()
+        self.url = reverse(
+            "barriers:history", kwargs={"barrier_id": self.barrier["id"]}
+        )
+
+    def test_first_page(self, mock_history):
+        mock_history.return_value = [HistoryItem(result) for result in self.history]
+
+        response = self.client.get(self.url)
+
+        html = response.content.decode("utf8")
+        assert HTTPStatus.OK == response.status_code
+        assert "9 changes" in html
+        assert html.count(self.history_item_class) == 4
+        assert f"{self.url}?offset=4" in html
+
+    def test_load_more(self, mock_history):
+        mock_history.return_value = [HistoryItem(result) for result in self.history]
+
+        response = self.client.get(
+            f"{self.url}?offset=8", HTTP_X_REQUESTED_WITH="XMLHttpRequest"
+        )
+
+        html = response.content.decode("utf8")
+        assert HTTPStatus.OK == response.status_code
+        assert html.count(self.history_item_class) == 1
+        assert "js-history-load-more" not in html
+        assert "<html" not in html
+        self.mock_get_barrier.assert_not_called()
+
+    def test_load_more_reuses_the_history(self, mock_history):
+        mock_history.return_value = [HistoryItem(result) for result in self.history]
+
+        self.client.get(self.url)
+        response = self.client.get(
+            f"{self.url}?offset=4", HTTP_X_REQUESTED_WITH="XMLHttpRequest"
+        )
+
+        assert response.content.decode("utf8").count(self.history_item_class) == 4
+        mock_history.assert_called_once()
+
+    def test_first_page_is_not_cached(self, mock_history):
+        mock_history.return_value = [HistoryItem(result) for result in self.history]
+
+        self.client.get(self.url)
+        self.client.get(self.url)
+
+        assert mock_history.call_count == 2
+
+    @override_settings(HISTORY_STREAMING_ENABLED=True)
+    def test_streaming(self, mock_history):
+        mock_history.return_value = [HistoryItem(result) for result in self.history]
+
+        response = self.client.get(self.url)
+
+        html = b"".join(response.streaming_content).decode("utf8")
+        assert HTTPStatus.OK == response.status_code
+        assert html.count(self.history_item_class) == 9
+        assert "js-history-load-more" not in html
+        assert html.index("9 changes") < html.index(self.history_item_class)
+        assert html.rstrip().endswith("</html>")
+
+    @override_settings(HISTORY_STREAMING_ENABLED=True)
+    def test_streaming_starts_before_history_is_fetched(self, mock_history):
+        mock_history.return_value = [HistoryItem(result) for result in self.history]
+
+        response = self.client.get(self.url)
+        content = iter(response.streaming_content)
+
+        assert b"<html" in next(content)
+        mock_history.assert_not_called()
+        assert b"9 changes" in next(content)
+        mock_history.assert_called_once()
+
+    @override_settings(HISTORY_STREAMING_ENABLED=True)
+    def test_streamed_items_are_rendered_in_the_request_context(self, mock_history):
+        mock_history.return_value = [HistoryItem(result) for result in self.history]
+        contexts = []
+        get_history_page = BarrierHistory.get_history_page
+
+        def record_context(view, offset=None):
+            contexts.append((get_request_cache(), get_request_trace()))
+            return get_history_page(view, offset)
+
+        with patch.object(BarrierHistory, "get_history_page", record_context):
+            response = self.client.get(self.url)
+            b"".join(response.streaming_content)
+
+        assert len(contexts) == 3
+        assert all(cache and trace for cache, trace in contexts)
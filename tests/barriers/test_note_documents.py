@@ -1,10 +1,13 @@
 from http import HTTPStatus
 
 import mock
+from django.core.cache import cache
+from django.test import override_settings
 from django.urls import reverse
 from mock import patch
 
-from core.tests import MarketAccessTestCase
+from core.tests import LocMemCacheMixin, MarketAccessTestCase
+from utils.api.client import MarketAccessAPIClient
 from utils.exceptions import FileUploadError, ScanError
 
 
@@ -234,3 +237,243 @@ class NoteDocumentsTestCase(MarketAccessTestCase):
             document["id"] for document in self.client.session[session_key]
         ]
         assert session_document_ids == document_ids[1:]
+
+
+@override_settings(DOCUMENT_UPLOAD_ASYNC=True)
+@patch("barriers.forms.mixins.run_in_background", side_effect=lambda f: f())
+@patch("utils.api.client.DocumentsResource.complete_upload")
+@patch("barriers.forms.mixins.DocumentMixin.upload_to_s3")
+@patch("utils.api.client.DocumentsResource.create")
+class BackgroundNoteDocumentsTestCase(LocMemCacheMixin, MarketAccessTestCase):
+    document_id = "38ab3bed-fc19-4770-9c12-9e26667efbc5"
+
+    def upload_document(self):
+        with open("tests/files/attachment.jpeg", "rb") as document:
+            return self.client.post(
+                reverse(
+                    "barriers:add_note_document",
+                    kwargs={"barrier_id": self.barrier["id"]},
+                ),
+                data={"document": document},
+                xhr=True,
+            )
+
+    def get_status(self):
+        return self.client.get(
+            reverse(
+                "barriers:document_upload_status",
+                kwargs={"document_id": self.document_id},
+            )
+        )
+
+    @patch("utils.api.client.DocumentsResource.check_scan_status")
+    def test_add_note_document_in_background(
+        self,
+        mock_check_scan_status,
+        mock_create_document,
+        mock_upload_to_s3,
+        mock_complete_upload,
+        mock_run,
+    ):
+        mock_create_document.return_value = {
+            "id": self.document_id,
+            "signed_upload_url": "someurl",
+        }
+        uploaded = []
+
+        def upload_to_s3(url, document):
+            document.seek(0)
+            uploaded.append(document.read())
+
+        mock_upload_to_s3.side_effect = upload_to_s3
+
+        response = self.upload_document()
+
+        assert response.status_code == HTTPStatus.OK
+        response_data = response.json()
+        assert response_data["documentId"] == self.document_id
+        assert response_data["status_url"] == (f"/documents/{self.document_id}/status/")
+        mock_upload_to_s3.assert_called_with(url="someurl", document=mock.ANY)
+        with open("tests/files/attachment.jpeg", "rb") as document:
+            assert uploaded == [document.read()]
+        mock_check_scan_status.assert_called_with(self.document_id)
+
+        response = self.get_status()
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {"status": "clean", "message": ""}
+
+    @patch("utils.api.client.DocumentsResource.check_scan_status")
+    def test_background_scan_fail(
+        self,
+        mock_check_scan_status,
+        mock_create_document,
+        mock_upload_to_s3,
+        mock_complete_upload,
+        mock_run,
+    ):
+        mock_create_document.return_value = {
+            "id": self.document_id,
+            "signed_upload_url": "someurl",
+        }
+        mock_check_scan_status.side_effect = ScanError("Scan failed")
+
+        response = self.upload_document()
+
+        assert response.status_code == HTTPStatus.OK
+        response = self.get_status()
+        assert response.json() == {"status": "failed", "message": "Scan failed"}
+
+    @patch("utils.api.client.NotesResource.create")
+    def test_unfinished_uploads_are_not_attached(
+        self,
+        mock_create_note,
+        mock_create_document,
+        mock_upload_to_s3,
+        mock_complete_upload,
+        mock_run,
+    ):
+        documents = MarketAccessAPIClient("abcd").documents
+        add_note_url = reverse(
+            "barriers:add_note", kwargs={"barrier_id": self.barrier["id"]}
+        )
+
+        for status, message in (
+            (documents.UPLOAD_PENDING, "The selected file is still being uploaded"),
+            (documents.UPLOAD_FAILED, "Scan failed"),
+        ):
+            documents.set_upload_status(self.document_id, status, "Scan failed")
+            response = self.client.post(
+                add_note_url,
+                data={"note": "New note", "document_ids": [self.document_id]},
+            )
+
+            assert response.status_code == HTTPStatus.OK
+            assert message in response.context["form"].errors["document"][0]
+        mock_create_note.assert_not_called()
+
+        documents.set_upload_status(self.document_id, documents.UPLOAD_CLEAN)
+        response = self.client.post(
+            add_note_url, data={"note": "New note", "document_ids": [self.document_id]}
+        )
+        assert response.status_code == HTTPStatus.FOUND
+        mock_create_note.assert_called_once()
+
+    @patch("utils.api.client.NotesResource.create")
+    def test_expired_background_uploads_are_not_attached(
+        self,
+        mock_create_note,
+        mock_create_document,
+        mock_upload_to_s3,
+        mock_complete_upload,
+        mock_run,
+    ):
+        mock_create_document.return_value = {
+            "id": self.document_id,
+            "signed_upload_url": "someurl",
+        }
+        with patch("utils.api.client.DocumentsResource.check_scan_status"):
+            self.upload_document()
+        cache.clear()
+
+        response = self.client.post(
+            reverse("barriers:add_note", kwargs={"barrier_id": self.barrier["id"]}),
+            data={"note": "New note", "document_ids": [self.document_id]},
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert "could not be uploaded" in response.context["form"].errors["document"][0]
+        mock_create_note.assert_not_called()
+
+    def test_cancelled_background_uploads_are_removed_from_the_session(
+        self,
+        mock_create_document,
+        mock_upload_to_s3,
+        mock_complete_upload,
+        mock_run,
+    ):
+        mock_create_document.return_value = {
+            "id": self.document_id,
+            "signed_upload_url": "someurl",
+        }
+        session_key = f"barrier:{self.barrier['id']}:note:new:documents"
+        with patch("utils.api.client.DocumentsResource.check_scan_status"):
+            self.upload_document()
+        assert self.client.session[session_key][0]["background_upload"] is True
+
+        self.client.get(
+            reverse(
+                "barriers:cancel_note_document",
+                kwargs={"barrier_id": self.barrier["id"]},
+            )
+        )
+
+        assert session_key not in self.client.session
+
+    @override_settings(DOCUMENT_UPLOAD_PENDING_TIMEOUT=60)
+    def test_abandoned_upload_is_failed(
+        self,
+        mock_create_document,
+        mock_upload_to_s3,
+        mock_complete_upload,
+        mock_run,
+    ):
+        documents = MarketAccessAPIClient("abcd").documents
+        with patch("utils.api.resources.time.time", return_value=1000):
+            documents.set_upload_status(self.document_id, documents.UPLOAD_PENDING)
+
+        with patch("utils.api.resources.time.time", return_value=1030):
+            assert self.get_status().json()["status"] == documents.UPLOAD_PENDING
+        with patch("utils.api.resources.time.time", return_value=1061):
+            assert self.get_status().json()["status"] == documents.UPLOAD_FAILED
+
+    def test_unknown_upload_status(
+        self,
+        mock_create_document,
+        mock_upload_to_s3,
+        mock_complete_upload,
+        mock_run,
+    ):
+        response = self.get_status()
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+class ScanStatusTestCase(MarketAccessTestCase):
+    @override_settings(
+        FILE_SCAN_STATUS_CHECK_INTERVAL=500,
+        FILE_SCAN_MAX_CHECK_INTERVAL=2000,
+    )
+    @patch("utils.api.resources.time.sleep")
+    @patch("utils.api.client.MarketAccessAPIClient.post")
+    def test_scan_is_polled_with_backoff(self, mock_post, mock_sleep):
+        mock_post.side_effect = [{"status": "virus_scanning"}] * 4 + [
+            {"status": "virus_scanned", "av_clean": True}
+        ]
+
+        MarketAccessAPIClient("token").documents.check_scan_status("1")
+
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [
+            0.5,
+            1,
+            2,
+            2,
+        ]
+
+
+class UploadSizeLimitTestCase(MarketAccessTestCase):
+    @override_settings(FILE_UPLOAD_MAX_REQUEST_SIZE=1024)
+    @patch("utils.api.client.DocumentsResource.create")
+    def test_large_upload_is_rejected_before_reading(self, mock_create_document):
+        with open("tests/files/attachment.jpeg", "rb") as document:
+            response = self.client.post(
+                reverse(
+                    "barriers:add_note_document",
+                    kwargs={"barrier_id": self.barrier["id"]},
+                ),
+                data={"document": document},
+                HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+            )
+
+        assert response.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+        assert "must be smaller than" in response.json()["message"]
+        assert mock_create_document.called is False
@@ -2,11 +2,13 @@ import logging
 from http import HTTPStatus
 
 from django.conf import settings
+from django.test import override_settings
 from django.urls import reverse
 from mock import patch
 
 from barriers.models import Barrier, SavedSearch
-from core.tests import MarketAccessTestCase
+from core.tests import LocMemCacheMixin, MarketAccessTestCase
+from utils.api.client import MarketAccessAPIClient
 from utils.metadata import get_metadata
 from utils.models import ModelList
 
@@ -678,3 +680,81 @@ class SearchTestCase(MarketAccessTestCase):
             archived="0",
             only_main_sector=True,
         )
+
+
+class SearchCacheTestCase(LocMemCacheMixin, MarketAccessTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = patch("utils.api.resources.BarriersResource.list")
+        self.mock_list = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_list.return_value = ModelList(
+            model=Barrier, data=[self.barrier], total_count=25
+        )
+
+    def test_repeated_search_is_cached(self):
+        self.client.get(reverse("barriers:search"), data={"search": "Test"})
+        response = self.client.get(reverse("barriers:search"), data={"search": "Test"})
+
+        assert response.status_code == HTTPStatus.OK
+        assert self.mock_list.call_count == 1
+        assert response.context["barriers"].total_count == 25
+
+    def test_empty_params_share_a_cache_key(self):
+        resource = MarketAccessAPIClient("token").barriers
+
+        assert resource.get_search_cache_key(
+            limit=10, offset=0, search=""
+        ) == resource.get_search_cache_key(offset=0, limit=10)
+        assert resource.get_search_cache_key(
+            limit=10, offset=0
+        ) != resource.get_search_cache_key(limit=10, offset=10)
+
+    def test_searches_are_not_shared_between_users(self):
+        MarketAccessAPIClient("token").barriers.list_cached(limit=10)
+        MarketAccessAPIClient("other").barriers.list_cached(limit=10)
+
+        assert self.mock_list.call_count == 2
+
+    @patch("utils.api.client.get_session")
+    def test_edit_clears_cached_searches(self, mock_get_session):
+        mock_get_session.return_value.request.return_value.json.return_value = (
+            self.barrier
+        )
+        client = MarketAccessAPIClient("token")
+        client.barriers.list_cached(limit=10)
+
+        client.barriers.patch(id=self.barrier["id"], title="New title")
+        client.barriers.list_cached(limit=10)
+
+        assert self.mock_list.call_count == 2
+
+    @patch("utils.api.client.get_session")
+    def test_document_scan_check_keeps_cached_searches(self, mock_get_session):
+        mock_get_session.return_value.request.return_value.json.return_value = {
+            "status": "virus_scanning"
+        }
+        client = MarketAccessAPIClient("token")
+        client.barriers.list_cached(limit=10)
+
+        client.documents.get_scan_status("38ab3bed-fc19-4770-9c12-9e26667efbc5")
+        client.barriers.list_cached(limit=10)
+
+        assert self.mock_list.call_count == 1
+
+    @override_settings(BARRIER_SEARCH_PREFETCH_NEXT_PAGE=True)
+    @patch("utils.api.resources.run_in_background", side_effect=lambda f: f())
+    def test_next_page_is_prefetched(self, mock_run):
+        barriers = MarketAccessAPIClient("token").barriers
+        barriers.list_cached(limit=10, offset=0)
+        barriers.list_cached(limit=10, offset=10)
+
+        self.mock_list.assert_called_with(limit=10, offset=20)
+        assert self.mock_list.call_count == 3
+
+    @override_settings(BARRIER_SEARCH_PREFETCH_NEXT_PAGE=True)
+    @patch("utils.api.resources.run_in_background")
+    def test_last_page_is_not_prefetched(self, mock_run):
+        MarketAccessAPIClient("token").barriers.list_cached(limit=10, offset=20)
+
+        mock_run.assert_not_called()
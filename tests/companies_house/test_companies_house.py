@@ -12,7 +12,7 @@ from companies_house.dataclasses import (
     CompanyHouseSearchResultItem,
 )
 from core.filecache import memfiles
-from core.tests import MarketAccessTestCase
+from core.tests import LocMemCacheMixin, MarketAccessTestCase
 
 
 class CompaniesHouseTestCase(MarketAccessTestCase):
@@ -167,7 +167,7 @@ class CompaniesHouseTestCase(MarketAccessTestCase):
 
         return MockResponse(None, 404)
 
-    @mock.patch("requests.get", side_effect=search_mocked_requests_get)
+    @mock.patch("requests.Session.get", side_effect=search_mocked_requests_get)
     def test_get_successful_search_result(self, mock_get):
         """
         Check a successful search returns a company search result with full details
@@ -184,7 +184,7 @@ class CompaniesHouseTestCase(MarketAccessTestCase):
         assert isinstance(result_item, CompanyHouseSearchResultItem)
         assert result_item.title == "COMPANY WITH FULL DETAILS"
 
-    @mock.patch("requests.get", side_effect=search_mocked_requests_get)
+    @mock.patch("requests.Session.get", side_effect=search_mocked_requests_get)
     @mock.patch("sentry_sdk.capture_message")
     def test_get_search_result_missing_required_fields(self, mock_alert, mock_get):
         """
@@ -209,7 +209,7 @@ class CompaniesHouseTestCase(MarketAccessTestCase):
         assert isinstance(result_item, CompanyHouseSearchResultItem)
         assert result_item.title == "COMPANY WITH FULL DETAILS"
 
-    @mock.patch("requests.get", side_effect=search_mocked_requests_get)
+    @mock.patch("requests.Session.get", side_effect=search_mocked_requests_get)
     @mock.patch("sentry_sdk.capture_message")
     def test_get_search_result_fields_incorrectly_formatted(self, mock_alert, mock_get):
         """
@@ -234,7 +234,7 @@ class CompaniesHouseTestCase(MarketAccessTestCase):
         assert isinstance(result_item, CompanyHouseSearchResultItem)
         assert result_item.title == "COMPANY WITH FULL DETAILS"
 
-    @mock.patch("requests.get", side_effect=search_mocked_requests_get)
+    @mock.patch("requests.Session.get", side_effect=search_mocked_requests_get)
     @mock.patch("sentry_sdk.capture_message")
     def test_get_search_result_extra_field(self, mock_alert, mock_get):
         """
@@ -259,7 +259,7 @@ class CompaniesHouseTestCase(MarketAccessTestCase):
         assert isinstance(result_item, CompanyHouseSearchResultItem)
         assert result_item.title == "COMPANY WITH FULL DETAILS"
 
-    @mock.patch("requests.get", side_effect=search_mocked_requests_get)
+    @mock.patch("requests.Session.get", side_effect=search_mocked_requests_get)
     @mock.patch("sentry_sdk.capture_message")
     def test_get_search_result_incorrect_subtype(self, mock_alert, mock_get):
         """
@@ -284,7 +284,7 @@ class CompaniesHouseTestCase(MarketAccessTestCase):
         assert isinstance(result_item, CompanyHouseSearchResultItem)
         assert result_item.title == "COMPANY WITH FULL DETAILS"
 
-    @mock.patch("requests.get", side_effect=search_mocked_requests_get)
+    @mock.patch("requests.Session.get", side_effect=search_mocked_requests_get)
     def test_get_successful_search_result_required_fields_only(self, mock_get):
         """
         Check a successful search returns a company search result with required details
@@ -301,7 +301,7 @@ class CompaniesHouseTestCase(MarketAccessTestCase):
         assert isinstance(result_item, CompanyHouseSearchResultItem)
         assert result_item.title == "COMPANY WITH REQUIRED DETAILS"
 
-    @mock.patch("requests.get", side_effect=get_company_mocked_requests_get)
+    @mock.patch("requests.Session.get", side_effect=get_company_mocked_requests_get)
     def test_get_company_success(self, mock_get):
         """
         Check a successful response for the get company request
@@ -317,7 +317,7 @@ class CompaniesHouseTestCase(MarketAccessTestCase):
         assert isinstance(result, CompanyHouseCompany)
         assert result.company_name == "FULL DETAILS"
 
-    @mock.patch("requests.get", side_effect=get_company_mocked_requests_get)
+    @mock.patch("requests.Session.get", side_effect=get_company_mocked_requests_get)
     def test_get_company_missing_field(self, mock_get):
         """
         Check a error triggeres for the company missing required field
@@ -336,7 +336,7 @@ class CompaniesHouseTestCase(MarketAccessTestCase):
             in str(error_triggered)
         )
 
-    @mock.patch("requests.get", side_effect=get_company_mocked_requests_get)
+    @mock.patch("requests.Session.get", side_effect=get_company_mocked_requests_get)
     def test_get_company_required_fields_only(self, mock_get):
         """
         Check a successful response for companies missing optional fields
@@ -351,3 +351,48 @@ class CompaniesHouseTestCase(MarketAccessTestCase):
 
         assert isinstance(result, CompanyHouseCompany)
         assert result.company_name == "CRUCIAL DETAILS"
+
+
+class CompaniesHouseCacheTestCase(LocMemCacheMixin, MarketAccessTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client_obj = CompaniesHouseAPIClient(
+            api_endpoint="success_test_endpoint",
+            api_key="An API Key",  # pragma: allowlist secret
+        )
+
+    @mock.patch(
+        "requests.Session.get",
+        side_effect=CompaniesHouseTestCase.get_company_mocked_requests_get,
+    )
+    def test_company_is_cached(self, mock_get):
+        self.client_obj.get_company_from_id("1")
+        result = self.client_obj.get_company_from_id("1")
+
+        assert result.company_name == "FULL DETAILS"
+        assert mock_get.call_count == 1
+
+    @mock.patch(
+        "requests.Session.get",
+        side_effect=CompaniesHouseTestCase.search_mocked_requests_get,
+    )
+    def test_equivalent_searches_are_cached(self, mock_get):
+        self.client_obj.search_companies("Test  Company", 100, True)
+        result = self.client_obj.search_companies(" test company", 100, True)
+
+        assert len(result["items"]) == 1
+        assert mock_get.call_count == 1
+        assert mock_get.call_args.kwargs["params"] == {
+            "q": "test company",
+            "items_per_page": 100,
+        }
+
+    @mock.patch("requests.Session.get")
+    def test_errors_are_not_cached(self, mock_get):
+        mock_get.return_value.status_code = 500
+        mock_get.return_value.json.return_value = {"errors": []}
+
+        self.client_obj.search_companies("test", 100, True)
+        self.client_obj.search_companies("test", 100, True)
+
+        assert mock_get.call_count == 2
@@ -0,0 +1,140 @@
+from types import SimpleNamespace
+
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from mock import patch
+
+from core.tests import MarketAccessTestCase
+from reports.models import Report
+from reports.report_barrier_view import ReportBarrierWizardView
+from reports.session_data import decode_session_data, encode_session_data, get_data_hash
+from utils.api.client import MarketAccessAPIClient
+
+ABOUT_DATA = {"title": "A barrier", "summary": "Barrier summary"}
+
+
+class SessionDataTestCase(TestCase):
+    def setUp(self):
+        self.data = {
+            "step": "barrier-status",
+            "step_data": {"barrier-about": {"barrier-about-title": ["A barrier"]}},
+        }
+
+    def test_uncompressed_data_is_json(self):
+        encoded = encode_session_data(self.data)
+
+        assert encoded.startswith("{")
+        assert decode_session_data(encoded) == self.data
+
+    @override_settings(
+        REPORT_SESSION_DATA_COMPRESSION=True, REPORT_SESSION_DATA_COMPRESS_MIN_SIZE=0
+    )
+    def test_compressed_data(self):
+        encoded = encode_session_data(self.data)
+
+        assert encoded.startswith("zlib:")
+        assert decode_session_data(encoded) == self.data
+
+    def test_hash_ignores_step_and_management_fields(self):
+        data_hash = get_data_hash(self.data)
+        self.data["step"] = "barrier-location"
+        self.data["step_data"]["barrier-about"].update(
+            {
+                "csrfmiddlewaretoken": ["new-token"],
+                "report_barrier_wizard_view-current_step": ["barrier-about"],
+            }
+        )
+
+        assert get_data_hash(self.data) == data_hash
+
+        self.data["step_data"]["barrier-about"]["barrier-about-title"] = ["Changed"]
+        assert get_data_hash(self.data) != data_hash
+
+
+@patch(
+    "reports.report_barrier_view.ReportBarrierWizardView.get_cleaned_data_for_step",
+    return_value=ABOUT_DATA,
+)
+@patch("utils.api.resources.ReportsResource.patch")
+class SaveReportProgressTestCase(TestCase):
+    def setUp(self):
+        self.view = ReportBarrierWizardView()
+        self.view.request = RequestFactory().get("/")
+        self.view.request.session = {}
+        self.view.client = MarketAccessAPIClient()
+        self.view.storage = SimpleNamespace(
+            data={
+                "step": "barrier-status",
+                "step_data": {"barrier-about": {"barrier-about-title": ["A barrier"]}},
+                "meta": {"barrier_id": "123"},
+            }
+        )
+
+    def test_unchanged_data_is_not_saved_again(self, mock_patch, mock_cleaned_data):
+        self.view.save_report_progress()
+        self.view.save_report_progress()
+
+        mock_patch.assert_called_once()
+        assert mock_patch.call_args.kwargs["title"] == "A barrier"
+        saved_data = mock_patch.call_args.kwargs["new_report_session_data"]
+        assert decode_session_data(saved_data) == self.view.storage.data
+
+    def test_changed_data_is_saved(self, mock_patch, mock_cleaned_data):
+        self.view.save_report_progress()
+        self.view.storage.data["step_data"]["barrier-status"] = {
+            "barrier-status-status": ["2"]
+        }
+        self.view.save_report_progress()
+
+        assert mock_patch.call_count == 2
+        assert mock_patch.call_args.kwargs["id"] == "123"
+        assert mock_patch.call_args.kwargs["title"] == "A barrier"
+
+    def test_only_the_overall_hash_is_kept(self, mock_patch, mock_cleaned_data):
+        self.view.save_report_progress()
+
+        saved_hash = self.view.request.session[self.view.saved_hash_session_key]
+        assert isinstance(saved_hash, str)
+        assert saved_hash.startswith("123:")
+
+
+@patch("utils.api.resources.ReportsResource.patch")
+@patch("utils.api.resources.ReportsResource.create")
+class SaveReportProgressFlowTestCase(MarketAccessTestCase):
+    def post_about_step(self, csrf_token):
+        return self.client.post(
+            reverse(
+                "reports:report-barrier-wizard-step", kwargs={"step": "barrier-about"}
+            ),
+            data={
+                "csrfmiddlewaretoken": csrf_token,
+                "report_barrier_wizard_view-current_step": "barrier-about",
+                "barrier-about-title": "A barrier",
+                "barrier-about-summary": "Barrier summary",
+            },
+        )
+
+    def test_resubmitting_a_step_unchanged_is_not_saved_again(
+        self, mock_create, mock_patch
+    ):
+        mock_create.return_value = Report({"id": "123"})
+        status_url = reverse(
+            "reports:report-barrier-wizard-step", kwargs={"step": "barrier-status"}
+        )
+        self.client.get(reverse("reports:report-barrier-wizard") + "?reset=true")
+
+        response = self.post_about_step("first-token")
+        assert response.url == status_url
+        self.client.get(status_url)
+        assert mock_patch.call_count == 1
+
+        self.client.get(
+            reverse(
+                "reports:report-barrier-wizard-step", kwargs={"step": "barrier-about"}
+            )
+        )
+        self.post_about_step("second-token")
+        self.client.get(status_url)
+
+        assert mock_patch.call_count == 1
+        assert mock_patch.call_args.kwargs["title"] == "A barrier"
@@ -1,9 +1,11 @@
 from http import HTTPStatus
 from unittest.mock import patch
 
+from django.test import override_settings
 from django.urls import reverse
 
-from core.tests import MarketAccessTestCase
+from core.tests import LocMemCacheMixin, MarketAccessTestCase
+from utils.api.client import MarketAccessAPIClient
 from utils.api.resources import UserMentionCountsResource
 
 
@@ -66,3 +68,45 @@ class MentionsTestCase(MarketAccessTestCase):
             '<span class="govuk-tag ma-badge ma-badge--attention new-mention-count">10</span>'
             in html
         )
+
+
+class MentionCountsCacheTestCase(LocMemCacheMixin, MarketAccessTestCase):
+    def setUp(self):
+        super().setUp()
+        self.mock_get_user_mention_counts.return_value = (
+            UserMentionCountsResource.model({"read_by_recipient": 2, "total": 5})
+        )
+
+    def test_counts_are_cached_between_pages(self):
+        self.client.get(reverse("reports:new_report"))
+        response = self.client.get(reverse("reports:new_report"))
+
+        assert self.mock_get_user_mention_counts.call_count == 1
+        assert response.context["user_mention_counts"]["display_count"] == 3
+
+    @patch("utils.api.client.MarketAccessAPIClient.get")
+    def test_marking_as_read_clears_cached_counts(self, mock_get):
+        client = MarketAccessAPIClient("abcd")
+        client.user_mention_counts.get_cached()
+
+        client.mentions.mark_as_read(1)
+        client.user_mention_counts.get_cached()
+
+        assert self.mock_get_user_mention_counts.call_count == 2
+
+    @override_settings(MENTION_COUNTS_ASYNC=True)
+    def test_async_badge(self):
+        response = self.client.get(reverse("reports:new_report"))
+
+        self.mock_get_user_mention_counts.assert_not_called()
+        html = response.content.decode("utf8")
+        assert 'data-mention-counts-url="/mentions/counts/"' in html
+
+        response = self.client.get(reverse("users:mention_counts"))
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {
+            "total": 5,
+            "read_by_recipient": 2,
+            "display_count": 3,
+        }
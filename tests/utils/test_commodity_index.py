@@ -0,0 +1,138 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+from mock import patch
+
+from barriers.models import Commodity
+from core.tests import LocMemCacheMixin
+from utils.api.client import MarketAccessAPIClient
+from utils.commodity_index import (
+    COMMODITY_INDEX_KEY,
+    SUPERSEDED_INDEX_TIMEOUT,
+    CommodityIndex,
+    get_commodity_index,
+    normalise_commodity_code,
+    store_commodity_index,
+)
+from utils.models import ModelList
+
+CHEESE = {"code": "0406000000", "description": "Cheese and curd"}
+FRESH_CHEESE = {"code": "0406100000", "description": "Fresh cheese"}
+GRATED_CHEESE = {"code": "0406200000", "description": "Grated cheese"}
+ICE_CREAM = {"code": "2105000000", "description": "Ice cream"}
+
+
+class CommodityIndexTestCase(TestCase):
+    def setUp(self):
+        self.index = CommodityIndex([ICE_CREAM, GRATED_CHEESE, CHEESE, FRESH_CHEESE])
+
+    def test_normalise_commodity_code(self):
+        assert normalise_commodity_code("0406.10") == "0406100000"
+        assert normalise_commodity_code("2105001234") == "2105000000"
+
+    def test_get(self):
+        assert self.index.get("2105000000")["code_display"] == "21.05"
+        assert self.index.get("2106000000") is None
+
+    def test_get_many(self):
+        found, missing = self.index.get_many(["0406100000", "2106000000", "0406100000"])
+
+        assert found == [self.index.get("0406100000")]
+        assert missing == ["2106000000"]
+
+
+class CommodityLookupTestCase(LocMemCacheMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = MarketAccessAPIClient("token")
+
+    @patch("utils.api.resources.CommoditiesResource.list")
+    def test_indexed_codes_are_not_fetched(self, mock_list):
+        store_commodity_index([CHEESE, ICE_CREAM])
+
+        commodities = self.client.commodities.lookup_many(["0406", "2105.00"])
+
+        assert [commodity.code for commodity in commodities] == [
+            "0406000000",
+            "2105000000",
+        ]
+        assert commodities[1].code_display == "21.05"
+        mock_list.assert_not_called()
+
+    @patch("utils.api.resources.CommoditiesResource.list")
+    def test_only_unknown_codes_are_fetched(self, mock_list):
+        store_commodity_index([CHEESE])
+        mock_list.return_value = ModelList(Commodity, [ICE_CREAM], 1)
+
+        commodities = self.client.commodities.lookup_many(["0406", "2105"])
+        assert len(commodities) == 2
+        mock_list.assert_called_once_with(codes="2105000000")
+
+        self.client.commodities.lookup_many(["2105"])
+        assert mock_list.call_count == 1
+
+    @patch("utils.api.resources.CommoditiesResource.get")
+    def test_lookup_is_cached(self, mock_get):
+        mock_get.return_value = Commodity(ICE_CREAM)
+
+        assert self.client.commodities.lookup("2105").code == "2105000000"
+        assert self.client.commodities.lookup("2105").code == "2105000000"
+        mock_get.assert_called_once_with(id="2105000000")
+
+    @patch("utils.api.resources.CommoditiesResource.get")
+    def test_new_version_replaces_index(self, mock_get):
+        store_commodity_index([ICE_CREAM])
+        assert self.client.commodities.lookup("2105").description == "Ice cream"
+
+        store_commodity_index([{**ICE_CREAM, "description": "Ice cream, other"}])
+        commodity = self.client.commodities.lookup("2105")
+
+        assert commodity.description == "Ice cream, other"
+        mock_get.assert_not_called()
+
+    @patch("utils.commodity_index.cache.touch")
+    def test_previous_version_expires(self, mock_touch):
+        first_version = store_commodity_index([ICE_CREAM])
+        store_commodity_index([ICE_CREAM])
+
+        mock_touch.assert_called_once_with(
+            COMMODITY_INDEX_KEY.format(version=first_version),
+            SUPERSEDED_INDEX_TIMEOUT,
+        )
+
+
+@override_settings(COMMODITY_INDEX_API_TOKEN="token")
+@patch("utils.api.resources.CommoditiesResource.list")
+class PrewarmCommodityIndexTestCase(LocMemCacheMixin, TestCase):
+    def test_index_is_stored(self, mock_list):
+        mock_list.return_value = ModelList(Commodity, [CHEESE, ICE_CREAM], 2)
+
+        call_command("prewarm_commodity_index", stdout=StringIO())
+
+        assert get_commodity_index()[1].get("2105000000")["description"] == (
+            "Ice cream"
+        )
+
+    @patch("barriers.management.commands.prewarm_commodity_index.PAGE_SIZE", 2)
+    def test_every_page_is_fetched(self, mock_list):
+        mock_list.side_effect = [
+            ModelList(Commodity, [CHEESE, FRESH_CHEESE], 3),
+            ModelList(Commodity, [ICE_CREAM], 3),
+        ]
+
+        call_command("prewarm_commodity_index", stdout=StringIO())
+
+        assert mock_list.call_args_list[1].kwargs == {"limit": 2, "offset": 2}
+        assert len(get_commodity_index()[1]) == 3
+
+    def test_incomplete_list_is_rejected(self, mock_list):
+        mock_list.side_effect = [
+            ModelList(Commodity, [CHEESE], 2),
+            ModelList(Commodity, [], 2),
+        ]
+
+        with self.assertRaisesMessage(CommandError, "Only 1 of 2 commodities"):
+            call_command("prewarm_commodity_index", stdout=StringIO())
+
+        assert get_commodity_index()[0] is None
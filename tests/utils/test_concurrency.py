@@ -0,0 +1,118 @@
+import contextvars
+import threading
+import time
+
+from django.test import TestCase, override_settings
+
+from utils.concurrency import (
+    Failure,
+    coalesce,
+    iterate_in_context,
+    run_concurrently,
+    unwrap,
+)
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+class RunConcurrentlyTestCase(TestCase):
+    """
+    Test running independent tasks concurrently
+    """
+
+    def test_returns_results_by_name(self):
+        results = run_concurrently({"one": lambda: 1, "two": lambda: 2})
+        assert results == {"one": 1, "two": 2}
+
+    def test_exceptions_are_captured(self):
+        def fail():
+            raise ValueError("Oops")
+
+        results = run_concurrently({"ok": lambda: "ok", "fail": fail})
+        assert results["ok"] == "ok"
+        assert isinstance(results["fail"], Failure)
+        with self.assertRaisesMessage(ValueError, "Oops"):
+            unwrap(results["fail"])
+
+    def test_tasks_run_concurrently(self):
+        barrier = threading.Barrier(3, timeout=2)
+
+        def wait():
+            # Would time out if the tasks were run one after another
+            barrier.wait()
+            return True
+
+        results = run_concurrently({"a": wait, "b": wait, "c": wait})
+        assert results == {"a": True, "b": True, "c": True}
+
+    @override_settings(API_CONCURRENT_REQUESTS_ENABLED=False)
+    def test_tasks_run_serially_when_disabled(self):
+        thread_ids = run_concurrently(
+            {"a": threading.get_ident, "b": threading.get_ident}
+        )
+        assert thread_ids["a"] == thread_ids["b"] == threading.get_ident()
+
+    def test_tasks_see_callers_context(self):
+        request_id.set("abc")
+
+        def get_request_id():
+            time.sleep(0.01)
+            return request_id.get()
+
+        results = run_concurrently({"a": get_request_id, "b": get_request_id})
+        assert results == {"a": "abc", "b": "abc"}
+
+
+class CoalesceTestCase(TestCase):
+    """
+    Test identical calls in flight at the same time are only made once
+    """
+
+    def test_concurrent_calls_share_a_result(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "result"
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(coalesce("k", slow)))
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=lambda: results.append(coalesce("k", slow)))
+        follower.start()
+        time.sleep(0.05)
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        assert results == ["result", "result"]
+        assert len(calls) == 1
+
+    def test_later_calls_are_made_again(self):
+        assert coalesce("k", lambda: 1) == 1
+        assert coalesce("k", lambda: 2) == 2
+
+    def test_exceptions_are_raised(self):
+        def fail():
+            raise ValueError("Oops")
+
+        with self.assertRaisesMessage(ValueError, "Oops"):
+            coalesce("k", fail)
+
+
+class IterateInContextTestCase(TestCase):
+    def test_items_are_produced_in_the_callers_context(self):
+        def get_request_ids():
+            for _ in range(2):
+                yield request_id.get()
+
+        token = request_id.set("abc")
+        items = iterate_in_context(get_request_ids())
+        request_id.reset(token)
+
+        assert list(items) == ["abc", "abc"]
@@ -0,0 +1,58 @@
+from django.template import Context, Template
+from django.test import RequestFactory
+from mock import patch
+
+from core.tests import MarketAccessTestCase
+from utils.context_processors import user_mention_counts, user_scope
+from utils.tracing import end_request_trace, get_request_trace, start_request_trace
+
+
+class LazyContextProcessorsTestCase(MarketAccessTestCase):
+    def get_request(self):
+        request = RequestFactory().get("/")
+        request.session = self.client.session
+        return request
+
+    @patch("utils.context_processors.get_mention_counts")
+    @patch("utils.context_processors.get_user")
+    def test_values_are_not_fetched_when_unused(self, mock_get_user, mock_counts):
+        request = self.get_request()
+        context = {**user_scope(request), **user_mention_counts(request)}
+
+        Template("<p>Partial</p>").render(Context(context))
+
+        mock_get_user.assert_not_called()
+        mock_counts.assert_not_called()
+
+    @patch("utils.context_processors.get_user")
+    def test_value_is_fetched_once_when_used(self, mock_get_user):
+        mock_get_user.return_value = self.current_user
+        context = user_scope(self.get_request())
+
+        html = Template(
+            "{{ current_user.first_name }} {{ current_user.last_name }}"
+        ).render(Context(context))
+
+        assert html == f"{self.current_user.first_name} {self.current_user.last_name}"
+        mock_get_user.assert_called_once()
+
+    def test_mention_counts_are_fetched_when_used(self):
+        context = user_mention_counts(self.get_request())
+
+        assert context["user_mention_counts"]["display_count"] == 0
+        self.mock_get_user_mention_counts.assert_called_once()
+
+    @patch("utils.context_processors.get_mention_counts")
+    @patch("utils.context_processors.get_user")
+    def test_resolved_values_are_traced(self, mock_get_user, mock_counts):
+        token = start_request_trace()
+        self.addCleanup(end_request_trace, token)
+        mock_get_user.return_value = self.current_user
+        request = self.get_request()
+        context = {**user_scope(request), **user_mention_counts(request)}
+
+        Template("{{ current_user.first_name }}").render(Context(context))
+
+        fields = get_request_trace().fields
+        assert fields["lazy_current_user"] == 1
+        assert "lazy_user_mention_counts" not in fields
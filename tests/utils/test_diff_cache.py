@@ -0,0 +1,120 @@
+import itertools
+
+from django.test import TestCase, override_settings
+from mock import patch
+
+from barriers.models.history.base import GenericHistoryItem
+from core.tests import LocMemCacheMixin
+from utils.diff import diff_match_patch
+from utils.diff_cache import (
+    TOO_LARGE_TO_DIFF,
+    compute_diff_html,
+    get_diff_cache_key,
+    get_diff_html,
+)
+from utils.tracing import end_request_trace, get_request_trace, start_request_trace
+
+
+class DiffCacheTestCase(LocMemCacheMixin, TestCase):
+    def test_diff_html(self):
+        diff_html = get_diff_html("Old summary", "New summary")
+
+        assert diff_html == compute_diff_html("Old summary", "New summary")[0]
+        assert "<del" in diff_html and "<ins" in diff_html
+
+    @patch("utils.diff_cache.compute_diff_html", wraps=compute_diff_html)
+    def test_identical_changes_are_computed_once(self, mock_compute):
+        first = get_diff_html("Old summary", "New summary")
+        second = get_diff_html("Old summary", "New summary")
+        get_diff_html("Old summary", "Other summary")
+
+        assert first == second
+        assert mock_compute.call_count == 2
+
+    def test_diffs_are_traced(self):
+        token = start_request_trace()
+        self.addCleanup(end_request_trace, token)
+
+        get_diff_html("Old summary", "New summary")
+        get_diff_html("Old summary", "New summary")
+
+        request_trace = get_request_trace()
+        assert request_trace.get_totals()["diff"][0] == 1
+        assert request_trace.fields["history_diff_cache_hits"] == 1
+        assert request_trace.fields["history_diff_cache_misses"] == 1
+
+    @patch(
+        "utils.diff_cache.compute_diff_html",
+        return_value=(f"<em>{TOO_LARGE_TO_DIFF}</em>", True),
+    )
+    def test_timed_out_diff_is_not_cached(self, mock_compute):
+        get_diff_html("Old summary", "New summary")
+        get_diff_html("Old summary", "New summary")
+
+        assert mock_compute.call_count == 2
+
+    def test_cache_key_depends_on_settings(self):
+        key = get_diff_cache_key("Old summary", "New summary")
+
+        with override_settings(HISTORY_DIFF_MAX_LENGTH=10):
+            assert get_diff_cache_key("Old summary", "New summary") != key
+
+    @patch("barriers.models.history.base.get_diff_html")
+    def test_history_item_diff_is_memoised(self, mock_get_diff):
+        mock_get_diff.return_value = "<ins>New</ins>"
+        item = GenericHistoryItem({"old_value": None, "new_value": "New"})
+
+        assert item.diff == "<ins>New</ins>"
+        assert item.diff == "<ins>New</ins>"
+        mock_get_diff.assert_called_once_with(None, "New")
+
+
+class ComputeDiffTestCase(TestCase):
+    def test_words_are_diffed(self):
+        diff_html, timed_out = compute_diff_html(
+            "The quick brown fox jumps", "The quick red fox jumps"
+        )
+
+        assert not timed_out
+
+        assert '<del class="diff__del">brown</del>' in diff_html
+        assert '<ins class="diff__ins">red</ins>' in diff_html
+
+    def test_words_to_chars(self):
+        dmp = diff_match_patch()
+        chars1, chars2, words = dmp.diff_wordsToChars("a b a", "b  c")
+
+        assert words == ["", "a ", "b ", "a", "b  ", "c"]
+        assert chars1 == "\x01\x02\x03"
+        assert chars2 == "\x04\x05"
+
+    def test_word_mode_round_trips(self):
+        dmp = diff_match_patch()
+        old = "One paragraph of text, with punctuation.  And spaces."
+        new = "One longer paragraph of text with punctuation. And spaces!"
+        diffs = dmp.diff_wordMode(old, new)
+
+        assert dmp.diff_text1(diffs) == old
+        assert dmp.diff_text2(diffs) == new
+
+    @override_settings(HISTORY_DIFF_MAX_LENGTH=10)
+    def test_too_large_to_diff(self):
+        diff_html, timed_out = compute_diff_html(
+            "Old <b>summary</b>", "New <b>summary</b>"
+        )
+
+        assert not timed_out
+
+        assert diff_html == (
+            f"<em>{TOO_LARGE_TO_DIFF}</em>\nNew &lt;b&gt;summary&lt;/b&gt;"
+        )
+
+    @override_settings(HISTORY_DIFF_TIMEOUT=0)
+    @patch("utils.diff_cache.time.time")
+    def test_diff_past_deadline(self, mock_time):
+        mock_time.side_effect = itertools.count(100)
+
+        diff_html, timed_out = compute_diff_html("Old summary", "New summary")
+
+        assert timed_out
+        assert diff_html.startswith(f"<em>{TOO_LARGE_TO_DIFF}</em>")
@@ -0,0 +1,43 @@
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from mock import patch
+
+from utils.forms.fields import RestrictedFileField
+
+
+class RestrictedFileFieldTestCase(TestCase):
+    def setUp(self):
+        self.field = RestrictedFileField(
+            content_types=["image/jpeg"],
+            max_upload_size=10000,
+        )
+        with open("tests/files/attachment.jpeg", "rb") as document:
+            self.content = document.read()
+
+    @override_settings(FILE_TYPE_SNIFF_SIZE=512)
+    @patch("utils.forms.fields.magic.from_buffer", return_value="image/jpeg")
+    def test_type_is_detected_from_start_of_file(self, mock_from_buffer):
+        document = SimpleUploadedFile("attachment.jpeg", self.content)
+
+        assert self.field.clean(document) is document
+        mock_from_buffer.assert_called_once_with(self.content[:512], mime=True)
+        assert document.tell() == 0
+
+    @patch("utils.forms.fields.magic.from_buffer")
+    def test_large_file_is_rejected_before_reading(self, mock_from_buffer):
+        document = SimpleUploadedFile("attachment.jpeg", self.content * 2)
+
+        with self.assertRaises(ValidationError) as context:
+            self.field.clean(document)
+
+        assert "must be smaller than" in str(context.exception)
+        assert mock_from_buffer.called is False
+
+    def test_wrong_type_is_rejected(self):
+        document = SimpleUploadedFile("attachment.txt", b"plain text")
+
+        with self.assertRaises(ValidationError) as context:
+            self.field.clean(document)
+
+        assert "must be a .jpg" in str(context.exception)
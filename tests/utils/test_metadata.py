@@ -1,5 +1,25 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from mock import patch
+
+import utils.metadata
+from barriers.forms.search import BarrierSearchForm
 from core.tests import MarketAccessTestCase
-from utils.metadata import get_metadata
+from utils.exceptions import HawkException
+from utils.metadata import (
+    METADATA_FRESH_KEY,
+    METADATA_KEY,
+    METADATA_METRICS_KEY,
+    METADATA_VERSION_KEY,
+    Metadata,
+    clear_metadata_cache,
+    expire_metadata_cache,
+    get_metadata,
+    get_metadata_metrics,
+)
 
 
 class MetadataTestCase(MarketAccessTestCase):
@@ -142,3 +162,295 @@ class MetadataTestCase(MarketAccessTestCase):
             "show_at_reporting": False,
             "order": 9999,
         }
+
+    def test_get_policy_team_accepts_int_id(self):
+        metadata = get_metadata()
+        assert metadata.get_policy_team(1)["title"] == "Competition"
+        assert metadata.get_policy_team("9999") is None
+
+    def test_get_barrier_tag(self):
+        metadata = get_metadata()
+        assert metadata.get_barrier_tag("1")["title"] == "COVID-19"
+        assert metadata.get_barrier_tag(1)["title"] == "COVID-19"
+
+    def test_get_trading_bloc_by_country_id(self):
+        metadata = get_metadata()
+        trading_bloc = metadata.get_trading_bloc_by_country_id(
+            "56af72a6-5d95-e211-a939-e4115bead28a"
+        )
+        assert trading_bloc == {
+            "code": "TB00003",
+            "name": "Association of Southeast Asian Nations (ASEAN)",
+            "short_name": "the ASEAN",
+        }
+        assert metadata.get_trading_bloc_by_country_id("not-a-country") is None
+
+    def test_get_countries_with_admin_areas_list(self):
+        metadata = get_metadata()
+        countries = metadata.get_countries_with_admin_areas_list()
+        country_ids = [country["id"] for country in countries]
+        assert len(country_ids) == len(set(country_ids))
+        assert {"id": "b05f66a0-5d95-e211-a939-e4115bead28a", "name": "Brazil"} in (
+            countries
+        )
+
+    def test_get_status_returns_a_copy(self):
+        metadata = get_metadata()
+        status = metadata.get_status("2")
+        status["summary"] = "Barrier specific"
+        assert "summary" not in metadata.get_status("2")
+
+    def test_derived_lists_are_copies(self):
+        metadata = get_metadata()
+        regions = metadata.get_overseas_region_list()
+        regions.remove(regions[0])
+        metadata.get_sector_list(level=0).clear()
+        metadata.get_policy_team_list().reverse()
+        metadata.get_report_stages().clear()
+        metadata.get_barrier_tags().clear()
+
+        assert len(metadata.get_overseas_region_list()) == len(regions) + 1
+        assert metadata.get_sector_list(level=0)
+        assert metadata.get_policy_team_list() == sorted(
+            metadata.get_policy_team_list(), key=lambda team: team["title"]
+        )
+        assert metadata.get_report_stages()
+        assert metadata.get_barrier_tags()
+
+    def test_choices_are_built_once(self):
+        metadata = get_metadata()
+        choices = metadata.get_choices("locations")
+
+        assert metadata.get_choices("locations") is choices
+        assert choices[0][0] == "Trading blocs"
+        assert isinstance(choices[1][1], tuple)
+        assert len(choices[1][1]) == len(metadata.get_country_list())
+
+    def test_admin_area_choices_by_country(self):
+        metadata = get_metadata()
+        choices = dict(metadata.get_choices("admin_areas_by_country"))
+
+        assert len(choices) == len(metadata.get_countries_with_admin_areas_list())
+        assert len(choices["Brazil"]) == len(
+            metadata.get_admin_areas_by_country("b05f66a0-5d95-e211-a939-e4115bead28a")
+        )
+
+    def test_choices_are_rebuilt_for_new_metadata(self):
+        metadata = get_metadata()
+        new_metadata = Metadata(metadata.data)
+
+        assert new_metadata.get_choices("sectors") == metadata.get_choices("sectors")
+        assert new_metadata.get_choices("sectors") is not (
+            metadata.get_choices("sectors")
+        )
+
+    def test_search_forms_share_choices(self):
+        metadata = get_metadata()
+        first = BarrierSearchForm(metadata=metadata, data={})
+        second = BarrierSearchForm(metadata=metadata, data={"search_term_text": "a"})
+
+        assert first.fields["sector"].choices == second.fields["sector"].choices
+        ordering = [value for value, label in first.fields["ordering"].choices]
+        assert "relevance" not in ordering
+        ordering = [value for value, label in second.fields["ordering"].choices]
+        assert "relevance" in ordering
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.locked = False
+        self.mget_calls = []
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def mget(self, *keys):
+        self.mget_calls.append(keys)
+        return [self.store.get(key) for key in keys]
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value.encode() if isinstance(value, str) else value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+    def hincrby(self, name, key, amount):
+        values = self.store.setdefault(name, {})
+        values[key] = values.get(key, 0) + amount
+
+    hincrbyfloat = hincrby
+
+    def hset(self, name, key, value):
+        self.store.setdefault(name, {})[key] = value
+
+    def hgetall(self, name):
+        return {
+            key.encode(): str(value).encode()
+            for key, value in self.store.get(name, {}).items()
+        }
+
+    def lock(self, name, timeout=None):
+        return FakeLock(self)
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakeLock:
+    def __init__(self, client):
+        self.client = client
+
+    def acquire(self, blocking=True):
+        if self.client.locked:
+            return False
+        self.client.locked = True
+        return True
+
+    def release(self):
+        self.client.locked = False
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def __getattr__(self, name):
+        def command(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+
+        return command
+
+    def execute(self):
+        for name, args, kwargs in self.commands:
+            getattr(self.client, name)(*args, **kwargs)
+
+
+@override_settings(DJANGO_ENV="local", METADATA_MISSING_WAIT_TIME=0)
+@patch("utils.metadata.run_in_background", lambda func: func())
+@patch("utils.metadata.fetch_metadata")
+class MetadataCacheTestCase(TestCase):
+    """
+    Test metadata is parsed once per process and version
+    """
+
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = patch("utils.metadata.redis_client", self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(setattr, utils.metadata, "_local_metadata", (None, None))
+        self.addCleanup(setattr, utils.metadata, "_stale_serves", 0)
+        utils.metadata._local_metadata = (None, None)
+
+    def test_metadata_is_fetched_and_stored(self, mock_fetch):
+        mock_fetch.return_value = {"countries": []}
+
+        metadata = get_metadata()
+
+        assert metadata.data == {"countries": []}
+        assert json.loads(self.redis.store[METADATA_KEY]) == {"countries": []}
+        assert self.redis.store[METADATA_VERSION_KEY]
+        assert self.redis.store[METADATA_FRESH_KEY]
+        assert get_metadata_metrics()["refreshes"] == 1
+
+    def test_metadata_is_reused_while_version_is_unchanged(self, mock_fetch):
+        mock_fetch.return_value = {"countries": []}
+
+        metadata = get_metadata()
+        self.redis.mget_calls = []
+
+        assert get_metadata() is metadata
+        assert get_metadata() is metadata
+        assert self.redis.mget_calls == [
+            (METADATA_VERSION_KEY, METADATA_FRESH_KEY),
+            (METADATA_VERSION_KEY, METADATA_FRESH_KEY),
+        ]
+        assert mock_fetch.call_count == 1
+
+    def test_metadata_is_reloaded_when_version_changes(self, mock_fetch):
+        mock_fetch.return_value = {"countries": []}
+        metadata = get_metadata()
+
+        self.redis.set(METADATA_KEY, json.dumps({"countries": [{"id": 1}]}))
+        self.redis.set(METADATA_VERSION_KEY, "new-version")
+
+        reloaded = get_metadata()
+        assert reloaded is not metadata
+        assert reloaded.data == {"countries": [{"id": 1}]}
+        assert get_metadata() is reloaded
+        assert mock_fetch.call_count == 1
+
+    def test_stale_metadata_is_served_while_refreshed(self, mock_fetch):
+        mock_fetch.return_value = {"countries": []}
+        metadata = get_metadata()
+        mock_fetch.return_value = {"countries": [{"id": 1}]}
+
+        expire_metadata_cache()
+
+        assert get_metadata() is metadata
+        assert mock_fetch.call_count == 2
+        assert get_metadata().data == {"countries": [{"id": 1}]}
+        assert get_metadata_metrics()["stale_serves"] == 1
+
+    def test_stale_metadata_is_refreshed_by_one_worker(self, mock_fetch):
+        mock_fetch.return_value = {"countries": []}
+        metadata = get_metadata()
+        expire_metadata_cache()
+        self.redis.locked = True
+
+        assert get_metadata() is metadata
+        assert get_metadata() is metadata
+        assert mock_fetch.call_count == 1
+        assert get_metadata_metrics()["stale_serves"] == 2
+
+    def test_failed_refresh_serves_stale_metadata(self, mock_fetch):
+        mock_fetch.return_value = {"countries": []}
+        metadata = get_metadata()
+        expire_metadata_cache()
+        mock_fetch.side_effect = HawkException("Call to fetch metadata failed")
+
+        assert get_metadata() is metadata
+        assert not self.redis.locked
+
+    def test_missing_metadata_is_fetched_when_refresh_is_locked(self, mock_fetch):
+        mock_fetch.return_value = {"countries": []}
+        self.redis.locked = True
+
+        assert get_metadata().data == {"countries": []}
+        assert mock_fetch.call_count == 1
+
+    @override_settings(METADATA_MISSING_WAIT_TIME=5)
+    def test_missing_metadata_is_read_once_stored_by_another_worker(self, mock_fetch):
+        self.redis.locked = True
+
+        def store_from_other_worker(seconds):
+            self.redis.set(METADATA_KEY, json.dumps({"countries": [{"id": 1}]}))
+            self.redis.set(METADATA_VERSION_KEY, "other-version")
+
+        with patch("utils.metadata.time.sleep", side_effect=store_from_other_worker):
+            assert get_metadata().data == {"countries": [{"id": 1}]}
+        mock_fetch.assert_not_called()
+
+    def test_clear_metadata_cache(self, mock_fetch):
+        mock_fetch.return_value = {"countries": []}
+        metadata = get_metadata()
+
+        clear_metadata_cache()
+
+        assert set(self.redis.store) == {METADATA_METRICS_KEY}
+        assert get_metadata() is not metadata
+        assert mock_fetch.call_count == 2
+
+    def test_clear_metadata_cache_command_marks_metadata_stale(self, mock_fetch):
+        mock_fetch.return_value = {"countries": []}
+        metadata = get_metadata()
+
+        with patch("redis.Redis.from_url", return_value=self.redis):
+            call_command("clear_metadata_cache", "--stale", stdout=StringIO())
+
+        assert METADATA_FRESH_KEY not in self.redis.store
+        assert get_metadata() is metadata
+        assert mock_fetch.call_count == 2
@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta, timezone
+
+from django.test import TestCase
+from mock import patch
+
+from barriers.models import Barrier
+from utils.models import APIModel, ModelList, parse_date
+
+
+class DatedModel(APIModel):
+    date_fields = ("created_on",)
+
+
+class ParseDateTestCase(TestCase):
+    def test_iso_dates(self):
+        assert parse_date("2020-03-04T10:11:12.123456Z") == datetime(
+            2020, 3, 4, 10, 11, 12, 123456, tzinfo=timezone.utc
+        )
+        assert parse_date("2020-03-04T10:11:12+01:00") == datetime(
+            2020, 3, 4, 10, 11, 12, tzinfo=timezone(timedelta(hours=1))
+        )
+        assert parse_date("2020-03-04") == datetime(2020, 3, 4)
+
+    @patch("utils.models.dateutil.parser.parse")
+    def test_iso_dates_skip_dateutil(self, mock_parse):
+        parse_date("2020-03-04T10:11:12Z")
+        mock_parse.assert_not_called()
+
+    def test_other_formats_use_dateutil(self):
+        assert parse_date("4 March 2020") == datetime(2020, 3, 4)
+
+
+class APIModelTestCase(TestCase):
+    def test_date_fields_are_parsed_once(self):
+        model = DatedModel({"created_on": "2020-03-04T10:11:12Z", "title": "Test"})
+
+        with patch("utils.models.parse_date", wraps=parse_date) as mock_parse:
+            created_on = model.created_on
+            assert model.created_on is created_on
+            assert mock_parse.call_count == 1
+
+        assert created_on == datetime(2020, 3, 4, 10, 11, 12, tzinfo=timezone.utc)
+        assert model.title == "Test"
+
+    def test_changed_date_fields_are_parsed_again(self):
+        model = DatedModel({"created_on": "2020-03-04T10:11:12Z"})
+        assert model.created_on.day == 4
+
+        model.data["created_on"] = "2020-03-05T10:11:12Z"
+        assert model.created_on.day == 5
+
+    def test_empty_date_fields(self):
+        model = DatedModel({"created_on": None})
+        assert model.created_on is None
+        assert model.missing is None
+
+    def test_barrier_dates_are_parsed_once(self):
+        barrier = Barrier({"created_on": "2020-03-04T10:11:12Z"})
+        assert barrier.created_on is barrier.created_on
+
+
+class ModelListTestCase(TestCase):
+    def test_models_are_created_once(self):
+        model_list = ModelList(DatedModel, [{"id": 1}, {"id": 2}], total_count=2)
+
+        first = list(model_list)
+        assert list(model_list) == first
+        assert all(a is b for a, b in zip(model_list, first))
+        assert [model.id for model in model_list] == [1, 2]
+
+    def test_models_are_rebuilt_when_data_changes(self):
+        model_list = ModelList(DatedModel, [{"id": 1}, {"id": 2}], total_count=2)
+        list(model_list)
+
+        model_list.remove([1])
+        assert [model.id for model in model_list] == [2]
+
+        model_list.append({"id": 3})
+        assert [model.id for model in model_list] == [2, 3]
+
+    def test_models_are_rebuilt_when_reordered_or_replaced(self):
+        model_list = ModelList(DatedModel, [{"id": 1}, {"id": 2}], total_count=2)
+        list(model_list)
+
+        model_list.sort(key=lambda data: data["id"], reverse=True)
+        assert [model.id for model in model_list] == [2, 1]
+
+        model_list[0] = {"id": 3}
+        assert [model.id for model in model_list] == [3, 1]
@@ -0,0 +1,72 @@
+from django.test import RequestFactory, TestCase
+from django.views.generic import TemplateView
+from mock import patch
+
+from utils.page_data import APICall, PageDataMixin
+
+
+class ExampleView(PageDataMixin, TemplateView):
+    page_data = {
+        "my_barriers": APICall("saved_searches.get", "my-barriers"),
+        "saved_search": APICall("saved_searches.get", "my-barriers"),
+        "team_barriers": APICall("saved_searches.get", "team-barriers"),
+        "mentions": APICall("mentions.list"),
+    }
+
+    def get_page_data(self, **kwargs):
+        page_data = super().get_page_data(**kwargs)
+        page_data["summary"] = APICall("get", "dashboard-summary?search=1")
+        return page_data
+
+
+class PageDataMixinTestCase(TestCase):
+    """
+    Test declarative loading of page data
+    """
+
+    def get_view(self):
+        request = RequestFactory().get("/")
+        request.session = {"sso_token": "abcd"}
+        view = ExampleView()
+        view.setup(request)
+        return view
+
+    @patch("utils.api.client.MarketAccessAPIClient.get")
+    @patch("utils.api.resources.MentionResource.list")
+    @patch("utils.api.resources.SavedSearchesResource.get")
+    def test_load_page_data(self, mock_saved_search, mock_mentions, mock_get):
+        mock_saved_search.side_effect = lambda id: f"search:{id}"
+        mock_mentions.return_value = ["mention"]
+        mock_get.return_value = {"barriers": 3}
+
+        page_data = self.get_view().load_page_data()
+
+        assert page_data == {
+            "my_barriers": "search:my-barriers",
+            "saved_search": "search:my-barriers",
+            "team_barriers": "search:team-barriers",
+            "mentions": ["mention"],
+            "summary": {"barriers": 3},
+        }
+        # Identical calls are only made once
+        assert mock_saved_search.call_count == 2
+        mock_mentions.assert_called_once_with()
+        mock_get.assert_called_once_with("dashboard-summary?search=1")
+
+    @patch("utils.api.resources.MentionResource.list")
+    @patch("utils.api.resources.SavedSearchesResource.get")
+    def test_load_page_data_raises_errors(self, mock_saved_search, mock_mentions):
+        mock_saved_search.side_effect = ValueError("Oops")
+
+        with self.assertRaisesMessage(ValueError, "Oops"):
+            self.get_view().load_page_data()
+
+    def test_api_call_key(self):
+        assert (
+            APICall("barrier_download.list", limit=1, offset=0).key
+            == APICall("barrier_download.list", offset=0, limit=1).key
+        )
+        assert (
+            APICall("barrier_download.list", limit=1).key
+            != APICall("barrier_download.list", limit=2).key
+        )
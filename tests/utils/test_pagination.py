@@ -0,0 +1,50 @@
+from django.test import RequestFactory, TestCase
+from mock import patch
+
+from utils.models import ModelList
+from utils.pagination import PaginationMixin
+
+
+class PaginationTestCase(TestCase):
+    def get_pagination_data(self, querystring, total_count, limit=10):
+        view = PaginationMixin()
+        view.request = RequestFactory().get(f"/?{querystring}")
+        view.pagination_limit = limit
+        return view.get_pagination_data(ModelList(dict, [], total_count))
+
+    def test_page_window(self):
+        view = PaginationMixin()
+
+        assert view.get_page_window(1, 0) == []
+        assert view.get_page_window(2, 3) == [1, 2, 3]
+        assert view.get_page_window(1, 13) == [1, 2, 3, 4, "...", 13]
+        assert view.get_page_window(6, 13) == [1, "...", 5, 6, 7, 8, "...", 13]
+        assert view.get_page_window(13, 13) == [1, "...", 10, 11, 12, 13]
+        assert view.get_page_window(3, 8) == [1, 2, 3, 4, 5, "...", 8]
+
+    def test_only_visible_pages_are_encoded(self):
+        with patch.object(
+            PaginationMixin,
+            "update_querystring",
+            autospec=True,
+            return_value="q=test",
+        ) as mock_update_querystring:
+            pagination = self.get_pagination_data("q=test&page=500", 10000)
+
+        assert mock_update_querystring.call_count == 1
+        assert len(pagination["pages"]) == 8
+        assert pagination["pages"][0] == {"label": 1, "url": "q=test&page=1"}
+        assert pagination["pages"][1] == {"label": "..."}
+        assert pagination["previous"] == "q=test&page=499"
+        assert pagination["next"] == "q=test&page=501"
+
+    def test_page_urls_without_other_params(self):
+        pagination = self.get_pagination_data("page=2", 30)
+
+        assert [page["url"] for page in pagination["pages"]] == [
+            "page=1",
+            "page=2",
+            "page=3",
+        ]
+        assert pagination["previous"] == "page=1"
+        assert pagination["next"] == "page=3"
@@ -0,0 +1,101 @@
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from mock import Mock, patch
+
+from utils.api.client import MarketAccessAPIClient
+from utils.metadata import get_metadata
+from utils.middleware import RequestCacheMiddleware
+from utils.request_cache import (
+    end_request_cache,
+    get_request_cache,
+    request_memo,
+    start_request_cache,
+)
+
+
+class RequestCacheTestCase(TestCase):
+    """
+    Test values are shared within a request
+    """
+
+    def setUp(self):
+        token = start_request_cache()
+        self.addCleanup(end_request_cache, token)
+
+    def test_value_is_computed_once(self):
+        func = Mock(return_value="value")
+
+        assert request_memo("key", func) == "value"
+        assert request_memo("key", func) == "value"
+        assert func.call_count == 1
+        assert get_request_cache().hit_count == 1
+
+    def test_values_are_not_shared_between_requests(self):
+        func = Mock(return_value="value")
+
+        request_memo("key", func)
+        token = start_request_cache()
+        request_memo("key", func)
+        end_request_cache(token)
+
+        assert func.call_count == 2
+
+    def test_metadata_is_loaded_once(self):
+        assert get_metadata() is get_metadata()
+
+    @patch("utils.api.client.MarketAccessAPIClient.get")
+    def test_current_user_is_fetched_once(self, mock_get):
+        mock_get.return_value = {"id": 1, "first_name": "Test"}
+        client = MarketAccessAPIClient("token")
+
+        user = client.users.get_current()
+        assert client.users.get_current() is user
+        assert MarketAccessAPIClient("token").users.get_current() is user
+        assert mock_get.call_count == 1
+
+    def test_current_user_key_does_not_contain_the_token(self):
+        key = MarketAccessAPIClient("secret-token").users.current_user_key
+
+        assert "secret-token" not in key
+        assert key != MarketAccessAPIClient("other-token").users.current_user_key
+
+    @patch("utils.api.client.MarketAccessAPIClient.patch")
+    @patch("utils.api.client.MarketAccessAPIClient.get")
+    def test_current_user_is_fetched_again_after_update(self, mock_get, mock_patch):
+        mock_get.return_value = {"id": 1, "first_name": "Test"}
+        mock_patch.return_value = {"id": 1, "first_name": "Updated"}
+        client = MarketAccessAPIClient("token")
+
+        client.users.get_current()
+        client.users.patch(id=1, first_name="Updated")
+        client.users.get_current()
+        assert mock_get.call_count == 2
+
+
+class RequestCacheMiddlewareTestCase(TestCase):
+    def test_values_are_not_cached_outside_a_request(self):
+        func = Mock(return_value="value")
+
+        request_memo("key", func)
+        request_memo("key", func)
+
+        assert func.call_count == 2
+
+    def get_response(self, request):
+        request_memo("key", lambda: "value")
+        request_memo("key", lambda: "value")
+        return HttpResponse()
+
+    @override_settings(DEBUG=True)
+    def test_hits_header_in_debug(self):
+        middleware = RequestCacheMiddleware(self.get_response)
+        response = middleware(RequestFactory().get("/"))
+
+        assert response.headers["X-Request-Cache-Hits"] == "1"
+        assert get_request_cache() is None
+
+    def test_no_hits_header(self):
+        middleware = RequestCacheMiddleware(self.get_response)
+        response = middleware(RequestFactory().get("/"))
+
+        assert "X-Request-Cache-Hits" not in response.headers
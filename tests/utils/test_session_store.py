@@ -0,0 +1,113 @@
+from django.contrib.sessions.backends.db import SessionStore as DBSessionStore
+from django.conf import settings
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from mock import patch
+
+from core.tests import LocMemCacheMixin, MarketAccessTestCase
+from utils.session_store import COMPRESSED, SessionStore
+
+
+@override_settings(SESSION_DB_FALLBACK=True)
+class SessionStoreTestCase(LocMemCacheMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache = caches[settings.SESSION_CACHE_ALIAS]
+        self.cache.clear()
+
+    def create_session(self, **data):
+        session = SessionStore()
+        session.update(data)
+        session.save()
+        return SessionStore(session.session_key)
+
+    def test_session_is_stored_in_the_cache_only(self):
+        session = self.create_session(sso_token="token")
+
+        assert session["sso_token"] == "token"
+        assert not DBSessionStore().exists(session.session_key)
+
+    def test_unchanged_session_is_not_saved(self):
+        session = self.create_session(default="home")
+        session["default"] = "home"
+
+        with patch.object(self.cache, "set") as mock_set, patch.object(
+            self.cache, "touch"
+        ) as mock_touch:
+            session.save()
+            mock_set.assert_not_called()
+            mock_touch.assert_called_once_with(
+                session.cache_key, session.get_expiry_age()
+            )
+
+            session["default"] = "dashboard"
+            session.save()
+            mock_set.assert_called_once()
+
+    def test_cached_db_session_is_read_and_rewritten(self):
+        session_key = "a" * 32
+        self.cache.set(
+            SessionStore.cache_key_prefix + session_key, {"sso_token": "token"}
+        )
+
+        session = SessionStore(session_key)
+        assert session["sso_token"] == "token"
+
+        session["sso_token"] = "token"
+        session.save()
+        assert isinstance(self.cache.get(session.cache_key), bytes)
+        assert SessionStore(session_key)["sso_token"] == "token"
+
+    @override_settings(SESSION_COMPRESS_MIN_SIZE=100)
+    def test_large_session_is_compressed(self):
+        session = self.create_session(documents=["document"] * 100)
+
+        assert self.cache.get(session.cache_key).startswith(COMPRESSED)
+        assert session["documents"] == ["document"] * 100
+
+    def test_session_is_read_from_the_database(self):
+        db_session = DBSessionStore()
+        db_session["sso_token"] = "token"
+        db_session.save()
+
+        session = SessionStore(db_session.session_key)
+
+        assert session["sso_token"] == "token"
+
+    def test_session_is_saved_to_the_database_when_the_cache_fails(self):
+        session = self.create_session(sso_token="token")
+        session["default"] = "home"
+
+        with patch.object(self.cache, "set", side_effect=ConnectionError):
+            session.save()
+
+        assert DBSessionStore(session.session_key)["default"] == "home"
+
+    @override_settings(SESSION_DB_FALLBACK=False)
+    def test_no_database_fallback(self):
+        db_session = DBSessionStore()
+        db_session["sso_token"] = "token"
+        db_session.save()
+
+        session = SessionStore(db_session.session_key)
+
+        assert session.get("sso_token") is None
+        assert session.session_key is None
+
+    def test_delete(self):
+        session = self.create_session(sso_token="token")
+        session_key = session.session_key
+        session.delete()
+
+        assert not SessionStore().exists(session_key)
+
+
+class TestClientSessionTestCase(MarketAccessTestCase):
+    def test_views_use_the_session_store(self):
+        session = self.client.session
+        session_cache = caches[settings.SESSION_CACHE_ALIAS]
+
+        assert isinstance(session, SessionStore)
+        assert session["sso_token"] == "abcd"
+        assert isinstance(session_cache.get(session.cache_key), bytes)
+        assert not DBSessionStore().exists(session.session_key)
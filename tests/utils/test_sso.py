@@ -0,0 +1,114 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from mock import patch
+
+from core.tests import LocMemCacheMixin, MarketAccessTestCase
+from utils.metrics import LatencyWindow
+from utils.sso import SSOClient
+
+JOSEPH = {
+    "user_id": "3fbe6479-b9bd-4658-81d7-f07c2a73d33d",
+    "first_name": "Joseph",
+    "last_name": "Heller",
+    "email": "joseph.heller@example.com",
+}
+JOANNA = {
+    "user_id": "84d7de71-4b1a-4e5c-8d49-8ff0e0a0c5b1",
+    "first_name": "Joanna",
+    "last_name": "Smith",
+    "email": "joanna.smith@example.com",
+}
+
+
+@patch("utils.sso.SSOClient.get")
+class UserSearchCacheTestCase(LocMemCacheMixin, TestCase):
+    def test_repeated_search_is_cached(self, mock_get):
+        mock_get.return_value = {"results": [JOSEPH], "next": None}
+
+        SSOClient().search_users("Joseph")
+        users = SSOClient().search_users(" joseph ")
+
+        assert users == [JOSEPH]
+        assert mock_get.call_count == 1
+
+    def test_longer_search_filters_cached_results(self, mock_get):
+        mock_get.return_value = {"results": [JOSEPH, JOANNA], "next": None}
+
+        SSOClient().search_users("jo")
+        users = SSOClient().search_users("jo smi")
+
+        assert users == [JOANNA]
+        mock_get.assert_called_once_with("user/search/?autocomplete=jo")
+
+    def test_incomplete_results_are_not_filtered(self, mock_get):
+        mock_get.return_value = {
+            "results": [JOSEPH, JOANNA],
+            "next": "https://sso/user/search/?page=2",
+        }
+
+        SSOClient().search_users("jo")
+        SSOClient().search_users("joa")
+
+        assert mock_get.call_count == 2
+
+    def test_filtering_matches_any_returned_field(self, mock_get):
+        joseph = {**JOSEPH, "contact_email": "catch22@example.com"}
+        mock_get.return_value = {"results": [joseph, JOANNA], "next": None}
+
+        SSOClient().search_users("c")
+        users = SSOClient().search_users("catch")
+
+        assert users == [joseph]
+        assert mock_get.call_count == 1
+
+    @override_settings(SSO_USER_SEARCH_NARROWING=False)
+    def test_filtering_can_be_disabled(self, mock_get):
+        mock_get.return_value = {"results": [JOSEPH, JOANNA], "next": None}
+
+        SSOClient().search_users("jo")
+        SSOClient().search_users("joa")
+
+        assert mock_get.call_count == 2
+
+    def test_empty_search(self, mock_get):
+        assert SSOClient().search_users("  ") == []
+        assert mock_get.called is False
+
+
+class LatencyWindowTestCase(TestCase):
+    def test_percentile(self):
+        window = LatencyWindow(size=100)
+        assert window.percentile(95) is None
+
+        for duration in range(1, 101):
+            window.observe(duration / 1000)
+
+        assert window.percentile(95) == 0.095
+        assert window.percentile(100) == 0.1
+
+    def test_sampled_percentile(self):
+        window = LatencyWindow(sample_every=2)
+        window.observe(0.1)
+        assert window.sampled_percentile(100) is None
+
+        window.observe(0.2)
+        assert window.sampled_percentile(100) == 0.2
+
+        window.observe(0.3)
+        assert window.sampled_percentile(100) == 0.2
+
+        window.observe(0.4)
+        assert window.sampled_percentile(100) == 0.4
+
+
+class GetUsersLatencyTestCase(MarketAccessTestCase):
+    @patch("users.views.user_search_latency", LatencyWindow(sample_every=1))
+    @patch("utils.sso.SSOClient.search_users")
+    def test_p95_is_logged_with_the_request(self, mock_search_users):
+        mock_search_users.return_value = [JOSEPH]
+
+        with self.assertLogs("utils.middleware", level="INFO") as logs:
+            response = self.client.get(reverse("users:get_users"), data={"q": "Hell"})
+
+        assert response.json()["count"] == 1
+        assert logs.records[0].user_search_p95_ms >= 0
@@ -0,0 +1,51 @@
+from django.template import Context, Template
+from django.test import TestCase, override_settings
+from mock import patch
+
+from barriers.models.history.base import GenericHistoryItem
+from utils.templates import PartialTemplates
+
+
+class PartialTemplatesTestCase(TestCase):
+    def setUp(self):
+        self.templates = PartialTemplates(
+            "barriers/history/partials",
+            default="barriers/history/partials/default.html",
+        )
+
+    def test_templates_are_loaded_once(self):
+        with patch("utils.templates.get_template") as mock_get_template:
+            first = self.templates.get("barrier", "archived")
+            assert self.templates.get("barrier", "archived") is first
+            mock_get_template.assert_called_once_with(
+                "barriers/history/partials/barrier/archived.html"
+            )
+
+    def test_missing_templates_use_the_default(self):
+        default = self.templates.get("barrier", "not_a_field")
+
+        assert default.origin.template_name == "barriers/history/partials/default.html"
+        with patch("utils.templates.get_template") as mock_get_template:
+            assert self.templates.get("barrier", "not_a_field") is default
+            mock_get_template.assert_not_called()
+
+    def test_missing_templates_without_a_default(self):
+        templates = PartialTemplates("barriers/activity/partials")
+        item = GenericHistoryItem({"model": "barrier", "field": "not_a_field"})
+
+        assert templates.get("barrier", "not_a_field") is None
+        assert templates.render(item) == ""
+
+    @override_settings(DEBUG=True)
+    def test_templates_are_not_stored_in_debug(self):
+        self.templates.get("barrier", "archived")
+        assert self.templates.templates == {}
+
+    def test_render_in_context(self):
+        templates = PartialTemplates("barriers/activity/partials")
+        templates.templates[("note", "text")] = Template("{{ item.field }} {{ page }}")
+        item = GenericHistoryItem({"model": "note", "field": "text"})
+        context = Context({"page": "detail"})
+
+        assert templates.render_in_context(context, item) == "text detail"
+        assert "item" not in context
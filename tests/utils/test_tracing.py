@@ -0,0 +1,72 @@
+from django.http import HttpResponse
+from django.template.response import TemplateResponse
+from django.test import RequestFactory, TestCase
+from mock import Mock, patch
+
+from utils.api.client import MarketAccessAPIClient
+from utils.middleware import ServerTimingMiddleware
+from utils.tracing import (
+    end_request_trace,
+    get_request_trace,
+    start_request_trace,
+    trace,
+)
+
+
+class RequestTraceTestCase(TestCase):
+    def test_nothing_is_recorded_outside_a_request(self):
+        with trace("api", "GET barriers"):
+            pass
+
+        assert get_request_trace() is None
+
+    def test_calls_are_recorded(self):
+        token = start_request_trace()
+        self.addCleanup(end_request_trace, token)
+        request_trace = get_request_trace()
+
+        request_trace.record("api", "GET barriers", 0.2)
+        request_trace.record("api", "GET metadata", 0.5)
+        request_trace.record("sso", "GET user/search/", 0.1)
+
+        assert request_trace.get_totals() == {"api": (2, 0.7), "sso": (1, 0.1)}
+        assert request_trace.get_slowest("api") == ("api", "GET metadata", 0.5)
+        assert request_trace.get_slowest("datahub") is None
+
+
+class ServerTimingMiddlewareTestCase(TestCase):
+    def get_response(self, request):
+        MarketAccessAPIClient("token").get("barriers")
+        MarketAccessAPIClient("token").get("users/me")
+        return HttpResponse()
+
+    @patch("utils.api.client.get_session")
+    def test_api_calls_are_timed(self, mock_get_session):
+        mock_get_session.return_value.request.return_value = Mock(
+            json=Mock(return_value={})
+        )
+        middleware = ServerTimingMiddleware(self.get_response)
+
+        with self.assertLogs("utils.middleware", level="INFO") as logs:
+            response = middleware(RequestFactory().get("/"))
+
+        assert response.headers["Server-Timing"].startswith("api;dur=")
+        assert 'desc="2 calls"' in response.headers["Server-Timing"]
+        assert "total;dur=" in response.headers["Server-Timing"]
+        assert "X-Response-Time-Duration-ms" in response.headers
+        assert "2 API calls" in logs.output[0]
+        assert logs.records[0].timings["api"]["calls"] == 2
+        assert get_request_trace() is None
+
+    def test_template_render_is_timed(self):
+        request = RequestFactory().get("/")
+
+        def get_response(request):
+            response = TemplateResponse(request, "healthcheck.html", {})
+            response = middleware.process_template_response(request, response)
+            return response.render()
+
+        middleware = ServerTimingMiddleware(get_response)
+        response = middleware(request)
+
+        assert "render;dur=" in response.headers["Server-Timing"]
@@ -0,0 +1,65 @@
+from django.test import TestCase, override_settings
+from mock import patch
+
+from utils.api.transport import (
+    SAFE_METHODS,
+    TimeoutHTTPAdapter,
+    get_session,
+    reset_session,
+)
+
+
+@override_settings(
+    HTTP_CONNECT_TIMEOUT=1.5,
+    HTTP_READ_TIMEOUT=9,
+    HTTP_MAX_RETRIES=3,
+    HTTP_POOL_MAXSIZE=5,
+    HTTP_POOL_MAXSIZE_PER_HOST={"http://market-access.test/": 40},
+)
+class TransportTestCase(TestCase):
+    """
+    Test the shared HTTP transport
+    """
+
+    def setUp(self):
+        reset_session()
+        self.addCleanup(reset_session)
+
+    def test_session_is_shared(self):
+        assert get_session() is get_session()
+
+    def test_session_is_rebuilt_after_fork(self):
+        session = get_session()
+        with patch("utils.api.transport.os.getpid", return_value=-1):
+            assert get_session() is not session
+
+    def test_per_host_pool_size(self):
+        session = get_session()
+        api_adapter = session.get_adapter("http://market-access.test/barriers")
+        default_adapter = session.get_adapter("https://elsewhere.test/")
+        assert api_adapter._pool_maxsize == 40
+        assert default_adapter._pool_maxsize == 5
+
+    def test_default_timeout(self):
+        adapter = get_session().get_adapter("https://elsewhere.test/")
+        assert isinstance(adapter, TimeoutHTTPAdapter)
+        assert adapter.timeout == (1.5, 9)
+
+        with patch("requests.adapters.HTTPAdapter.send") as mock_send:
+            adapter.send("request")
+            mock_send.assert_called_with("request", timeout=(1.5, 9))
+            adapter.send("request", timeout=2)
+            mock_send.assert_called_with("request", timeout=2)
+
+    def test_retries_only_idempotent_methods(self):
+        retry = get_session().get_adapter("https://elsewhere.test/").max_retries
+        assert retry.total == 3
+        assert retry.allowed_methods == SAFE_METHODS
+        assert "POST" not in retry.allowed_methods
+        assert "PATCH" not in retry.allowed_methods
+        assert "PUT" not in retry.allowed_methods
+        assert "DELETE" not in retry.allowed_methods
+
+    def test_cookies_are_not_persisted(self):
+        policy = get_session().cookies.get_policy()
+        assert policy.allowed_domains() == ()
@@ -56,12 +56,7 @@ class UserEditPolicyTeams(UserEditBase):
     def get_context_data(self, **kwargs):
         context_data = super().get_context_data(**kwargs)
         context_data.update(
-            {
-                "select_options": [
-                    (policy_team["id"], policy_team["title"])
-                    for policy_team in self.metadata.get_policy_team_list()
-                ]
-            }
+            {"select_options": self.metadata.get_choices("policy_teams")}
         )
         return context_data
 
@@ -79,14 +74,7 @@ class UserEditSectors(UserEditBase):
 
     def get_context_data(self, **kwargs):
         context_data = super().get_context_data(**kwargs)
-        context_data.update(
-            {
-                "select_options": [
-                    (sector["id"], sector["name"])
-                    for sector in self.metadata.get_sector_list(level=0)
-                ]
-            }
-        )
+        context_data.update({"select_options": self.metadata.get_choices("sectors")})
         return context_data
 
     def form_valid(self, form):
@@ -104,7 +92,7 @@ class UserEditOverseasRegions(UserEditBase):
     def get_context_data(self, **kwargs):
         context_data = super().get_context_data(**kwargs)
         context_data.update(
-            {"select_options": self.metadata.get_overseas_region_choices()}
+            {"select_options": self.metadata.get_choices("overseas_regions")}
         )
         return context_data
 
@@ -126,27 +114,7 @@ class UserEditBarrierLocations(UserEditBase):
 
     def get_context_data(self, **kwargs):
         context_data = super().get_context_data(**kwargs)
-        locations = (
-            (
-                "Trading blocs",
-                (
-                    [
-                        (bloc["code"], bloc["name"])
-                        for bloc in self.metadata.get_trading_bloc_list()
-                    ]
-                ),
-            ),
-            (
-                "Countries",
-                (
-                    [
-                        (country["id"], country["name"])
-                        for country in self.metadata.get_country_list()
-                    ]
-                ),
-            ),
-        )
-        context_data.update({"select_options": locations})
+        context_data.update({"select_options": self.metadata.get_choices("locations")})
         return context_data
 
     def form_valid(self, form):
@@ -173,7 +141,7 @@ class UserEditGovernmentDepartment(UserEditBase):
         self.client = MarketAccessAPIClient(self.request.session.get("sso_token"))
         self.current_user = self.client.users.get_current()
         kwargs = super().get_form_kwargs()
-        kwargs["select_options"] = self.metadata.get_gov_organisation_choices()
+        kwargs["select_options"] = self.metadata.get_choices("gov_organisations")
         return kwargs
 
     def form_valid(self, form):
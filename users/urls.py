@@ -20,6 +20,7 @@ from users.views import (
     Login,
     LoginCallback,
     ManageUsers,
+    MentionCounts,
     Mentions,
     SignOut,
     UserDetail,
@@ -80,4 +81,5 @@ urlpatterns = [
         name="edit_user_government_department",
     ),
     path("mentions/", Mentions.as_view(), name="mentions"),
+    path("mentions/counts/", MentionCounts.as_view(), name="mention_counts"),
 ]
@@ -2,6 +2,7 @@ import csv
 import logging
 import re
 import uuid
+from http import HTTPStatus
 from urllib.parse import urlencode
 
 import requests
@@ -17,12 +18,15 @@ from users.constants import (
     USER_ADDITIONAL_PERMISSION_GROUPS,
 )
 from utils.api.client import MarketAccessAPIClient
+from utils.context_processors import get_mention_counts
 from utils.helpers import build_absolute_uri
 from utils.metadata import MetadataMixin
+from utils.metrics import LatencyWindow
 from utils.pagination import PaginationMixin
 from utils.referers import RefererMixin
 from utils.sessions import init_session
 from utils.sso import SSOClient
+from utils.tracing import set_trace_field
 
 from .forms import UserDeleteForm, UserGroupForm
 from .mixins import GroupQuerystringMixin, UserMixin, UserSearchMixin
@@ -31,6 +35,10 @@ from .permissions import APIPermissionMixin
 logger = logging.getLogger(__name__)
 
 
+# Durations of the user typeahead searches made by this process
+user_search_latency = LatencyWindow()
+
+
 class GetUsers(View):
     def serialize_results(self, results):
         return [
@@ -52,11 +60,16 @@ class GetUsers(View):
         # search needs to have email dots replaced with spaces for search lookup
         query = query.replace(".", " ")
 
-        sso_client = SSOClient()
-        results = sso_client.search_users(query)
+        with user_search_latency.time():
+            sso_client = SSOClient()
+            results = sso_client.search_users(query)
         serialized_results = self.serialize_results(results)
         response["results"] = serialized_results
         response["count"] = len(results)
+
+        p95 = user_search_latency.sampled_percentile(95)
+        if p95 is not None:
+            set_trace_field("user_search_p95_ms", round(p95 * 1000, 1))
         return JsonResponse(response)
 
 
@@ -172,12 +185,10 @@ class ManageUsers(
             "total_pages": total_pages,
             "current_page": current_page,
             "pages": [
-                {
-                    "label": i,
-                    "url": self.update_querystring(page=i),
-                }
-                for i in range(1, total_pages + 1)
+                {"label": page, "url": querystring}
+                for page in self.get_page_window(current_page, total_pages)
             ],
+            ...
         }
         - q: query used
         - ordering: sort used
@@ -578,3 +589,15 @@ class Mentions(TemplateView, PaginationMixin):
         )
 
         return context_data
+
+
+class MentionCounts(View):
+    """
+    Mention counts for the header badge when it is loaded asynchronously.
+    """
+
+    def get(self, request, *args, **kwargs):
+        counts = get_mention_counts(request)
+        if not isinstance(counts, dict):
+            return JsonResponse({}, status=HTTPStatus.UNAUTHORIZED)
+        return JsonResponse(counts)
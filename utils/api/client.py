@@ -5,6 +5,7 @@ import requests
 from django.conf import settings
 
 from utils.exceptions import APIHttpException, APIJsonException
+from utils.tracing import trace
 
 from .resources import (
     ActionPlanMilestoneResource,
@@ -35,6 +36,7 @@ from .resources import (
     UserProfileResource,
     UsersResource,
 )
+from .transport import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -77,7 +79,8 @@ class MarketAccessAPIClient:
             "X-User-Agent": "",
             "X-Forwarded-For": "",
         }
-        response = getattr(requests, method)(url, headers=headers, **kwargs)
+        with trace("api", f"{method.upper()} {path}"):
+            response = get_session().request(method, url, headers=headers, **kwargs)
 
         try:
             response.raise_for_status()
@@ -85,6 +88,11 @@ class MarketAccessAPIClient:
             logger.warning(e)
             raise APIHttpException(e, response)
 
+        if method != "get" and not path.startswith("documents"):
+            # The user may have changed a barrier, don't show them stale results.
+            # Document uploads and scan checks don't change any barriers.
+            self.barriers.clear_cached_searches()
+
         return response
 
     def get(self, path, raw=False, **kwargs):
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import time
 import urllib.parse
+import uuid
 from typing import TYPE_CHECKING
 
 import requests
@@ -37,8 +40,15 @@ from barriers.models.history.mentions import (
 )
 from reports.models import Report
 from users.models import DashboardTask, Group, User, UserProfile
-from utils.exceptions import APIHttpException, ScanError
+from utils.commodity_index import (
+    lookup_commodities,
+    normalise_commodity_code,
+    remember_commodities,
+)
+from utils.concurrency import run_in_background
+from utils.exceptions import APIException, APIHttpException, ScanError
 from utils.models import APIModel, ModelList
+from utils.request_cache import forget, request_memo
 
 if TYPE_CHECKING:
     from utils.api.client import MarketAccessAPIClient
@@ -54,6 +64,13 @@ class APIResource:
     def __init__(self, client) -> None:
         self.client = client
 
+    @property
+    def token_hash(self):
+        """
+        Identifies the user in cache keys without storing their SSO token.
+        """
+        return hashlib.sha256(str(self.client.token).encode()).hexdigest()
+
     def list(self, **kwargs) -> ModelList:
         response_data = self.client.get(self.resource_name, params=kwargs)
         return ModelList(
@@ -89,6 +106,80 @@ class BarriersResource(APIResource):
     resource_name = "barriers"
     model = Barrier
 
+    @property
+    def search_cache_prefix(self):
+        return f"barrier_search:{self.token_hash}"
+
+    def get_cache_generation(self):
+        """
+        Changes whenever the user edits anything, so they never
+        see their own stale results.
+        """
+        return cache.get(f"{self.search_cache_prefix}:generation", "0")
+
+    def get_search_cache_key(self, **kwargs):
+        """
+        Key for a page of search results for the current user.
+        """
+        generation = self.get_cache_generation()
+        params = sorted(
+            (key, str(value))
+            for key, value in kwargs.items()
+            if value not in (None, "", [])
+        )
+        params_hash = hashlib.sha256(json.dumps(params).encode()).hexdigest()
+        return f"{self.search_cache_prefix}:{generation}:{params_hash}"
+
+    def list_cached(self, **kwargs) -> ModelList:
+        """
+        Search results cached briefly per user.
+
+        With BARRIER_SEARCH_PREFETCH_NEXT_PAGE the following page
+        is fetched in the background ready for the user to page on.
+        """
+        cache_key = self.get_search_cache_key(**kwargs)
+        cached = cache.get(cache_key)
+        if cached is None:
+            barriers = self.list(**kwargs)
+            cached = (barriers.data, barriers.total_count)
+            cache.set(cache_key, cached, settings.BARRIER_SEARCH_CACHE_TIME)
+        else:
+            data, total_count = cached
+            barriers = ModelList(model=self.model, data=data, total_count=total_count)
+
+        if settings.BARRIER_SEARCH_PREFETCH_NEXT_PAGE:
+            self.prefetch_next_page(barriers.total_count, **kwargs)
+
+        return barriers
+
+    def prefetch_next_page(self, total_count, limit, offset=0, **kwargs):
+        next_offset = offset + limit
+        if next_offset >= total_count:
+            return
+
+        params = {"limit": limit, "offset": next_offset, **kwargs}
+        cache_key = self.get_search_cache_key(**params)
+        if cache.get(cache_key) is not None:
+            return
+
+        def prefetch():
+            try:
+                barriers = self.list(**params)
+            except APIException as e:
+                logger.warning(f"Prefetching barrier search failed: {e}")
+                return
+            cached = (barriers.data, barriers.total_count)
+            cache.set(cache_key, cached, settings.BARRIER_SEARCH_CACHE_TIME)
+
+        run_in_background(prefetch)
+
+    def clear_cached_searches(self):
+        cache.set(
+            f"{self.search_cache_prefix}:generation",
+            uuid.uuid4().hex,
+            settings.BARRIER_SEARCH_CACHE_TIME,
+        )
+
     def get_activity(self, barrier_id, **kwargs):
         url = f"barriers/{barrier_id}/activity"
         return [
@@ -110,6 +201,25 @@ class BarriersResource(APIResource):
             for result in self.client.get(url, params=kwargs)["history"]
         ]
 
+    def get_full_history_cached(self, barrier_id, refresh=False):
+        """
+        The full history sorted newest first, cached briefly per user
+        so loading more of it doesn't fetch and sort it again.
+
+        With refresh the history is always fetched, so the first page
+        shows the latest changes and load more continues from it.
+
+        :return: LIST - raw history item data
+        """
+        cache_key = f"barrier_history:{self.token_hash}:{barrier_id}"
+        history_data = None if refresh else cache.get(cache_key)
+        if history_data is None:
+            full_history = self.get_full_history(barrier_id=barrier_id)
+            full_history.sort(key=lambda object: object.date, reverse=True)
+            history_data = [item.data for item in full_history]
+            cache.set(cache_key, history_data, settings.HISTORY_CACHE_TIME)
+        return history_data
+
     def get_team_members(self, barrier_id, **kwargs):
         url = f"barriers/{barrier_id}/members"
         response_data = self.client.get(url, params=kwargs)
@@ -244,6 +354,10 @@ class NotesResource(APIResource):
 
 
 class DocumentsResource(APIResource):
+    UPLOAD_PENDING = "pending"
+    UPLOAD_CLEAN = "clean"
+    UPLOAD_FAILED = "failed"
+
     def create(self, filename, filesize):
         return self.client.post(
             "documents",
@@ -257,30 +371,73 @@ class DocumentsResource(APIResource):
         return self.client.post(f"documents/{document_id}/upload-callback")
 
     def check_scan_status(self, document_id):
-        max_wait_time = settings.FILE_SCAN_MAX_WAIT_TIME
+        """
+        Waits for the virus scan, checking less often the longer it takes.
+        """
         interval = settings.FILE_SCAN_STATUS_CHECK_INTERVAL
+        deadline = time.monotonic() + settings.FILE_SCAN_MAX_WAIT_TIME / 1000
 
-        url = f"documents/{document_id}/upload-callback"
-        max_attempts = int(max_wait_time / interval)
+        while True:
+            if self.get_scan_status(document_id):
+                return
 
-        for i in range(max_attempts):
-            try:
-                response = self.client.post(url)
-            except requests.exceptions.HTTPError:
-                raise ScanError("Unable to get scan status")
-
-            if response.get("status") == "virus_scanning_failed":
-                raise ScanError("Unable to virus scan the file")
-            elif response.get("status") == "virus_scanned":
-                if "av_clean" not in response or response.get("av_clean") is True:
-                    return
-                raise ScanError(
-                    "This file may be infected with a virus and will not be accepted."
-                )
+            if time.monotonic() + interval / 1000 > deadline:
+                raise ScanError("Virus scan took too long")
 
             time.sleep(interval / 1000)
+            interval = min(interval * 2, settings.FILE_SCAN_MAX_CHECK_INTERVAL)
 
-        raise ScanError("Virus scan took too long")
+    def get_scan_status(self, document_id):
+        """
+        :return: BOOL - True if the file is clean, False if still scanning
+        """
+        url = f"documents/{document_id}/upload-callback"
+        try:
+            response = self.client.post(url)
+        except requests.exceptions.HTTPError:
+            raise ScanError("Unable to get scan status")
+
+        if response.get("status") == "virus_scanning_failed":
+            raise ScanError("Unable to virus scan the file")
+        elif response.get("status") == "virus_scanned":
+            if "av_clean" not in response or response.get("av_clean") is True:
+                return True
+            raise ScanError(
+                "This file may be infected with a virus and will not be accepted."
+            )
+        return False
+
+    def get_upload_status_key(self, document_id):
+        return f"document_upload:{self.token_hash}:{document_id}"
+
+    def get_upload_status(self, document_id):
+        """
+        Progress of a document being uploaded in the background.
+
+        An upload still pending after DOCUMENT_UPLOAD_PENDING_TIMEOUT is
+        treated as failed, as the worker running it may have been restarted.
+
+        :return: DICT - status and message, or None if unknown
+        """
+        upload_status = cache.get(self.get_upload_status_key(document_id))
+        if (
+            upload_status
+            and upload_status["status"] == self.UPLOAD_PENDING
+            and time.time() - upload_status.get("updated_on", 0)
+            > settings.DOCUMENT_UPLOAD_PENDING_TIMEOUT
+        ):
+            return {
+                "status": self.UPLOAD_FAILED,
+                "message": "The selected file could not be uploaded. Try again.",
+            }
+        return upload_status
+
+    def set_upload_status(self, document_id, status, message=""):
+        cache.set(
+            self.get_upload_status_key(document_id),
+            {"status": status, "message": message, "updated_on": time.time()},
+            settings.DOCUMENT_UPLOAD_STATUS_CACHE_TIME,
+        )
 
     def get_download(self, document_id):
         return self.client.get(f"documents/{document_id}/download")
@@ -291,11 +448,19 @@ class UsersResource(APIResource):
     model = User
 
     def get_current(self):
+        return request_memo(self.current_user_key, self.fetch_current)
+
+    def fetch_current(self):
         user_data = self.client.get("whoami")
         self.update_cached_user_data(user_data)
         return self.model(user_data)
 
+    @property
+    def current_user_key(self):
+        return f"whoami:{self.token_hash}"
+
     def patch(self, *args, **kwargs):
+        forget(self.current_user_key)
         user = super().patch(*args, **kwargs)
         self.update_cached_user_data(user.data)
         return user
@@ -350,6 +515,34 @@ class CommoditiesResource(APIResource):
     resource_name = "commodities"
     model = Commodity
 
+    def lookup(self, code):
+        """
+        Returns the commodity for a code, only calling the API when
+        the code isn't in the commodity index.
+        """
+        code = normalise_commodity_code(code)
+        found, missing = lookup_commodities([code])
+        if found:
+            return self.model(found[0])
+
+        commodity = self.get(id=code)
+        remember_commodities([commodity.data])
+        return commodity
+
+    def lookup_many(self, codes):
+        """
+        Returns the commodities for a list of codes, fetching only the
+        codes that aren't in the commodity index from the API.
+        """
+        codes = [normalise_commodity_code(code) for code in codes]
+        found, missing = lookup_commodities(codes)
+        commodities = [self.model(data) for data in found]
+        if missing:
+            fetched = self.list(codes=",".join(missing))
+            remember_commodities([commodity.data for commodity in fetched])
+            commodities.extend(fetched)
+        return commodities
+
 
 class PublicBarrierNotesResource(APIResource):
     resource_name = "public-barrier-notes"
@@ -470,25 +663,48 @@ class MentionResource(APIResource):
 
     def mark_as_read(self, mention_id, *args, **kwargs):
         url = f"mentions/mark-as-read/{mention_id}"
-        return self.model(self.client.get(url))
+        return self.update_mentions(url)
 
     def mark_as_unread(self, mention_id):
         url = f"mentions/mark-as-unread/{mention_id}"
-        return self.model(self.client.get(url))
+        return self.update_mentions(url)
 
     def mark_all_as_read(self):
         url = "mentions/mark-all-as-read"
-        return self.model(self.client.get(url))
+        return self.update_mentions(url)
 
     def mark_all_as_unread(self):
         url = "mentions/mark-all-as-unread"
-        return self.model(self.client.get(url))
+        return self.update_mentions(url)
+
+    def update_mentions(self, url):
+        mention = self.model(self.client.get(url))
+        self.client.user_mention_counts.clear_cached()
+        return mention
 
 
 class UserMentionCountsResource(APIResource):
     resource_name = "mentions/counts"
     model = UserMentionCounts
 
+    @property
+    def cache_key(self):
+        return f"user_mention_counts:{self.token_hash}"
+
+    def get_cached(self):
+        """
+        Counts for the current user, cached briefly as they
+        are shown on every page.
+        """
+        data = cache.get(self.cache_key)
+        if data is None:
+            data = self.get().data
+            cache.set(self.cache_key, data, settings.MENTION_COUNTS_CACHE_TIME)
+        return self.model(data)
+
+    def clear_cached(self):
+        cache.delete(self.cache_key)
+
 
 class NotificationExclusionResource(APIResource):
     resource_name = "mentions/exclude-from-notifications"
@@ -0,0 +1,105 @@
+import os
+import threading
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Verbs that can safely be replayed. A 502 or 504 from a gateway doesn't mean
+# the API didn't act on a request, so writes, even idempotent ones, are never
+# replayed.
+SAFE_METHODS = frozenset(["HEAD", "GET", "OPTIONS"])
+RETRY_STATUS_CODES = (502, 503, 504)
+
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that applies a default (connect, read) timeout
+    to every request that doesn't provide one.
+    """
+
+    def __init__(self, *args, timeout=None, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        if timeout is None:
+            timeout = self.timeout
+        return super().send(request, timeout=timeout, **kwargs)
+
+
+def get_retry():
+    return Retry(
+        total=settings.HTTP_MAX_RETRIES,
+        connect=settings.HTTP_MAX_RETRIES,
+        read=settings.HTTP_MAX_RETRIES,
+        status=settings.HTTP_MAX_RETRIES,
+        allowed_methods=SAFE_METHODS,
+        status_forcelist=RETRY_STATUS_CODES,
+        backoff_factor=settings.HTTP_RETRY_BACKOFF_FACTOR,
+        raise_on_status=False,
+    )
+
+
+def get_adapter(pool_maxsize):
+    return TimeoutHTTPAdapter(
+        timeout=(settings.HTTP_CONNECT_TIMEOUT, settings.HTTP_READ_TIMEOUT),
+        max_retries=get_retry(),
+        pool_connections=settings.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=pool_maxsize,
+        # Never block waiting for a free connection. Under gevent a saturated
+        # pool opens an extra connection which is discarded when returned.
+        pool_block=False,
+    )
+
+
+def build_session():
+    session = requests.Session()
+    # The session is shared by every user in the process, so never
+    # persist cookies set by upstream services between requests.
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+    default_adapter = get_adapter(settings.HTTP_POOL_MAXSIZE)
+    session.mount("http://", default_adapter)
+    session.mount("https://", default_adapter)
+
+    for base_url, pool_maxsize in settings.HTTP_POOL_MAXSIZE_PER_HOST.items():
+        if base_url:
+            session.mount(base_url, get_adapter(pool_maxsize))
+
+    return session
+
+
+def get_session():
+    """
+    Process-wide pooled keep-alive session for outbound API calls.
+
+    urllib3's connection pools are thread safe and, once gunicorn's gevent
+    worker has monkey patched the standard library, greenlet safe too.
+    The session is rebuilt after a fork so workers never share sockets.
+    """
+    global _session, _session_pid
+
+    pid = os.getpid()
+    if _session is None or _session_pid != pid:
+        with _session_lock:
+            if _session is None or _session_pid != pid:
+                _session = build_session()
+                _session_pid = pid
+    return _session
+
+
+def reset_session():
+    global _session, _session_pid
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+        _session_pid = None
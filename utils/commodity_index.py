@@ -0,0 +1,145 @@
+import re
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+from barriers.models.commodities import format_commodity_code
+
+COMMODITY_INDEX_KEY = "commodity_index:{version}"
+COMMODITY_INDEX_VERSION_KEY = "commodity_index:version"
+COMMODITY_KEY = "commodity:{version}:{code}"
+# Seconds a replaced index is kept for workers still loading it
+SUPERSEDED_INDEX_TIMEOUT = 60 * 5
+
+# (version, CommodityIndex) for the copy of the index built by this process
+_local_index = (None, None)
+
+
+def normalise_commodity_code(code):
+    """
+    The HS6 code the API stores a commodity under, padded to 10 digits.
+    """
+    code = re.sub(r"\D", "", str(code))
+    return code[:6].ljust(10, "0")
+
+
+def with_code_display(data):
+    if "code_display" not in data and isinstance(data.get("code"), str):
+        data = {**data, "code_display": format_commodity_code(data["code"])}
+    return data
+
+
+class CommodityIndex:
+    """
+    Commodities keyed by normalised code for in-process lookups.
+    """
+
+    def __init__(self, commodities=()):
+        self.by_code = {}
+        for data in commodities:
+            data = with_code_display(data)
+            self.by_code[data["code"]] = data
+
+    def __len__(self):
+        return len(self.by_code)
+
+    def get(self, code):
+        return self.by_code.get(code)
+
+    def get_many(self, codes):
+        """
+        :return: TUPLE - (list of commodity data, list of unknown codes)
+        """
+        found, missing = [], []
+        for code in dict.fromkeys(codes):
+            data = self.by_code.get(code)
+            if data is None:
+                missing.append(code)
+            else:
+                found.append(data)
+        return found, missing
+
+
+def get_commodity_index():
+    """
+    Returns the version and the commodity index for this process.
+
+    The index is only rebuilt when the version in the cache changes,
+    so the prewarm_commodity_index command refreshes every worker.
+    """
+    global _local_index
+
+    version = cache.get(COMMODITY_INDEX_VERSION_KEY)
+    local_version, index = _local_index
+    if version is None:
+        return None, CommodityIndex()
+
+    if version != local_version:
+        commodities = cache.get(COMMODITY_INDEX_KEY.format(version=version))
+        if commodities is None:
+            return version, CommodityIndex()
+        index = CommodityIndex(commodities)
+        _local_index = (version, index)
+    return version, index
+
+
+def store_commodity_index(commodities):
+    """
+    Saves the full list of commodities under a new version.
+
+    The previous version expires shortly afterwards, rather than being
+    deleted, so workers loading it in the meantime still find it.
+
+    :return: STR - the new version token
+    """
+    previous_version = cache.get(COMMODITY_INDEX_VERSION_KEY)
+    version = uuid.uuid4().hex
+    cache.set(
+        COMMODITY_INDEX_KEY.format(version=version),
+        [with_code_display(data) for data in commodities],
+        timeout=None,
+    )
+    cache.set(COMMODITY_INDEX_VERSION_KEY, version, timeout=None)
+    if previous_version is not None:
+        cache.touch(
+            COMMODITY_INDEX_KEY.format(version=previous_version),
+            SUPERSEDED_INDEX_TIMEOUT,
+        )
+    return version
+
+
+def lookup_commodities(codes):
+    """
+    Finds commodities in the local index, then in the shared cache
+    of codes previously fetched from the API.
+
+    :return: TUPLE - (list of commodity data, list of unknown codes)
+    """
+    version, index = get_commodity_index()
+    found, missing = index.get_many(codes)
+    if not missing:
+        return found, missing
+
+    keys = {COMMODITY_KEY.format(version=version, code=code): code for code in missing}
+    cached = cache.get_many(keys)
+    found.extend(cached.values())
+    return found, [code for key, code in keys.items() if key not in cached]
+
+
+def remember_commodities(commodities):
+    """
+    Shares commodities fetched from the API with other workers until
+    the next version of the index.
+    """
+    version = cache.get(COMMODITY_INDEX_VERSION_KEY)
+    commodities = [with_code_display(data) for data in commodities]
+    cache.set_many(
+        {
+            COMMODITY_KEY.format(version=version, code=data["code"]): data
+            for data in commodities
+            if isinstance(data.get("code"), str)
+        },
+        timeout=settings.COMMODITY_CACHE_TIME,
+    )
+    return commodities
@@ -0,0 +1,137 @@
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import gevent
+from django.conf import settings
+from gevent import monkey
+
+
+class Failure:
+    """
+    Holds an exception raised by a concurrently run task so it can be
+    re-raised in the caller's context when the result is used.
+    """
+
+    def __init__(self, exception):
+        self.exception = exception
+
+
+def is_gevent_active():
+    return monkey.is_module_patched("socket")
+
+
+def capture(func):
+    try:
+        return func()
+    except Exception as e:
+        return Failure(e)
+
+
+def unwrap(result):
+    if isinstance(result, Failure):
+        raise result.exception
+    return result
+
+
+def run_concurrently(tasks):
+    """
+    Call each task concurrently and wait for all of them to finish.
+
+    Uses greenlets when running under gunicorn's gevent worker and a
+    thread pool otherwise. Each task runs in a copy of the caller's
+    context so request scoped context variables are still visible.
+
+    :param tasks: DICT - name -> callable taking no arguments
+    :return: DICT - name -> result, or a Failure if the task raised
+    """
+    if len(tasks) < 2 or not settings.API_CONCURRENT_REQUESTS_ENABLED:
+        return {name: capture(func) for name, func in tasks.items()}
+
+    if is_gevent_active():
+        greenlets = {
+            name: gevent.spawn(contextvars.copy_context().run, capture, func)
+            for name, func in tasks.items()
+        }
+        gevent.joinall(greenlets.values())
+        return {name: greenlet.value for name, greenlet in greenlets.items()}
+
+    max_workers = min(len(tasks), settings.API_CONCURRENT_REQUESTS_MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            name: executor.submit(contextvars.copy_context().run, capture, func)
+            for name, func in tasks.items()
+        }
+    return {name: future.result() for name, future in futures.items()}
+
+
+def run_in_background(func):
+    """
+    Start func without waiting for it to finish.
+
+    :param func: callable taking no arguments
+    """
+    if is_gevent_active():
+        gevent.spawn(func)
+    else:
+        threading.Thread(target=func, daemon=True).start()
+
+
+def iterate_in_context(iterable):
+    """
+    Iterate in a copy of the caller's context.
+
+    Streamed response content is produced after the middleware has reset
+    its request scoped context variables, so wrapping it keeps the request
+    cache and trace available while the content is rendered.
+    """
+    context = contextvars.copy_context()
+    iterator = iter(iterable)
+
+    def iterate():
+        while True:
+            try:
+                yield context.run(next, iterator)
+            except StopIteration:
+                return
+
+    return iterate()
+
+
+class InFlightCall:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = Failure(RuntimeError("Coalesced call did not finish"))
+
+
+_in_flight = {}
+_in_flight_lock = threading.Lock()
+
+
+def coalesce(key, func):
+    """
+    Call func, sharing the result with identical calls made while it runs.
+
+    Callers using a key which is already in flight in this process wait
+    for that call to finish rather than repeating it.
+
+    :param key: identifies calls which return the same result
+    :param func: callable taking no arguments
+    """
+    with _in_flight_lock:
+        call = _in_flight.get(key)
+        is_leader = call is None
+        if is_leader:
+            call = _in_flight[key] = InFlightCall()
+
+    if is_leader:
+        try:
+            call.result = capture(func)
+        finally:
+            with _in_flight_lock:
+                del _in_flight[key]
+            call.done.set()
+    else:
+        call.done.wait()
+
+    return unwrap(call.result)
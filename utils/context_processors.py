@@ -3,14 +3,32 @@ import logging
 from django.conf import settings
 from django.core.cache import cache
 from django.urls import reverse
+from django.utils.functional import SimpleLazyObject
 
 from users.models import User
 from utils.api.client import MarketAccessAPIClient
 from utils.exceptions import APIHttpException
+from utils.tracing import count_trace_field, trace
 
 logger = logging.getLogger(__name__)
 
 
+def lazy_value(name, func):
+    """
+    Defers func until the value is first used by a template or view.
+
+    Each resolution is counted and timed against the request trace,
+    so the request log shows which lazy values were used.
+    """
+
+    def resolve():
+        count_trace_field(f"lazy_{name}")
+        with trace("lazy", name):
+            return func()
+
+    return SimpleLazyObject(resolve)
+
+
 def get_user(request):
     user_id = request.session.get("user_data", {}).get("id")
     if not user_id:
@@ -42,7 +60,7 @@ def get_mention_counts(request):
     client = MarketAccessAPIClient(sso_token)
 
     try:
-        resource = client.user_mention_counts.get()
+        resource = client.user_mention_counts.get_cached()
         unread_count = resource.total - resource.read_by_recipient
         counts["total"] = resource.total
         counts["read_by_recipient"] = resource.read_by_recipient
@@ -56,7 +74,7 @@ def get_mention_counts(request):
 
 
 def user_scope(request):
-    user = get_user(request)
+    user = lazy_value("current_user", lambda: get_user(request))
 
     return {
         "current_user": user,
@@ -64,7 +82,13 @@ def user_scope(request):
 
 
 def user_mention_counts(request):
-    counts = get_mention_counts(request)
+    if settings.MENTION_COUNTS_ASYNC and request.session.get("sso_token"):
+        return {
+            "user_mention_counts": None,
+            "user_mention_counts_url": reverse("users:mention_counts"),
+        }
+
+    counts = lazy_value("user_mention_counts", lambda: get_mention_counts(request))
 
     return {
         "user_mention_counts": counts,
@@ -5,7 +5,9 @@ from django.conf import settings
 from mohawk import Sender
 
 from barriers.models import Company
+from utils.api.transport import get_session
 from utils.exceptions import APIHttpException, DataHubException
+from utils.tracing import trace
 
 
 class DatahubClient:
@@ -28,9 +30,10 @@ class DatahubClient:
             always_hash_content=False,
         )
         headers = {"Authorization": sender.request_header}
-        response = getattr(requests, method)(
-            url, verify=not settings.DEBUG, headers=headers, json=kwargs
-        )
+        with trace("datahub", f"{method.upper()} {path}"):
+            response = get_session().request(
+                method, url, verify=not settings.DEBUG, headers=headers, json=kwargs
+            )
         try:
             response.raise_for_status()
         except requests.exceptions.HTTPError as e:
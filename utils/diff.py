@@ -76,6 +76,9 @@ class diff_match_patch:
     DIFF_INSERT = 1
     DIFF_EQUAL = 0
 
+    # A word and the whitespace after it, or leading whitespace
+    WORD_REGEX = re.compile(r"\S+\s*|\s+")
+
     def diff_main(self, text1, text2, checklines=True, deadline=None):
         """Find the differences between two texts.  Simplifies the problem by
           stripping any common prefix or suffix off the texts before diffing.
@@ -447,6 +450,65 @@ class diff_match_patch:
         chars2 = diff_linesToCharsMunge(text2)
         return (chars1, chars2, lineArray)
 
+    def diff_wordsToChars(self, text1, text2):
+        """Split two texts into an array of words.  Reduce the texts to a string
+        of hashes where each Unicode character represents one word, including
+        any whitespace that follows it.  Like diff_linesToChars but suited to
+        prose that has few or no line breaks.
+
+        Args:
+          text1: First string.
+          text2: Second string.
+
+        Returns:
+          Three element tuple, containing the encoded text1, the encoded text2 and
+          the array of unique strings.  The zeroth element of the array of unique
+          strings is intentionally blank.
+        """
+        wordArray = [""]  # e.g. wordArray[4] == "Hello "
+        wordHash = {}  # e.g. wordHash["Hello "] == 4
+
+        def diff_wordsToCharsMunge(text, maxWords):
+            chars = []
+            for match in self.WORD_REGEX.finditer(text):
+                word = match.group()
+                if word not in wordHash:
+                    if len(wordArray) == maxWords:
+                        # Bail out at 1114111 because chr(1114112) throws.
+                        word = text[match.start() :]
+                        wordArray.append(word)
+                        wordHash[word] = len(wordArray) - 1
+                        chars.append(chr(wordHash[word]))
+                        break
+                    wordArray.append(word)
+                    wordHash[word] = len(wordArray) - 1
+                chars.append(chr(wordHash[word]))
+            return "".join(chars)
+
+        # Allocate 2/3rds of the space for text1, the rest for text2.
+        chars1 = diff_wordsToCharsMunge(text1, 666666)
+        chars2 = diff_wordsToCharsMunge(text2, 1114111)
+        return (chars1, chars2, wordArray)
+
+    def diff_wordMode(self, text1, text2, deadline=None):
+        """Do a quick word-level diff on both strings, treating each word and
+        its trailing whitespace as a single token.  Much faster than a
+        character diff on long paragraphs, at the cost of granularity.
+
+        Args:
+          text1: Old string to be diffed.
+          text2: New string to be diffed.
+          deadline: Optional time when the diff should be complete by.
+
+        Returns:
+          Array of changes.
+        """
+        chars1, chars2, wordArray = self.diff_wordsToChars(text1, text2)
+        diffs = self.diff_main(chars1, chars2, False, deadline)
+        self.diff_charsToLines(diffs, wordArray)
+        self.diff_cleanupMerge(diffs)
+        return diffs
+
     def diff_charsToLines(self, diffs, lineArray):
         """Rehydrate the text in a diff from a string of line hashes to real lines
         of text.
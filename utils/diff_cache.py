@@ -0,0 +1,90 @@
+import hashlib
+import json
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.html import escape
+
+from utils.diff import diff_match_patch
+from utils.tracing import count_trace_field, trace
+
+logger = logging.getLogger(__name__)
+
+TOO_LARGE_TO_DIFF = "Changed (too large to diff)"
+# Bump when the way diffs are computed or rendered changes
+DIFF_MODE = "word"
+
+
+def get_diff_cache_key(old_value, new_value):
+    """
+    Cache key for the diff of two values with the current diff settings,
+    so changing them doesn't serve diffs computed under the old ones.
+    """
+    content = json.dumps([old_value, new_value], default=str)
+    content_hash = hashlib.sha256(content.encode()).hexdigest()
+    return (
+        f"history_diff:{DIFF_MODE}:{settings.HISTORY_DIFF_MAX_LENGTH}:"
+        f"{settings.HISTORY_DIFF_TIMEOUT}:{content_hash}"
+    )
+
+
+def get_too_large_html(new_value):
+    return f"<em>{TOO_LARGE_TO_DIFF}</em>\n{escape(new_value)}"
+
+
+def compute_diff_html(old_value, new_value):
+    """
+    Returns the word level HTML diff between two values.
+
+    Gives up if the values are longer than HISTORY_DIFF_MAX_LENGTH
+    or the diff takes longer than HISTORY_DIFF_TIMEOUT seconds.
+
+    :return: TUPLE - (diff html, whether the deadline was hit)
+    """
+    if len(old_value) + len(new_value) > settings.HISTORY_DIFF_MAX_LENGTH:
+        return get_too_large_html(new_value), False
+
+    dmp = diff_match_patch()
+    deadline = time.time() + settings.HISTORY_DIFF_TIMEOUT
+    diffs = dmp.diff_wordMode(old_value, new_value, deadline)
+    if time.time() > deadline:
+        return get_too_large_html(new_value), True
+
+    dmp.diff_cleanupSemantic(diffs)
+    return dmp.diff_prettyHtml(diffs), False
+
+
+def get_diff_html(old_value, new_value):
+    """
+    Returns the HTML diff between two values.
+
+    Diffs are cached by a hash of the values, so identical
+    changes are only computed once across all workers. Cache hits
+    and misses, and the time taken by computed diffs, are recorded
+    against the request trace.
+    """
+    old_value = old_value or ""
+    new_value = new_value or ""
+    cache_key = get_diff_cache_key(old_value, new_value)
+
+    diff_html = cache.get(cache_key)
+    if diff_html is not None:
+        count_trace_field("history_diff_cache_hits")
+        return diff_html
+
+    count_trace_field("history_diff_cache_misses")
+
+    start = time.monotonic()
+    with trace("diff", "history diff"):
+        diff_html, timed_out = compute_diff_html(old_value, new_value)
+    logger.debug(f"Computed history diff in {time.monotonic() - start:.3f}s")
+
+    if timed_out:
+        # A slow or busy worker shouldn't hide the diff from everyone else
+        logger.info("History diff timed out")
+        return diff_html
+
+    cache.set(cache_key, diff_html, settings.HISTORY_DIFF_CACHE_TIME)
+    return diff_html
@@ -4,6 +4,7 @@ import os
 
 import magic
 from django import forms
+from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.template.defaultfilters import filesizeformat
 
@@ -78,7 +79,12 @@ class RestrictedFileField(forms.FileField):
         if not data:
             return
 
-        content_type = magic.from_buffer(data.file.read(), mime=True)
+        if data.size > self.max_upload_size:
+            raise forms.ValidationError(
+                f"The selected file must be smaller than {filesizeformat(self.max_upload_size)}"
+            )
+
+        content_type = self.get_content_type(data)
         extension = os.path.splitext(data.name)[1]
         allowed_extensions = self.get_allowed_extensions()
 
@@ -90,13 +96,17 @@ class RestrictedFileField(forms.FileField):
                 f"The selected file must be a {', '.join(allowed_extensions)}"
             )
 
-        if data.size > self.max_upload_size:
-            raise forms.ValidationError(
-                f"The selected file must be smaller than {filesizeformat(self.max_upload_size)}"
-            )
-
         return data
 
+    def get_content_type(self, data):
+        """
+        Detect the mimetype from the start of the file only
+        """
+        data.seek(0)
+        header = data.read(settings.FILE_TYPE_SNIFF_SIZE)
+        data.seek(0)
+        return magic.from_buffer(header, mime=True)
+
 
 class ChoiceFieldWithHelpText(HelpTextMixin, forms.ChoiceField):
     pass
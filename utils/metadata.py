@@ -1,14 +1,23 @@
 import json
+import logging
+import threading
+import time
+import uuid
+from functools import cached_property
 from operator import itemgetter
 
 import redis
-import requests
 from django.conf import settings
 from mohawk import Sender
+from redis.exceptions import LockError
 
 from barriers.constants import DEPRECATED_TAGS, Statuses
 from core.filecache import memfiles
+from utils.api.transport import get_session
+from utils.concurrency import coalesce, run_in_background
 from utils.exceptions import HawkException
+from utils.request_cache import request_memo
+from utils.tracing import trace
 
 if settings.DJANGO_ENV == "test":
     redis_client = None
@@ -16,16 +25,186 @@ else:
     redis_client = redis.Redis.from_url(url=settings.REDIS_URI)
 
 
+METADATA_KEY = "metadata"
+METADATA_VERSION_KEY = "metadata:version"
+# Present while the stored metadata is fresh, expires after METADATA_CACHE_TIME
+METADATA_FRESH_KEY = "metadata:fresh"
+METADATA_LOCK_KEY = "metadata:lock"
+METADATA_METRICS_KEY = "metadata:metrics"
+
+logger = logging.getLogger(__name__)
+
+# (version, Metadata) for the copy of the metadata parsed by this process
+_local_metadata = (None, None)
+# Held while this process is refreshing the metadata in the background
+_refreshing = threading.Lock()
+# Stale serves counted by this process since they were last added to redis
+_stale_serves = 0
+_stale_serves_lock = threading.Lock()
+# name -> function building that set of choices from the metadata
+_choice_builders = {}
+
+
 def get_metadata():
+    """
+    Returns the parsed metadata, loading it at most once per request.
+    """
+    return request_memo("metadata", load_metadata)
+
+
+def load_metadata():
+    """
+    Returns the parsed metadata, holding it in process memory.
+
+    Redis stores the raw metadata alongside a version token. The version
+    is checked on each call and the blob is only read and parsed again
+    when it changes, e.g. after the cache expires or is cleared.
+
+    Once the metadata is stale it is still served while a single worker
+    refreshes it in the background.
+    """
+    global _local_metadata
+
     if settings.DJANGO_ENV == "test":
         # we're testing and have no access to the API, so use the fixture.
         file = f"{settings.BASE_DIR}/../core/fixtures/metadata.json"
         return Metadata(json.loads(memfiles.open(file)))
 
-    metadata = redis_client.get("metadata")
-    if metadata:
-        return Metadata(json.loads(metadata))
+    local_version, metadata = _local_metadata
+    with trace("redis", "metadata version"):
+        version, fresh = redis_client.mget(METADATA_VERSION_KEY, METADATA_FRESH_KEY)
+
+    if version is None or version != local_version:
+        # Read both keys together so the blob always matches its version
+        with trace("redis", "metadata"):
+            version, raw_metadata = redis_client.mget(
+                METADATA_VERSION_KEY, METADATA_KEY
+            )
+        if not raw_metadata or version is None:
+            version, data = load_missing_metadata()
+            metadata = Metadata(data)
+            _local_metadata = (version, metadata)
+            return metadata
+
+        metadata = Metadata(json.loads(raw_metadata))
+        _local_metadata = (version, metadata)
+
+    if not fresh:
+        count_stale_serve()
+        refresh_metadata_in_background()
+
+    return metadata
+
+
+def load_missing_metadata():
+    """
+    Fetches the metadata when there is no copy in redis at all.
+
+    Requests in this process share a single load. Only one worker calls
+    the API, the others wait briefly for it to store the result and then
+    fetch it themselves.
+
+    :return: TUPLE - (version, raw metadata)
+    """
+    return coalesce("metadata:missing", wait_for_missing_metadata)
+
+
+def wait_for_missing_metadata():
+    refreshed = refresh_metadata()
+    if refreshed:
+        return refreshed
+
+    deadline = time.monotonic() + settings.METADATA_MISSING_WAIT_TIME
+    while time.monotonic() < deadline:
+        time.sleep(0.1)
+        version, raw_metadata = redis_client.mget(METADATA_VERSION_KEY, METADATA_KEY)
+        if raw_metadata and version is not None:
+            return version, json.loads(raw_metadata)
+
+    data = fetch_metadata()
+    return store_metadata(data), data
+
+
+def refresh_metadata():
+    """
+    Fetches and stores the metadata unless another worker already is.
+
+    :return: TUPLE - (version, raw metadata) or None if the lock is held
+    """
+    lock = redis_client.lock(
+        METADATA_LOCK_KEY, timeout=settings.METADATA_REFRESH_LOCK_TIMEOUT
+    )
+    if not lock.acquire(blocking=False):
+        return None
+
+    try:
+        start = time.monotonic()
+        data = fetch_metadata()
+        version = store_metadata(data)
+        duration = time.monotonic() - start
+    finally:
+        try:
+            lock.release()
+        except LockError:
+            # The lock timed out and may now belong to another worker
+            pass
+
+    logger.info(f"Metadata refreshed in {duration:.3f}s")
+    pipeline = redis_client.pipeline()
+    pipeline.hincrby(METADATA_METRICS_KEY, "refreshes", 1)
+    pipeline.hincrbyfloat(METADATA_METRICS_KEY, "refresh_seconds_total", duration)
+    pipeline.hset(METADATA_METRICS_KEY, "last_refresh_seconds", duration)
+    pipeline.execute()
+    return version, data
+
+
+def count_stale_serve():
+    global _stale_serves
+
+    with _stale_serves_lock:
+        _stale_serves += 1
+
+
+def flush_stale_serves():
+    """
+    Adds the stale serves counted by this process to the metrics in redis,
+    so serving stale metadata doesn't write to redis on every request.
+    """
+    global _stale_serves
 
+    with _stale_serves_lock:
+        count, _stale_serves = _stale_serves, 0
+    if count:
+        redis_client.hincrby(METADATA_METRICS_KEY, "stale_serves", count)
+
+
+def refresh_metadata_in_background():
+    if not _refreshing.acquire(blocking=False):
+        return
+
+    def refresh():
+        try:
+            refresh_metadata()
+        except Exception:
+            logger.exception("Metadata refresh failed, serving stale metadata")
+        finally:
+            try:
+                flush_stale_serves()
+            finally:
+                _refreshing.release()
+
+    run_in_background(refresh)
+
+
+def get_metadata_metrics(client=None):
+    client = client or redis_client
+    return {
+        key.decode(): float(value)
+        for key, value in client.hgetall(METADATA_METRICS_KEY).items()
+    }
+
+
+def fetch_metadata():
     url = f"{settings.MARKET_ACCESS_API_URI}metadata"
     sender = Sender(
         settings.MARKET_ACCESS_API_HAWK_CREDS,
@@ -36,7 +215,7 @@ def get_metadata():
         always_hash_content=False,
     )
 
-    response = requests.get(
+    response = get_session().get(
         url,
         verify=not settings.DEBUG,
         headers={
@@ -48,9 +227,48 @@ def get_metadata():
     if not response.ok:
         raise HawkException(f"Call to fetch metadata failed {response}")
 
-    metadata = response.json()
-    redis_client.set("metadata", json.dumps(metadata), ex=settings.METADATA_CACHE_TIME)
-    return Metadata(metadata)
+    return response.json()
+
+
+def store_metadata(data, client=None):
+    """
+    Saves the metadata to redis under a new version.
+
+    The metadata is kept for METADATA_STALE_TIME after it goes
+    stale so it can be served while it is refreshed.
+
+    :return: BYTES - the new version token
+    """
+    client = client or redis_client
+    version = uuid.uuid4().hex.encode()
+    expiry = settings.METADATA_CACHE_TIME + settings.METADATA_STALE_TIME
+    pipeline = client.pipeline()
+    pipeline.set(METADATA_KEY, json.dumps(data), ex=expiry)
+    pipeline.set(METADATA_VERSION_KEY, version, ex=expiry)
+    pipeline.set(METADATA_FRESH_KEY, 1, ex=settings.METADATA_CACHE_TIME)
+    pipeline.execute()
+    return version
+
+
+def expire_metadata_cache(client=None):
+    """
+    Marks the cached metadata as stale so it is refreshed in the
+    background while the current copy is still served.
+    """
+    client = client or redis_client
+    client.delete(METADATA_FRESH_KEY)
+
+
+def clear_metadata_cache(client=None):
+    """
+    Removes the cached metadata and its version so every worker
+    discards its local copy and the metadata is fetched again.
+    """
+    global _local_metadata
+
+    client = client or redis_client
+    client.delete(METADATA_KEY, METADATA_VERSION_KEY, METADATA_FRESH_KEY)
+    _local_metadata = (None, None)
 
 
 class Metadata:
@@ -98,14 +316,150 @@ class Metadata:
 
     def __init__(self, data):
         self.data = data
+        self._choices = {}
+
+    @staticmethod
+    def index(records, key="id", stringify=False, condition=None):
+        """
+        Build a lookup of records by key, keeping the first match like
+        the linear scans it replaces.
+        """
+        lookup = {}
+        for record in records:
+            if condition is None or condition(record):
+                record_key = str(record[key]) if stringify else record[key]
+                lookup.setdefault(record_key, record)
+        return lookup
+
+    @cached_property
+    def admin_areas_by_id(self):
+        return self.index(
+            self.data["admin_areas"],
+            condition=lambda admin_area: admin_area["disabled_on"] is None,
+        )
+
+    @cached_property
+    def admin_areas_by_country_id(self):
+        admin_areas_by_country_id = {}
+        for admin_area in self.data["admin_areas"]:
+            admin_areas_by_country_id.setdefault(
+                admin_area["country"]["id"], []
+            ).append(admin_area)
+        return admin_areas_by_country_id
+
+    @cached_property
+    def countries_with_admin_areas(self):
+        return [
+            {
+                "id": admin_areas[0]["country"]["id"],
+                "name": admin_areas[0]["country"]["name"],
+            }
+            for admin_areas in self.admin_areas_by_country_id.values()
+        ]
+
+    @cached_property
+    def countries_by_id(self):
+        return self.index(self.data["countries"])
+
+    @cached_property
+    def overseas_regions(self):
+        return sorted(self.data["overseas_regions"], key=itemgetter("name"))
+
+    @cached_property
+    def overseas_regions_by_id(self):
+        return self.index(self.overseas_regions, stringify=True)
+
+    @cached_property
+    def sectors_by_id(self):
+        return self.index(self.data.get("sectors", []))
+
+    @cached_property
+    def sectors_by_level(self):
+        sectors_by_level = {None: []}
+        for sector in self.data.get("sectors", []):
+            if sector["disabled_on"] is None:
+                sectors_by_level[None].append(sector)
+                sectors_by_level.setdefault(sector["level"], []).append(sector)
+        return sectors_by_level
+
+    @cached_property
+    def status_info(self):
+        status_info = {
+            status_id: dict(info) for status_id, info in self.STATUS_INFO.items()
+        }
+        for id, name in self.data["barrier_status"].items():
+            if id == "1":
+                continue
+            status_info[id]["id"] = id
+            status_info[id]["name"] = name
+        return status_info
+
+    @cached_property
+    def priorities_by_code(self):
+        return self.index(self.data["barrier_priorities"], key="code")
+
+    @cached_property
+    def policy_teams(self):
+        """
+        Deduped policy teams in their original order
+        """
+        return list(self.index(self.data.get("policy_teams"), key="id").values())
+
+    @cached_property
+    def sorted_policy_teams(self):
+        return sorted(self.policy_teams, key=itemgetter("title"))
+
+    @cached_property
+    def policy_teams_by_id(self):
+        return self.index(self.data["policy_teams"], stringify=True)
+
+    @cached_property
+    def report_stages(self):
+        # filter out "Add a barrier" as that's not a valid stage
+        exclude_stages = ("Add a barrier",)
+        return {
+            key: value
+            for key, value in self.data.get("report_stages", {}).items()
+            if value not in exclude_stages
+        }
+
+    @cached_property
+    def barrier_tags(self):
+        tags = self.data.get("barrier_tags", [])
+        return sorted(tags, key=lambda k: k["order"])
+
+    @cached_property
+    def barrier_tags_by_id(self):
+        return self.index(self.barrier_tags, stringify=True)
+
+    @cached_property
+    def trading_blocs_by_code(self):
+        return self.index(self.get_trading_bloc_list(), key="code")
+
+    @cached_property
+    def trading_blocs_by_country_id(self):
+        trading_blocs_by_country_id = {}
+        for trading_bloc in self.get_trading_bloc_list():
+            for country_id in trading_bloc["country_ids"]:
+                trading_blocs_by_country_id.setdefault(
+                    country_id,
+                    {
+                        "code": trading_bloc["code"],
+                        "name": trading_bloc["name"],
+                        "short_name": trading_bloc["short_name"],
+                    },
+                )
+        return trading_blocs_by_country_id
+
+    @cached_property
+    def gov_organisations_by_id(self):
+        return self.index(self.get_gov_organisations(), stringify=True)
 
     def get_admin_area_list(self):
         return self.data["admin_areas"]
 
     def get_admin_area(self, admin_area_id):
-        for admin_area in self.data["admin_areas"]:
-            if admin_area["id"] == admin_area_id and admin_area["disabled_on"] is None:
-                return admin_area
+        return self.admin_areas_by_id.get(admin_area_id)
 
     def get_admin_areas(self, admin_area_ids):
         """
@@ -121,30 +475,13 @@ class Metadata:
         return admin_areas
 
     def get_admin_areas_by_country(self, country_id):
-        return [
-            admin_area
-            for admin_area in self.data["admin_areas"]
-            if admin_area["country"]["id"] == country_id
-        ]
+        return list(self.admin_areas_by_country_id.get(country_id, []))
 
     def get_countries_with_admin_areas_list(self):
-        countries_list = []
-        results_list = []
-        for admin_area in self.data["admin_areas"]:
-            if admin_area["country"]["id"] not in countries_list:
-                countries_list.append(admin_area["country"]["id"])
-                results_list.append(
-                    {
-                        "id": admin_area["country"]["id"],
-                        "name": admin_area["country"]["name"],
-                    }
-                )
-        return results_list
+        return list(self.countries_with_admin_areas)
 
     def get_country(self, country_id):
-        for country in self.data["countries"]:
-            if country["id"] == country_id:
-                return country
+        return self.countries_by_id.get(country_id)
 
     def get_country_list(self):
         return self.data["countries"]
@@ -153,14 +490,10 @@ class Metadata:
         return [(country["id"], country["name"]) for country in self.get_country_list()]
 
     def get_overseas_region_list(self):
-        self.data["overseas_regions"].sort(key=itemgetter("name"))
-        return self.data["overseas_regions"]
+        return list(self.overseas_regions)
 
     def get_overseas_region_by_id(self, region_id):
-        for region in self.get_overseas_region_list():
-            if region["id"] == str(region_id):
-                return region
-        return None
+        return self.overseas_regions_by_id.get(str(region_id))
 
     def get_overseas_region_choices(self):
         return [
@@ -168,9 +501,7 @@ class Metadata:
         ]
 
     def get_sector(self, sector_id):
-        for sector in self.data.get("sectors", []):
-            if sector["id"] == sector_id:
-                return sector
+        return self.sectors_by_id.get(sector_id)
 
     def get_sectors(self, sector_ids):
         """
@@ -186,19 +517,15 @@ class Metadata:
         return sectors
 
     def get_sectors_by_ids(self, sector_ids):
+        sector_ids = set(sector_ids)
         return [
             sector
-            for sector in self.data.get("sectors", [])
-            if sector["id"] in sector_ids and sector["disabled_on"] is None
+            for sector in self.sectors_by_level[None]
+            if sector["id"] in sector_ids
         ]
 
     def get_sector_list(self, level=None):
-        return [
-            sector
-            for sector in self.data["sectors"]
-            if (level is None or sector["level"] == level)
-            and sector["disabled_on"] is None
-        ]
+        return list(self.sectors_by_level.get(level, []))
 
     def get_sector_choices(self, level=None):
         return [
@@ -206,13 +533,8 @@ class Metadata:
         ]
 
     def get_status(self, status_id):
-        for id, name in self.data["barrier_status"].items():
-            if id == "1":
-                continue
-            self.STATUS_INFO[id]["id"] = id
-            self.STATUS_INFO[id]["name"] = name
-
-        return self.STATUS_INFO[status_id]
+        # Return a copy as callers add barrier specific details to it
+        return dict(self.status_info[status_id])
 
     def get_status_text(
         self,
@@ -220,8 +542,8 @@ class Metadata:
         sub_status=None,
         sub_status_other=None,
     ):
-        if status_id in self.STATUS_INFO.keys():
-            return self.get_status(status_id)["name"]
+        if status_id in self.status_info:
+            return self.status_info[status_id]["name"]
         return status_id
 
     def get_status_choices(self):
@@ -246,30 +568,18 @@ class Metadata:
         if priority_code == "None":
             priority_code = "UNKNOWN"
 
-        for priority in self.data["barrier_priorities"]:
-            if priority["code"] == priority_code:
-                return priority
+        return self.priorities_by_code.get(priority_code)
 
     def get_policy_team_list(self, sort=True):
         """
         Dedupe and sort the policy teams
         """
-        ids = []
-        unique_policy_teams = []
-        for policy_team in self.data.get("policy_teams"):
-            if policy_team["id"] not in ids:
-                unique_policy_teams.append(policy_team)
-                ids.append(policy_team["id"])
-
         if sort:
-            unique_policy_teams.sort(key=itemgetter("title"))
-
-        return unique_policy_teams
+            return list(self.sorted_policy_teams)
+        return list(self.policy_teams)
 
     def get_policy_team(self, policy_team_id):
-        for policy_team in self.data["policy_teams"]:
-            if str(policy_team["id"]) == str(policy_team_id):
-                return policy_team
+        return self.policy_teams_by_id.get(str(policy_team_id))
 
     def get_economic_assessment_impact(self):
         return self.data.get("economic_assessment_impact", {})
@@ -287,23 +597,12 @@ class Metadata:
         return self.data.get("strategic_assessment_scale", {})
 
     def get_report_stages(self):
-        stages = self.data.get("report_stages", {})
-        # filter out "Add a barrier" as that's not a valid stage
-        exclude_stages = ("Add a barrier",)
-        remove_keys = []
-        for key, value in stages.items():
-            if value in exclude_stages:
-                remove_keys.append(key)
-
-        for key in remove_keys:
-            stages.pop(key)
-
-        return stages
+        return dict(self.report_stages)
 
     def get_barrier_tag(self, tag_id):
-        for tag in self.get_barrier_tags():
-            if str(tag["id"]) == str(tag_id):
-                return tag
+        tag = self.barrier_tags_by_id.get(str(tag_id))
+        if tag is not None:
+            return tag
         return {
             "id": tag_id,
             "title": "[unknown tag]",
@@ -313,8 +612,7 @@ class Metadata:
         }
 
     def get_barrier_tags(self):
-        tags = self.data.get("barrier_tags", [])
-        return sorted(tags, key=lambda k: k["order"])
+        return list(self.barrier_tags)
 
     def get_barrier_tag_choices(self, list_use):
         """
@@ -363,21 +661,15 @@ class Metadata:
         return (td for td in self.get_trade_direction(all_items=True))
 
     def get_trading_bloc(self, code):
-        for trading_bloc in self.get_trading_bloc_list():
-            if trading_bloc["code"] == code:
-                return trading_bloc
+        return self.trading_blocs_by_code.get(code)
 
     def get_trading_bloc_list(self):
         return self.data.get("trading_blocs", [])
 
     def get_trading_bloc_by_country_id(self, country_id):
-        for trading_bloc in self.get_trading_bloc_list():
-            if country_id in trading_bloc["country_ids"]:
-                return {
-                    "code": trading_bloc["code"],
-                    "name": trading_bloc["name"],
-                    "short_name": trading_bloc["short_name"],
-                }
+        trading_bloc = self.trading_blocs_by_country_id.get(country_id)
+        if trading_bloc:
+            return dict(trading_bloc)
 
     def is_trading_bloc_code(self, code):
         return self.get_trading_bloc(code) is not None
@@ -398,12 +690,10 @@ class Metadata:
         return dict(self.get_gov_organisation_choices())
 
     def get_government_organisation(self, org_id):
-        for org in self.get_gov_organisations():
-            if str(org["id"]) == str(org_id):
-                return org
+        return self.gov_organisations_by_id.get(str(org_id))
 
     def get_gov_organisations_by_ids(self, list_of_ids):
-        list_of_ids = [str(id) for id in list_of_ids]
+        list_of_ids = {str(id) for id in list_of_ids}
         return (
             org for org in self.get_gov_organisations() if str(org["id"]) in list_of_ids
         )
@@ -414,7 +704,114 @@ class Metadata:
                 return status
 
     def get_search_ordering_choices(self):
-        return self.data["search_ordering_choices"]
+        return list(self.data["search_ordering_choices"])
+
+    def get_choices(self, name):
+        """
+        Returns a registered set of choices as nested tuples.
+
+        Each set is built once per version of the metadata and shared by
+        every form using it, so the result must not be modified.
+        """
+        try:
+            return self._choices[name]
+        except KeyError:
+            choices = freeze_choices(_choice_builders[name](self))
+            return self._choices.setdefault(name, choices)
+
+
+def register_choices(name):
+    """
+    Decorator registering a function that builds a set of choices from
+    the metadata, available through Metadata.get_choices(name).
+    """
+
+    def decorator(func):
+        _choice_builders[name] = func
+        return func
+
+    return decorator
+
+
+def freeze_choices(choices):
+    if isinstance(choices, str):
+        return choices
+    try:
+        return tuple(freeze_choices(choice) for choice in choices)
+    except TypeError:
+        return choices
+
+
+@register_choices("countries")
+def country_choices(metadata):
+    return metadata.get_country_choices()
+
+
+@register_choices("trading_blocs")
+def trading_bloc_choices(metadata):
+    return (
+        (trading_bloc["code"], trading_bloc["name"])
+        for trading_bloc in metadata.get_trading_bloc_list()
+    )
+
+
+@register_choices("locations")
+def location_choices(metadata):
+    return (
+        ("Trading blocs", metadata.get_choices("trading_blocs")),
+        ("Countries", metadata.get_choices("countries")),
+    )
+
+
+@register_choices("sectors")
+def sector_choices(metadata):
+    return metadata.get_sector_choices(level=0)
+
+
+@register_choices("admin_areas_by_country")
+def admin_areas_by_country_choices(metadata):
+    """
+    The admin area choices of each country which has admin areas,
+    as (country name, choices) pairs.
+    """
+    return (
+        (
+            country["name"],
+            (
+                (admin_area["id"], admin_area["name"])
+                for admin_area in metadata.get_admin_areas_by_country(country["id"])
+            ),
+        )
+        for country in metadata.get_countries_with_admin_areas_list()
+    )
+
+
+@register_choices("overseas_regions")
+def overseas_region_choices(metadata):
+    return metadata.get_overseas_region_choices()
+
+
+@register_choices("policy_teams")
+def policy_team_choices(metadata):
+    return (
+        (policy_team["id"], policy_team["title"])
+        for policy_team in metadata.get_policy_team_list()
+    )
+
+
+@register_choices("gov_organisations")
+def gov_organisation_choices(metadata):
+    return metadata.get_gov_organisation_choices()
+
+
+@register_choices("trade_directions")
+def trade_direction_choices(metadata):
+    return metadata.get_trade_direction_choices()
+
+
+@register_choices("edit_tags")
+def edit_tag_choices(metadata):
+    return metadata.get_barrier_tag_choices("edit")
 
 
 class MetadataMixin:
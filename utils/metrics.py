@@ -0,0 +1,67 @@
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class LatencyWindow:
+    """
+    Durations of the most recent calls in this process, for percentiles.
+
+    Sampled percentiles are only recomputed every sample_every observations,
+    so they can be reported on each call without sorting the window. None is
+    reported until the first sample_every observations have been made, so a
+    single cold start isn't reported as the percentile.
+    """
+
+    def __init__(self, size=1000, sample_every=100):
+        self.durations = deque(maxlen=size)
+        self.sample_every = sample_every
+        self.observations = 0
+        self.samples = {}
+        self.lock = threading.Lock()
+
+    def observe(self, seconds):
+        with self.lock:
+            self.durations.append(seconds)
+            self.observations += 1
+
+    @contextmanager
+    def time(self):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(time.monotonic() - start)
+
+    def percentile(self, percent):
+        """
+        :return: FLOAT - seconds, or None if nothing has been observed
+        """
+        with self.lock:
+            durations = sorted(self.durations)
+        if not durations:
+            return None
+        index = max(0, math.ceil(len(durations) * percent / 100) - 1)
+        return durations[index]
+
+    def sampled_percentile(self, percent):
+        """
+        :return: FLOAT - seconds as of the latest sample, or None
+        """
+        with self.lock:
+            sample = self.observations // self.sample_every
+            cached = self.samples.get(percent)
+        if sample == 0:
+            return None
+        if cached is not None and cached[0] == sample:
+            return cached[1]
+
+        value = self.percentile(percent)
+        with self.lock:
+            self.samples[percent] = (sample, value)
+        return value
+
+    def __len__(self):
+        return len(self.durations)
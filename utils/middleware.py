@@ -1,7 +1,26 @@
 import logging
+import time
+from http import HTTPStatus
 
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+from django.template.defaultfilters import filesizeformat
 from django.utils.cache import add_never_cache_headers
 
+from utils.request_cache import (
+    end_request_cache,
+    get_request_cache,
+    start_request_cache,
+)
+from utils.tracing import (
+    end_request_trace,
+    get_request_trace,
+    get_server_timing,
+    start_request_trace,
+)
+
+logger = logging.getLogger(__name__)
+
 
 class RequestLoggingMiddleware:
     """
@@ -37,3 +56,133 @@ class SetPermittedCrossDomainPolicyHeaderMiddleware:
         response = self.get_response(request)
         response.headers["X-Permitted-Cross-Domain-Policies"] = "none"
         return response
+
+
+class RequestCacheMiddleware:
+    """
+    Middleware to share metadata and current user lookups within a request.
+
+    In DEBUG the number of duplicate calls avoided is added as a header.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = start_request_cache()
+        request_cache = get_request_cache()
+        try:
+            response = self.get_response(request)
+        finally:
+            end_request_cache(token)
+
+        # Only the count is logged, the keys can be derived from credentials
+        logger.debug(
+            f"Request cache avoided {request_cache.hit_count} duplicate calls "
+            f"for '{request.path}'"
+        )
+        if settings.DEBUG:
+            response.headers["X-Request-Cache-Hits"] = str(request_cache.hit_count)
+        return response
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Rejects file uploads which are too large from their Content-Length,
+    before the body is read.
+
+    Must come before anything which reads request.POST.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if self.is_too_large(request):
+            message = (
+                "The selected file must be smaller than "
+                f"{filesizeformat(settings.FILE_MAX_SIZE)}"
+            )
+            if request.headers.get("x-requested-with") == "XMLHttpRequest":
+                return JsonResponse(
+                    {"message": message}, status=HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+                )
+            return HttpResponse(message, status=HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+
+        return self.get_response(request)
+
+    def is_too_large(self, request):
+        if not request.content_type == "multipart/form-data":
+            return False
+
+        try:
+            content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            return False
+        return content_length > settings.FILE_UPLOAD_MAX_REQUEST_SIZE
+
+
+class ServerTimingMiddleware:
+    """
+    Times the API, SSO, Data Hub and redis calls, the history diffs, the
+    lazy context values and the template render made for each request.
+
+    The totals for each kind of call are added as a Server-Timing header and
+    logged along with the slowest API call.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.monotonic()
+        token = start_request_trace()
+        request_trace = get_request_trace()
+        try:
+            response = self.get_response(request)
+        finally:
+            end_request_trace(token)
+        duration = time.monotonic() - start
+
+        response.headers["Server-Timing"] = get_server_timing(request_trace, duration)
+        response.headers["X-Response-Time-Duration-ms"] = str(int(duration * 1000))
+        self.log_request_trace(request, request_trace, duration)
+        return response
+
+    def process_template_response(self, request, response):
+        request_trace = get_request_trace()
+        start = time.monotonic()
+
+        def record_render(response):
+            request_trace.record(
+                "render", str(response.template_name), time.monotonic() - start
+            )
+
+        response.add_post_render_callback(record_render)
+        return response
+
+    def log_request_trace(self, request, request_trace, duration):
+        totals = request_trace.get_totals()
+        api_calls, api_time = totals.get("api", (0, 0.0))
+        slowest = request_trace.get_slowest("api")
+        slowest_name, slowest_time = slowest[1:] if slowest else (None, 0.0)
+        logger.info(
+            f"Request trace for '{request.method} {request.path}': "
+            f"{duration * 1000:.0f}ms, {api_calls} API calls taking "
+            f"{api_time * 1000:.0f}ms, slowest '{slowest_name}' "
+            f"{slowest_time * 1000:.0f}ms",
+            extra={
+                "path": request.path,
+                "method": request.method,
+                "duration_ms": round(duration * 1000, 1),
+                "api_calls": api_calls,
+                "api_time_ms": round(api_time * 1000, 1),
+                "slowest_api_call": slowest_name,
+                "slowest_api_call_ms": round(slowest_time * 1000, 1),
+                "timings": {
+                    kind: {"calls": count, "time_ms": round(total * 1000, 1)}
+                    for kind, (count, total) in totals.items()
+                },
+                **request_trace.fields,
+            },
+        )
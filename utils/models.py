@@ -1,9 +1,27 @@
+import functools
 from collections import UserList
+from datetime import datetime
 from typing import Dict, Tuple
 
 import dateutil.parser
 
 
+def parse_date(value):
+    """
+    Parses a date string from the API.
+
+    The API returns ISO 8601 dates which datetime can parse far faster
+    than dateutil, so dateutil is only used for anything else.
+    """
+    if isinstance(value, str):
+        iso_value = value[:-1] + "+00:00" if value.endswith("Z") else value
+        try:
+            return datetime.fromisoformat(iso_value)
+        except ValueError:
+            pass
+    return dateutil.parser.parse(value)
+
+
 class APIModel:
     data: Dict = {}
     date_fields: Tuple = tuple()
@@ -19,7 +37,7 @@ class APIModel:
                 return value
 
             if name in self.date_fields:
-                return dateutil.parser.parse(value)
+                return self.get_date(name)
 
             return value
         except Exception:
@@ -27,22 +45,65 @@ class APIModel:
             # existing methods and properties
             return super().__getattr__(name)
 
+    def get_date(self, name):
+        """
+        Returns the parsed date in the given field.
+
+        Each value is only parsed once, and parsed again if the field changes.
+        """
+        parsed = self.__dict__.setdefault("_parsed_dates", {})
+        value = self.data.get(name)
+        if name not in parsed or parsed[name][0] != value:
+            parsed[name] = (value, parse_date(value) if value else None)
+        return parsed[name][1]
+
+
+def resets_models(method):
+    """
+    Makes a mutating list method discard the models built from the old data.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._models = None
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
 
 class ModelList(UserList):
     """
     A list of objects from the API.
 
     Also stores the count from the API for use in pagination.
+    The model objects are created on first iteration and reused until the
+    list is changed, or its data replaced.
     """
 
     def __init__(self, model, data, total_count):
         self.model = model
         self.data = data
         self.total_count = total_count
+        self._models = None
+        self._models_source = None
 
     def __iter__(self):
-        for obj in self.data:
-            yield self.model(obj)
+        if self._models is None or self._models_source is not self.data:
+            self._models = [self.model(obj) for obj in self.data]
+            self._models_source = self.data
+        return iter(self._models)
+
+    __setitem__ = resets_models(UserList.__setitem__)
+    __delitem__ = resets_models(UserList.__delitem__)
+    __iadd__ = resets_models(UserList.__iadd__)
+    __imul__ = resets_models(UserList.__imul__)
+    append = resets_models(UserList.append)
+    insert = resets_models(UserList.insert)
+    pop = resets_models(UserList.pop)
+    clear = resets_models(UserList.clear)
+    reverse = resets_models(UserList.reverse)
+    sort = resets_models(UserList.sort)
+    extend = resets_models(UserList.extend)
 
     def remove(self, obj_ids):
         # Rebuild data dictionaries, excluding any if their ids are in the given list
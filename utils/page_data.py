@@ -0,0 +1,51 @@
+from functools import partial, reduce
+
+from utils.api.client import MarketAccessAPIClient
+from utils.concurrency import run_concurrently, unwrap
+
+
+class APICall:
+    """
+    A call to make on MarketAccessAPIClient, e.g. APICall("mentions.list")
+
+    :param path: dotted path of the method on the client
+    """
+
+    def __init__(self, path, *args, **kwargs):
+        self.path = path
+        self.args = args
+        self.kwargs = kwargs
+
+    @property
+    def key(self):
+        return (self.path, repr(self.args), repr(sorted(self.kwargs.items())))
+
+    def bind(self, client):
+        method = reduce(getattr, self.path.split("."), client)
+        return partial(method, *self.args, **self.kwargs)
+
+
+class PageDataMixin:
+    """
+    Loads the API data a page needs concurrently.
+
+    Views list named APICalls in page_data, or build them in get_page_data
+    when they depend on the request. Identical calls are only made once.
+    """
+
+    page_data = {}
+
+    def get_page_data(self, **kwargs):
+        return dict(self.page_data)
+
+    def load_page_data(self, **kwargs):
+        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        calls = self.get_page_data(**kwargs)
+
+        tasks = {}
+        for call in calls.values():
+            if call.key not in tasks:
+                tasks[call.key] = call.bind(client)
+
+        results = run_concurrently(tasks)
+        return {name: unwrap(results[call.key]) for name, call in calls.items()}
@@ -23,6 +23,11 @@ class PaginationMixin:
         params.update(kwargs)
         return params.urlencode()
 
+    def get_page_url(self, base_querystring, page):
+        if base_querystring:
+            return f"{base_querystring}&page={page}"
+        return f"page={page}"
+
     def get_pagination_data(self, object_list):
         limit = self.get_pagination_limit()
         total_count = object_list.total_count
@@ -34,27 +39,38 @@ class PaginationMixin:
         end_position = (
             full_page_end + total_count - abs(total_count - full_page_end)
         ) // 2
+
+        # Only the links which are shown get a url, all sharing one querystring
+        base_querystring = self.update_querystring()
         pagination_data = {
             "total_pages": total_pages,
             "current_page": current_page,
             "pages": [
-                {
-                    "label": i,
-                    "url": self.update_querystring(page=i),
-                }
-                for i in range(1, total_pages + 1)
+                (
+                    {"label": page}
+                    if page == "..."
+                    else {
+                        "label": page,
+                        "url": self.get_page_url(base_querystring, page),
+                    }
+                )
+                for page in self.get_page_window(current_page, total_pages)
             ],
             "total_items": total_count,
             "start_position": start_position,
             "end_position": end_position,
         }
         if current_page > 1:
-            pagination_data["previous"] = self.update_querystring(page=current_page - 1)
+            pagination_data["previous"] = self.get_page_url(
+                base_querystring, current_page - 1
+            )
 
         if current_page != total_pages:
-            pagination_data["next"] = self.update_querystring(page=current_page + 1)
+            pagination_data["next"] = self.get_page_url(
+                base_querystring, current_page + 1
+            )
 
-        return self.truncate_pagination_data(pagination_data)
+        return pagination_data
 
     def get_pagination_limit(self):
         return self.pagination_limit
@@ -62,55 +78,50 @@ class PaginationMixin:
     def get_pagination_offset(self):
         return self.get_pagination_limit() * (self.get_current_page() - 1)
 
-    def truncate_pagination_data(self, pagination_data, block_size=4):
+    def get_page_window(self, current_page, total_pages, block_size=4):
         """
-        Truncate the pagination links.
+        The page numbers to link to, with "..." for any gaps.
 
         We don't want to show a link for every page if there are hundreds of
-        pages. This trims out page links we're probably not interested in.
+        pages. This shows a block around the current page plus the first and
+        last pages, without building the ones in between.
 
         This is a direct port from the node project.
         """
-        pages = pagination_data["pages"]
-
-        if len(pages) <= block_size:
-            return pagination_data
-
-        current_page_num = pagination_data["current_page"]
-        current_page_index = pagination_data["current_page"] - 1
-        first_page = pages[0]
-        last_page = pages[-1]
+        page_range = range(1, total_pages + 1)
+        if len(page_range) <= block_size:
+            return list(page_range)
 
+        last_page = page_range[-1]
         block_pivot = int(block_size / 2)
-        start_of_current_block = abs(current_page_num - block_pivot)
-        start_of_last_block = last_page["label"] - block_size
+        start_of_current_block = abs(current_page - block_pivot)
+        start_of_last_block = last_page - block_size
         block_start_index = min(
             start_of_current_block,
             start_of_last_block,
-            current_page_index,
+            current_page - 1,
         )
 
-        truncated_pages = pages[block_start_index:][:block_size]
-        first_of_truncated_pages_num = truncated_pages[0]["label"]
-        last_of_truncated_pages_num = truncated_pages[-1]["label"]
+        first_of_block = block_start_index + 1
+        last_of_block = min(block_start_index + block_size, last_page)
+        pages = list(range(first_of_block, last_of_block + 1))
 
-        if first_of_truncated_pages_num > 3:
-            truncated_pages = [{"label": "..."}] + truncated_pages
+        if first_of_block > 3:
+            pages = ["..."] + pages
 
-        if first_of_truncated_pages_num == 3:
-            truncated_pages = [pages[1]] + truncated_pages
+        if first_of_block == 3:
+            pages = [2] + pages
 
-        if first_of_truncated_pages_num > 1:
-            truncated_pages = [first_page] + truncated_pages
+        if first_of_block > 1:
+            pages = [1] + pages
 
-        if last_of_truncated_pages_num < last_page["label"] - 2:
-            truncated_pages.append({"label": "..."})
+        if last_of_block < last_page - 2:
+            pages.append("...")
 
-        if last_of_truncated_pages_num == last_page["label"] - 2:
-            truncated_pages.append(pages[-2])
+        if last_of_block == last_page - 2:
+            pages.append(last_page - 1)
 
-        if last_of_truncated_pages_num < last_page["label"]:
-            truncated_pages.append(last_page)
+        if last_of_block < last_page:
+            pages.append(last_page)
 
-        pagination_data["pages"] = truncated_pages
-        return pagination_data
+        return pages
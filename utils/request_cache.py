@@ -0,0 +1,70 @@
+import contextvars
+import threading
+from collections import Counter
+
+_request_cache = contextvars.ContextVar("request_cache", default=None)
+
+
+class RequestCache:
+    """
+    Values computed once per request and shared by every caller.
+
+    Keeps a count of the duplicate calls that were avoided per key.
+    """
+
+    def __init__(self):
+        self.values = {}
+        self.hits = Counter()
+        self.lock = threading.Lock()
+
+    def get_or_set(self, key, func):
+        with self.lock:
+            if key in self.values:
+                self.hits[key] += 1
+                return self.values[key]
+
+        value = func()
+        with self.lock:
+            return self.values.setdefault(key, value)
+
+    def delete(self, key):
+        with self.lock:
+            self.values.pop(key, None)
+
+    @property
+    def hit_count(self):
+        return sum(self.hits.values())
+
+
+def get_request_cache():
+    return _request_cache.get()
+
+
+def start_request_cache():
+    """
+    Activates a new cache for the current context.
+
+    :return: token to pass to end_request_cache
+    """
+    return _request_cache.set(RequestCache())
+
+
+def end_request_cache(token):
+    _request_cache.reset(token)
+
+
+def request_memo(key, func):
+    """
+    Returns func() computing it at most once per request.
+    Outside of a request func is simply called.
+    """
+    cache = get_request_cache()
+    if cache is None:
+        return func()
+    return cache.get_or_set(key, func)
+
+
+def forget(key):
+    cache = get_request_cache()
+    if cache is not None:
+        cache.delete(key)
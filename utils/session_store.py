@@ -0,0 +1,140 @@
+import hashlib
+import logging
+import zlib
+
+from django.conf import settings
+from django.contrib.sessions.backends.base import CreateError
+from django.contrib.sessions.backends.cache import SessionStore as CacheSessionStore
+from django.contrib.sessions.backends.cached_db import KEY_PREFIX
+from django.contrib.sessions.backends.db import SessionStore as DBSessionStore
+
+logger = logging.getLogger(__name__)
+
+COMPRESSED = b"z"
+UNCOMPRESSED = b"j"
+
+
+class SessionStore(CacheSessionStore):
+    """
+    Sessions stored in redis only.
+
+    A session is only written when its serialised data has changed since it
+    was loaded, and large sessions are compressed. With SESSION_DB_FALLBACK,
+    sessions missing from the cache are read from the database and sessions
+    are written to the database while the cache is unavailable.
+    """
+
+    # Shared with cached_db so existing sessions survive the switch
+    cache_key_prefix = KEY_PREFIX
+
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        self._saved_hash = None
+
+    def serialize(self, session_dict):
+        data = self.serializer().dumps(session_dict)
+        if len(data) >= settings.SESSION_COMPRESS_MIN_SIZE:
+            return COMPRESSED + zlib.compress(data)
+        return UNCOMPRESSED + data
+
+    def deserialize(self, data):
+        if isinstance(data, dict):
+            # Written by cached_db
+            return data
+        if data[:1] == COMPRESSED:
+            return self.serializer().loads(zlib.decompress(data[1:]))
+        return self.serializer().loads(data[1:])
+
+    def get_db_store(self):
+        return DBSessionStore(self.session_key)
+
+    def load(self):
+        try:
+            data = self._cache.get(self.cache_key)
+        except Exception:
+            logger.warning("Could not read the session from the cache", exc_info=True)
+            data = None
+
+        if data is not None:
+            # Sessions written by cached_db are dicts, rewrite them in this format
+            if isinstance(data, bytes):
+                self._saved_hash = hashlib.sha256(data).digest()
+            else:
+                self._saved_hash = None
+            return self.deserialize(data)
+
+        if settings.SESSION_DB_FALLBACK:
+            db_store = self.get_db_store()
+            session_dict = db_store.load()
+            if db_store.session_key:
+                return session_dict
+
+        self._session_key = None
+        return {}
+
+    def save(self, must_create=False):
+        if self.session_key is None:
+            return self.create()
+
+        session_dict = self._get_session(no_load=must_create)
+        data = self.serialize(session_dict)
+        data_hash = hashlib.sha256(data).digest()
+        if not must_create and data_hash == self._saved_hash:
+            # Values were set without changing anything, so only keep the
+            # session alive as a write would have
+            self.touch()
+            return
+
+        func = self._cache.add if must_create else self._cache.set
+        try:
+            result = func(self.cache_key, data, self.get_expiry_age())
+        except Exception:
+            if not settings.SESSION_DB_FALLBACK:
+                raise
+            logger.warning("Could not save the session to the cache", exc_info=True)
+            db_store = self.get_db_store()
+            db_store._session_cache = session_dict
+            db_store.save(
+                must_create=must_create or not db_store.exists(self.session_key)
+            )
+            return
+
+        if must_create and not result:
+            raise CreateError
+        self._saved_hash = data_hash
+
+    def touch(self):
+        try:
+            self._cache.touch(self.cache_key, self.get_expiry_age())
+        except Exception:
+            logger.warning("Could not refresh the session expiry", exc_info=True)
+
+    def exists(self, session_key):
+        try:
+            if super().exists(session_key):
+                return True
+        except Exception:
+            if not settings.SESSION_DB_FALLBACK:
+                raise
+        return settings.SESSION_DB_FALLBACK and DBSessionStore().exists(session_key)
+
+    def delete(self, session_key=None):
+        if session_key is None:
+            if self.session_key is None:
+                return
+            session_key = self.session_key
+            self._saved_hash = None
+
+        try:
+            super().delete(session_key)
+        except Exception:
+            if not settings.SESSION_DB_FALLBACK:
+                raise
+            logger.warning("Could not delete the session from the cache", exc_info=True)
+        if settings.SESSION_DB_FALLBACK:
+            DBSessionStore().delete(session_key)
+
+    @classmethod
+    def clear_expired(cls):
+        if settings.SESSION_DB_FALLBACK:
+            DBSessionStore.clear_expired()
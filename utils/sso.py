@@ -1,11 +1,41 @@
+import hashlib
 from http import HTTPStatus
 from urllib.parse import quote_plus
 
 import requests
 from django.conf import settings
+from django.core.cache import cache
 
 from users.exceptions import SSOException
+from utils.api.transport import get_session
+from utils.concurrency import coalesce
 from utils.exceptions import APIHttpException
+from utils.tracing import trace
+
+
+def normalise_user_query(query):
+    return " ".join(query.lower().split())
+
+
+def get_user_search_cache_key(query):
+    query_hash = hashlib.sha256(query.encode()).hexdigest()
+    return f"sso_user_search:{query_hash}"
+
+
+def user_matches(user, terms):
+    """
+    Whether each term is part of one of the user's fields.
+
+    This approximates SSO's autocomplete rather than reproducing it. Every
+    returned field is searched so users SSO matched on any of them are kept,
+    but a user SSO matched on a field it doesn't return, or would not match
+    with its own tokenising, can differ from a fresh search. Set
+    SSO_USER_SEARCH_NARROWING to False to always ask SSO instead.
+    """
+    text = " ".join(
+        str(value) for value in user.values() if isinstance(value, str)
+    ).lower()
+    return all(term in text for term in terms)
 
 
 class SSOClient:
@@ -31,7 +61,8 @@ class SSOClient:
     def get(self, path, **kwargs):
         url = f"{self.uri}{path}"
         headers = self.prepare_headers()
-        response = requests.get(url=url, params=kwargs, headers=headers)
+        with trace("sso", f"GET {path}"):
+            response = get_session().get(url=url, params=kwargs, headers=headers)
 
         try:
             response.raise_for_status()
@@ -41,11 +72,58 @@ class SSOClient:
         return response.json()
 
     def search_users(self, query):
+        """
+        Searches users, caching the results briefly.
+
+        A query which extends a cached query is answered by filtering the
+        cached users, as long as that result was not cut short. See
+        user_matches for how that filtering can differ from SSO.
+        """
+        query = normalise_user_query(query)
+        if not query:
+            return []
+
+        # The query and then each shorter query it extends, longest first
+        keys = [
+            get_user_search_cache_key(prefix)
+            for prefix in dict.fromkeys(
+                query[:length].rstrip() for length in range(len(query), 0, -1)
+            )
+        ]
+        cached = cache.get_many(keys)
+
+        key = keys[0]
+        if key in cached:
+            return cached[key]["users"]
+
+        if not settings.SSO_USER_SEARCH_NARROWING:
+            keys = keys[:1]
+
+        for broader_key in keys[1:]:
+            broader = cached.get(broader_key)
+            if broader and broader["complete"]:
+                terms = query.split()
+                users = [user for user in broader["users"] if user_matches(user, terms)]
+                self.cache_user_search(query, users, complete=True)
+                return users
+
+        return coalesce(key, lambda: self.fetch_user_search(query))
+
+    def fetch_user_search(self, query):
         path = f"user/search/?autocomplete={quote_plus(query)}"
         response = self.get(path)
         users = response.get("results", [])
+        # Only a result with every match can be filtered for longer queries
+        self.cache_user_search(query, users, complete=not response.get("next"))
         return users
 
+    def cache_user_search(self, query, users, complete):
+        cache.set(
+            get_user_search_cache_key(query),
+            {"users": users, "complete": complete},
+            settings.SSO_USER_SEARCH_CACHE_TIME,
+        )
+
     def get_user_by_email(self, email_address):
         path = f"user/introspect/?email={quote_plus(email_address)}"
         try:
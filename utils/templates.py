@@ -0,0 +1,71 @@
+import threading
+
+from django.conf import settings
+from django.template import Context, TemplateDoesNotExist
+from django.template.loader import get_template
+
+
+class PartialTemplates:
+    """
+    Per-process lookup of the partial template for each (model, field).
+
+    Templates are compiled on first use and reused, including the
+    fallback for fields without a partial of their own.
+    Nothing is stored in DEBUG so edited templates are picked up.
+
+    :param directory: STR - path containing a folder of partials per model
+    :param default: STR - template to use when a field has no partial
+    """
+
+    def __init__(self, directory, default=None):
+        self.directory = directory
+        self.default = default
+        self.templates = {}
+        self.lock = threading.Lock()
+
+    def get(self, model, field):
+        """
+        :return: compiled Template or None if there is no partial or default
+        """
+        key = (model, field)
+        if key in self.templates:
+            return self.templates[key]
+
+        item_template = self.load(f"{self.directory}/{model}/{field}.html")
+        if item_template is None and self.default:
+            item_template = self.load(self.default)
+
+        if not settings.DEBUG:
+            with self.lock:
+                self.templates[key] = item_template
+        return item_template
+
+    def load(self, template_name):
+        try:
+            return get_template(template_name).template
+        except TemplateDoesNotExist:
+            return None
+
+    def clear(self):
+        with self.lock:
+            self.templates = {}
+
+    def render(self, item):
+        """
+        Renders the partial for the item with only the item in the context.
+        """
+        item_template = self.get(item.model, item.field)
+        if item_template is None:
+            return ""
+        context = Context({"item": item}, autoescape=item_template.engine.autoescape)
+        return item_template.render(context)
+
+    def render_in_context(self, context, item):
+        """
+        Renders the partial for the item within the calling template's context.
+        """
+        item_template = self.get(item.model, item.field)
+        if item_template is None:
+            return ""
+        with context.push(item=item):
+            return item_template.render(context)
@@ -0,0 +1,107 @@
+import contextvars
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+_request_trace = contextvars.ContextVar("request_trace", default=None)
+
+
+class RequestTrace:
+    """
+    Durations of the outgoing calls and template renders made for a request.
+    """
+
+    def __init__(self):
+        self.calls = []
+        self.fields = {}
+        self.lock = threading.Lock()
+
+    def record(self, kind, name, seconds):
+        with self.lock:
+            self.calls.append((kind, name, seconds))
+
+    def get_totals(self):
+        """
+        :return: DICT - kind -> (call count, total seconds)
+        """
+        totals = defaultdict(lambda: (0, 0.0))
+        with self.lock:
+            calls = list(self.calls)
+        for kind, _name, seconds in calls:
+            count, total = totals[kind]
+            totals[kind] = (count + 1, total + seconds)
+        return dict(totals)
+
+    def get_slowest(self, kind=None):
+        """
+        :return: TUPLE - (kind, name, seconds) of the slowest call, or None
+        """
+        with self.lock:
+            calls = [call for call in self.calls if kind is None or call[0] == kind]
+        return max(calls, key=lambda call: call[2], default=None)
+
+
+def get_request_trace():
+    return _request_trace.get()
+
+
+def set_trace_field(name, value):
+    """
+    Adds a value to the log line of the current request, if any.
+    """
+    request_trace = get_request_trace()
+    if request_trace is not None:
+        request_trace.fields[name] = value
+
+
+def count_trace_field(name):
+    """
+    Adds one to a count on the log line of the current request, if any.
+    """
+    request_trace = get_request_trace()
+    if request_trace is not None:
+        with request_trace.lock:
+            request_trace.fields[name] = request_trace.fields.get(name, 0) + 1
+
+
+def start_request_trace():
+    """
+    Starts recording calls for the current context.
+
+    :return: token to pass to end_request_trace
+    """
+    return _request_trace.set(RequestTrace())
+
+
+def end_request_trace(token):
+    _request_trace.reset(token)
+
+
+@contextmanager
+def trace(kind, name):
+    """
+    Records how long the block took against the current request, if any.
+    """
+    request_trace = get_request_trace()
+    if request_trace is None:
+        yield
+        return
+
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        request_trace.record(kind, name, time.monotonic() - start)
+
+
+def get_server_timing(request_trace, total_seconds):
+    """
+    Server-Timing header value with the total time spent on each kind of call.
+    """
+    metrics = [
+        f'{kind};dur={total * 1000:.1f};desc="{count} calls"'
+        for kind, (count, total) in sorted(request_trace.get_totals().items())
+    ]
+    metrics.append(f"total;dur={total_seconds * 1000:.1f}")
+    return ", ".join(metrics)
@@ -77,6 +77,8 @@ const mainConfig = {
                         `${assetsSrcPath}/js/components/Collapsible.js`,
                         `${assetsSrcPath}/js/components/TextArea.js`,
                         `${assetsSrcPath}/js/components/Toast.js`,
+                        `${assetsSrcPath}/js/components/MentionCountBadge.js`,
+                        `${assetsSrcPath}/js/components/HistoryLoadMore.js`,
                         `${assetsSrcPath}/js/components/CharacterCount.js`,
                         `${assetsSrcPath}/js/components/Attachments.js`,
                         `${assetsSrcPath}/js/components/Modal.js`,